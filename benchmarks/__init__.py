@@ -0,0 +1,7 @@
+"""
+Esse pacote contém scripts de benchmark das
+estruturas e operações críticas da aplicação.
+
+Execute cada um a partir da raiz do projeto, ex.:
+`python -m benchmarks.bench_playlist_membership`
+"""
@@ -0,0 +1,99 @@
+"""
+Esse módulo mede quantos eventos por segundo o laço de
+eventos do mpv despacha (`MPV._dispatch`) com 1, 10 e 100
+callbacks registrados para outros tipos de evento (como os
+de `prepare_and_wait_for_event`), num fluxo de mudanças de
+`time-pos` com um observador.
+
+Compara com o despacho anterior, reproduzido aqui: todos
+os callbacks filtrando cada evento e o `defaultdict` das
+propriedades. Precisa do libmpv (só para criar o MPV, sem
+a thread de eventos).
+"""
+import collections
+import sys
+from ctypes import addressof, pointer
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, Callable, List
+from src.mpv import mpv
+
+SIZES = (1, 10, 100)  # Callbacks registrados
+EVENTS = 200_000
+_WAITED = ("end-file", "file-loaded", "seek", "playback-restart", "shutdown")
+
+
+def _event() -> Any:
+    """Uma mudança de `time-pos` (um nó com um double), com os campos que o despacho lê."""
+    node = mpv.MpvNode()
+    node.format = mpv.MpvFormat.DOUBLE
+    node.val.double = 1.5
+    prop = mpv.MpvEventProperty()
+    prop._name = b"time-pos"  # pylint: disable=protected-access
+    prop.format = mpv.MpvFormat.NODE
+    prop.data.node = pointer(node)
+    return SimpleNamespace(
+        event_id=SimpleNamespace(value=mpv.MpvEventID.PROPERTY_CHANGE),
+        reply_userdata=mpv._property_observe_id("time-pos", mpv.MpvFormat.NODE),  # pylint: disable=protected-access
+        _data=addressof(prop), data=prop, node=node
+    )
+
+
+def _legacy(player: mpv.MPV, count: int, observer: Callable) -> Callable[[Any], None]:
+    """O despacho anterior: cada wrapper filtra o tipo, propriedades num defaultdict."""
+    guard = player._enqueue_exceptions  # pylint: disable=protected-access
+    callbacks: List[Callable] = []
+    for index in range(count):
+        types = [mpv.MpvEventID.from_str(_WAITED[index % len(_WAITED)])]
+
+        def wrapper(event, types=types):
+            if event.event_id.value in types:
+                pass
+        callbacks.append(wrapper)
+    properties = collections.defaultdict(list)
+    properties["time-pos"].append(observer)
+
+    def dispatch(event) -> None:
+        for callback in callbacks:
+            with guard():
+                callback(event)
+        if event.event_id.value == mpv.MpvEventID.PROPERTY_CHANGE:
+            pc = event.data
+            for handler in properties[pc.name]:
+                with guard():
+                    handler(pc.name, pc.value)
+    return dispatch
+
+
+def _rate(dispatch: Callable[[Any], Any]) -> float:
+    event = _event()
+    start = perf_counter()
+    for _ in range(EVENTS):
+        dispatch(event)
+    return EVENTS / (perf_counter() - start)
+
+
+def bench(size: int) -> None:
+    """Mede o despacho com `size` callbacks registrados."""
+    ticks = []
+    observer = lambda _name, value: ticks.append(value)  # noqa: E731
+    player = mpv.MPV(start_event_thread=False)
+    for index in range(size):
+        player.event_callback(_WAITED[index % len(_WAITED)])(lambda _event: None)
+    player.observe_property("time-pos", observer)
+    legacy = _rate(_legacy(player, size, observer))
+    tables = _rate(player._dispatch)  # pylint: disable=protected-access
+    player.terminate()
+    assert len(ticks) == 2 * EVENTS
+    print(f"{size:>4} callbacks | antes: {legacy:12,.0f} eventos/s | por tipo: {tables:12,.0f} eventos/s")
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
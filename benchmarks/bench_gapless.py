@@ -0,0 +1,93 @@
+"""
+Esse módulo mede a pausa entre trilhas (em ms) com
+e sem a reprodução sem pausas (GaplessQueue).
+
+Gera trilhas curtas em WAV e toca todas com a saída
+de áudio nula do mpv, que consome o áudio em tempo
+real: a pausa média é o tempo total menos a soma das
+durações, dividido pelo número de trocas. Precisa do libmpv.
+"""
+import math
+import struct
+import sys
+import tempfile
+import wave
+from pathlib import Path
+from threading import Event
+from time import perf_counter
+from typing import List
+from src.mpv import mpv
+from src.core.gapless import GaplessQueue
+from src.core.playlist import Track, Playlist
+
+SIZES = (5, 10)  # Trilhas tocadas em sequência
+DURATION = 1.0  # Segundos de cada trilha
+RATE = 44_100
+
+
+def _write_tone(path: Path, frequency: float) -> None:
+    """Grava um tom puro de `DURATION` segundos em WAV."""
+    frames = b"".join(
+        struct.pack("<h", int(12_000 * math.sin(2 * math.pi * frequency * index / RATE)))
+        for index in range(int(DURATION * RATE))
+    )
+    with wave.open(str(path), "wb") as file:
+        file.setnchannels(1)
+        file.setsampwidth(2)
+        file.setframerate(RATE)
+        file.writeframes(frames)
+
+
+def _measure(paths: List[Path], gapless: bool) -> float:
+    """Toca as trilhas em sequência e retorna a pausa média entre elas, em ms."""
+    player = mpv.MPV(ao="null", video="no")
+    playlist = Playlist()
+    playlist.add_many(Track(path) for path in paths)
+    started: List[float] = []
+    finished: List[float] = []
+    done = Event()
+
+    @player.event_callback("playback-restart")
+    def _on_start(_event) -> None:
+        started.append(perf_counter())
+
+    @player.event_callback("end-file")
+    def _on_end(_event) -> None:
+        finished.append(perf_counter())
+        if len(finished) >= len(paths):
+            done.set()
+        elif not gapless:  # O caminho sem o modo: Playlist.next() -> loadfile replace
+            track = playlist.next(force_next=True)
+            player.command_async("loadfile", str(track.path), "replace")
+
+    if gapless:
+        GaplessQueue(player, playlist).play()
+    else:
+        player.command_async("loadfile", str(playlist.get_current_track().path), "replace")
+    done.wait()
+    player.terminate()
+    total = finished[len(paths) - 1] - started[0]
+    return (total - DURATION * len(paths)) / (len(paths) - 1) * 1e3
+
+
+def bench(size: int) -> None:
+    """Mede a pausa média com `size` trilhas, com e sem o modo sem pausas."""
+    with tempfile.TemporaryDirectory() as folder:
+        paths = []
+        for index in range(size):
+            paths.append(Path(folder) / f"{index:02}.wav")
+            _write_tone(paths[-1], 220.0 * (1 + index % 4))
+        plain = _measure(paths, gapless=False)
+        gapless = _measure(paths, gapless=True)
+        print(f"{size:>3} trilhas | pausa sem o modo: {plain:7.1f}ms | com o modo: {gapless:7.1f}ms")
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Esse módulo mede a vazão (arquivos/s) da varredura de
+pastas do LibraryScanner numa árvore sintética, com uma
+e com várias threads, comparada a um `os.walk` simples.
+
+A árvore fica no cache do sistema depois da criação,
+então os números medem o custo de CPU da varredura; num
+disco lento (ou de rede), a vantagem das várias threads
+é maior, já que as leituras ficam em andamento ao mesmo tempo.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from src.core.config import SCANNER_WORKERS
+from src.core.library_scanner import LibraryScanner
+from src.core.playlist import Track, Playlist
+from src.utils.paths_utils import has_audio_extension
+
+SIZES = (10**4, 10**5)
+FILES_PER_FOLDER = 12
+
+
+def _tree(root: Path, size: int) -> None:
+    """Cria `size` arquivos de áudio (mais uma capa por álbum) em artista/álbum/faixa."""
+    for album in range(size // FILES_PER_FOLDER):
+        folder = root / f"Artista {album // 10}" / f"Álbum {album}"
+        folder.mkdir(parents=True)
+        (folder / "cover.jpg").touch()
+        for index in range(FILES_PER_FOLDER):
+            (folder / f"{index:02} - Faixa {index}.flac").touch()
+
+
+def _walk(root: Path) -> int:
+    """A varredura de referência: `os.walk` numa thread, adicionando tudo no fim."""
+    playlist = Playlist()
+    playlist.add_many(
+        Track(Path(folder, name))
+        for folder, _, names in os.walk(root)
+        for name in names
+        if has_audio_extension(name)
+    )
+    return len(playlist)
+
+
+def _scan(root: Path, workers: int) -> int:
+    scanner = LibraryScanner(root, workers=workers).start()
+    scanner.wait()
+    return len(scanner.playlist)
+
+
+def _rate(function, *args) -> str:
+    start = perf_counter()
+    found = function(*args)
+    elapsed = perf_counter() - start
+    return f"{found / elapsed:10,.0f} arquivos/s"
+
+
+def bench(size: int) -> None:
+    """Cria uma árvore com `size` arquivos e mede as varreduras."""
+    with tempfile.TemporaryDirectory() as folder:
+        root = Path(folder)
+        _tree(root, size)
+        print(
+            f"{size:>8} arquivos | os.walk: {_rate(_walk, root)}"
+            f" | 1 thread: {_rate(_scan, root, 1)}"
+            f" | {SCANNER_WORKERS} threads: {_rate(_scan, root, SCANNER_WORKERS)}"
+        )
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
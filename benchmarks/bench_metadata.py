@@ -0,0 +1,65 @@
+"""
+Esse módulo mede a vazão (arquivos/s) da leitura dos
+metadados pelos cabeçalhos (audio_metadata), numa
+pasta com arquivos sintéticos dos quatro formatos,
+lendo aqui mesmo e num pool de processos.
+"""
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+from src.core.audio_metadata import read_many
+from tests import audio_samples
+
+SIZES = (10**4, 10**5)
+
+_SAMPLES = (
+    ("mp3", audio_samples.mp3("Faixa", frames=8)),
+    ("flac", audio_samples.flac("Faixa", 44100, 44100 * 240, picture=64 * 1024)),
+    ("ogg", audio_samples.ogg("Faixa", opus=False, seconds=240)),
+    ("opus", audio_samples.ogg("Faixa", opus=True, seconds=240)),
+    ("m4a", audio_samples.mp4("Faixa", 44100, 44100 * 240, audio=64 * 1024))
+)
+
+
+def _files(root: Path, size: int) -> list:
+    paths = []
+    for index in range(size):
+        extension, data = _SAMPLES[index % len(_SAMPLES)]
+        folder = root / f"{index // 100}"
+        if index % 100 == 0:
+            folder.mkdir()
+        paths.append(folder / f"{index}.{extension}")
+        paths[-1].write_bytes(data)
+    return paths
+
+
+def _rate(paths, executor=None) -> str:
+    start = perf_counter()
+    found = sum(metadata["duration"] is not None for metadata in read_many(paths, executor))
+    elapsed = perf_counter() - start
+    assert found == len(paths)
+    return f"{len(paths) / elapsed:10,.0f} arquivos/s"
+
+
+def bench(size: int) -> None:
+    """Cria `size` arquivos e mede a leitura dos metadados."""
+    with tempfile.TemporaryDirectory() as folder:
+        paths = _files(Path(folder), size)
+        inline = _rate(paths)
+        with ProcessPoolExecutor() as pool:
+            pooled = _rate(paths, pool)
+        print(f"{size:>8} arquivos | sem pool: {inline} | {os.cpu_count()} processos: {pooled}")
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Esse módulo compara a leitura de um arquivo local pelo
+leitor nativo do mpv com a leitura pelo protocolo
+`mmap://` (MmapStream): tempo, CPU do processo, chamadas
+de sistema de leitura e faltas de página.
+
+O mpv decodifica um WAV grande com a saída de áudio
+nula e sem esperar o tempo real (`ao-null-untimed`).
+As chamadas de leitura vêm de `/proc/self/io` (`syscr`,
+só no Linux). Precisa do libmpv.
+"""
+import resource
+import sys
+import tempfile
+import wave
+from pathlib import Path
+from time import perf_counter, process_time
+from typing import Dict
+from src.mpv import mpv
+from src.core.mmap_stream import mmap_uri, register_mmap_protocol
+
+SIZES = (50, 200)  # MB de áudio
+RATE = 48_000
+
+
+def _write_wav(path: Path, size: int) -> None:
+    frames = bytes(range(256)) * (RATE * 4 // 256)  # 1 segundo, estéreo, 16 bits
+    with wave.open(str(path), "wb") as file:
+        file.setnchannels(2)
+        file.setsampwidth(2)
+        file.setframerate(RATE)
+        for _ in range(size * 1_000_000 // len(frames)):
+            file.writeframes(frames)
+
+
+def _read_syscalls() -> int:
+    try:
+        with open("/proc/self/io", encoding="utf-8") as file:
+            return int(next(line for line in file if line.startswith("syscr")).split()[1])
+    except OSError:
+        return -1
+
+
+def _measure(uri: str) -> Dict[str, float]:
+    player = mpv.MPV(ao="null", video="no", ao_null_untimed="yes")
+    register_mmap_protocol(player)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    syscalls = _read_syscalls()
+    start, cpu = perf_counter(), process_time()
+    player.play(uri)
+    player.wait_for_playback()
+    elapsed, cpu = perf_counter() - start, process_time() - cpu
+    syscalls = _read_syscalls() - syscalls
+    after = resource.getrusage(resource.RUSAGE_SELF)
+    player.terminate()
+    return {
+        "tempo": elapsed, "cpu": cpu, "leituras": syscalls,
+        "faltas": after.ru_minflt + after.ru_majflt - usage.ru_minflt - usage.ru_majflt
+    }
+
+
+def bench(size: int) -> None:
+    """Cria um WAV de `size` MB e o decodifica pelos dois caminhos."""
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / "a.wav"
+        _write_wav(path, size)
+        _measure(str(path))  # Deixa o arquivo no cache de páginas para os dois
+        for name, uri in (("nativo", str(path)), ("mmap://", mmap_uri(path))):
+            result = _measure(uri)
+            print(f"{size:>4} MB | {name:<8} | tempo: {result['tempo']:6.2f}s | "
+                  f"CPU: {result['cpu']:6.2f}s | leituras: {result['leituras']:>7.0f} | "
+                  f"faltas de página: {result['faltas']:>7.0f}")
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
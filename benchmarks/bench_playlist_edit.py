@@ -0,0 +1,51 @@
+"""
+Esse módulo mede a latência por operação das edições
+posicionais da Playlist (insert, pop, move e index)
+em playlists grandes.
+"""
+import sys
+from random import Random
+from time import perf_counter
+from src.core.playlist import Track, Playlist
+
+SIZES = (10**4, 10**5, 10**6)
+OPERATIONS = 2000
+
+
+def bench(size: int) -> None:
+    """Mede a média e o pior caso de cada edição numa playlist com `size` trilhas."""
+    random = Random(size)
+    playlist = Playlist()
+    for i in range(size):
+        playlist.add(Track(f"/music/track_{i}.flac"))
+    extra = [Track(f"/music/extra_{i}.flac") for i in range(OPERATIONS)]
+
+    operations = {
+        "insert": lambda i: playlist.insert(random.randrange(len(playlist)), extra[i]),
+        "move": lambda i: playlist.move(
+            random.randrange(len(playlist)), random.randrange(len(playlist))),
+        "index": lambda i: playlist.index(extra[i]),
+        "pop": lambda i: playlist.pop(random.randrange(len(playlist))),
+    }
+    results = []
+    for name, operation in operations.items():
+        worst = 0.0
+        start = perf_counter()
+        for i in range(OPERATIONS):
+            op_start = perf_counter()
+            operation(i)
+            worst = max(worst, perf_counter() - op_start)
+        mean = (perf_counter() - start) / OPERATIONS
+        results.append(f"{name}: {mean * 1e6:7.1f}µs (pior {worst * 1e3:.2f}ms)")
+    print(f"{size:>8} trilhas | " + " | ".join(results))
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Esse módulo mede a vazão de `Playlist.add`, `Playlist.remove`
+e `Playlist.add_many` para playlists de 10^3 a 10^6 trilhas.
+"""
+import sys
+from random import Random
+from time import perf_counter
+from src.core.playlist import Track, Playlist
+
+SIZES = (10**3, 10**4, 10**5, 10**6)
+REMOVALS = 1000
+
+
+def bench(size: int) -> None:
+    """Mede add de `size` trilhas e a remoção de `REMOVALS` trilhas aleatórias."""
+    tracks = [Track(f"/music/artist_{i % 97}/track_{i}.flac") for i in range(size)]
+    playlist = Playlist()
+
+    start = perf_counter()
+    for track in tracks:
+        playlist.add(track)
+    add_elapsed = perf_counter() - start
+
+    removals = Random(size).sample(tracks, min(REMOVALS, size))
+    start = perf_counter()
+    for track in removals:
+        playlist.remove(track)
+    remove_elapsed = perf_counter() - start
+
+    start = perf_counter()
+    Playlist().add_many(iter(tracks))
+    add_many_elapsed = perf_counter() - start
+
+    print(
+        f"{size:>9} trilhas | add: {size / add_elapsed:>12,.0f} ops/s"
+        f" | remove: {len(removals) / remove_elapsed:>12,.0f} ops/s"
+        f" | add_many: {size / add_many_elapsed:>12,.0f} trilhas/s"
+    )
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Esse módulo compara o tempo de inicialização de uma
+Playlist carregada do snapshot em JSON, do JSON em
+segundo plano (PlaylistLoader) e do snapshot binário
+mapeado em memória.
+"""
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from src.core.playlist import Track, Playlist
+from src.core.playlist_loader import PlaylistLoader
+from src.core.playlist_snapshot import import_json, load_binary, write_binary, write_json
+
+SIZES = (10**4, 10**5, 10**6)
+
+
+def _playlist(size: int) -> Playlist:
+    playlist = Playlist()
+    playlist.add_many(
+        Track(
+            Path(f"/home/user/Música/Artista {i // 200}/Álbum {i // 12}/{i % 12:02} - Faixa {i}.flac"),
+            title=f"Faixa {i}",
+            duration=180.0
+        )
+        for i in range(size)
+    )
+    playlist.current_index = size // 2
+    return playlist
+
+
+def _startup(load) -> str:
+    """Mede o carregamento até a playlist responder `len`, `[]` e a trilha atual."""
+    start = perf_counter()
+    playlist = load()
+    loaded = perf_counter()
+    len(playlist)
+    playlist[len(playlist) - 1]
+    playlist.get_current_track()
+    usable = perf_counter()
+    return f"{(loaded - start) * 1e3:8.1f}ms (utilizável em {(usable - start) * 1e3:8.1f}ms)"
+
+
+def _streaming_startup(path: Path) -> str:
+    """Mede quando a trilha atual fica pronta e quando o carregamento termina."""
+    start = perf_counter()
+    loader = PlaylistLoader(path, journal_path=None).start()
+    loader.wait_ready()
+    ready = perf_counter()
+    loader.wait_loaded()
+    loaded = perf_counter()
+    return f"pronta em {(ready - start) * 1e3:8.1f}ms (completa em {(loaded - start) * 1e3:8.1f}ms)"
+
+
+def bench(size: int) -> None:
+    """Grava uma playlist com `size` trilhas nos dois formatos e mede o carregamento."""
+    playlist = _playlist(size)
+    with tempfile.TemporaryDirectory() as folder:
+        json_path = Path(folder) / "playlist.json"
+        binary_path = Path(folder) / "playlist.bin"
+        write_json(playlist, json_path)
+        write_binary(playlist, binary_path)
+        json_size = json_path.stat().st_size / 2**20
+        binary_size = binary_path.stat().st_size / 2**20
+        print(
+            f"{size:>8} trilhas | JSON ({json_size:.1f}MB): {_startup(lambda: import_json(json_path))}"
+            f" | JSON em segundo plano: {_streaming_startup(json_path)}"
+            f" | binário ({binary_size:.1f}MB): {_startup(lambda: load_binary(binary_path))}"
+        )
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
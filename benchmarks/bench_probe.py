@@ -0,0 +1,73 @@
+"""
+Esse módulo mede a leitura de metadados pelo mpv
+(em arquivos/s): uma instância nova por arquivo,
+contra o MpvProber com 1, 2 e 4 instâncias reutilizadas.
+
+Os arquivos são WAV curtos, que o leitor de cabeçalhos
+não decodifica (o caso em que o mpv é usado). Precisa do libmpv.
+"""
+import sys
+import tempfile
+import wave
+from pathlib import Path
+from time import perf_counter
+from typing import List
+from src.mpv import mpv
+from src.core.config import PROBER_MPV_OPTIONS
+from src.core.mpv_prober import MpvProber
+
+SIZES = (50, 200)  # Arquivos lidos
+WORKERS = (1, 2, 4)
+RATE = 8_000
+
+
+def _files(root: Path, size: int) -> List[Path]:
+    paths = []
+    for index in range(size):
+        paths.append(root / f"{index}.wav")
+        with wave.open(str(paths[-1]), "wb") as file:
+            file.setnchannels(1)
+            file.setsampwidth(2)
+            file.setframerate(RATE)
+            file.writeframes(b"\0\0" * RATE)  # 1 segundo
+    return paths
+
+
+def _fresh(paths: List[Path]) -> float:
+    """Uma instância nova (criada, carregada e terminada) por arquivo."""
+    start = perf_counter()
+    for path in paths:
+        prober = MpvProber(workers=1, factory=lambda: mpv.MPV(**PROBER_MPV_OPTIONS)).start()
+        assert prober.probe(path).result()["duration"] is not None
+        prober.close()
+    return len(paths) / (perf_counter() - start)
+
+
+def _pooled(paths: List[Path], workers: int) -> float:
+    """As instâncias são criadas antes da medida, como num MpvProber já aberto."""
+    with MpvProber(workers=workers).start() as prober:
+        start = perf_counter()
+        found = sum(metadata["duration"] is not None for metadata in prober.probe_many(paths))
+        elapsed = perf_counter() - start
+    assert found == len(paths)
+    return len(paths) / elapsed
+
+
+def bench(size: int) -> None:
+    """Cria `size` arquivos WAV e mede a leitura com cada configuração."""
+    with tempfile.TemporaryDirectory() as folder:
+        paths = _files(Path(folder), size)
+        rates = [f"nova por arquivo: {_fresh(paths):7.1f}/s"]
+        rates += [f"{workers} instâncias: {_pooled(paths, workers):7.1f}/s" for workers in WORKERS]
+        print(f"{size:>5} arquivos | " + " | ".join(rates))
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
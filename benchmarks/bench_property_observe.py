@@ -0,0 +1,73 @@
+"""
+Esse módulo mede quantas mudanças de `time-pos` por
+segundo o laço de eventos do mpv entrega (`MPV._dispatch`)
+a um observador, com a propriedade observada como nó
+(`MpvFormat.NODE`, o padrão) e como double (`MpvFormat.DOUBLE`).
+
+Os eventos são montados na memória como o libmpv os
+entrega. Precisa do libmpv (só para criar o MPV, sem
+a thread de eventos).
+"""
+import sys
+from ctypes import addressof, c_double, pointer
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any
+from src.mpv import mpv
+
+SIZES = (100_000, 500_000)  # Eventos entregues
+
+
+def _event(fmt: int) -> Any:
+    """Uma mudança de `time-pos` para uma observação no formato `fmt`."""
+    if fmt == mpv.MpvFormat.NODE:
+        value = mpv.MpvNode()
+        value.format = mpv.MpvFormat.DOUBLE
+        value.val.double = 1.5
+        prop = mpv.MpvEventProperty()
+        prop.data.node = pointer(value)
+    else:
+        value = c_double(1.5)
+        prop = mpv._MpvEventScalarProperty()  # pylint: disable=protected-access
+        prop.data.double = pointer(value)
+    prop._name = b"time-pos"  # pylint: disable=protected-access
+    prop.format = fmt
+    return SimpleNamespace(
+        event_id=SimpleNamespace(value=mpv.MpvEventID.PROPERTY_CHANGE),
+        reply_userdata=mpv._property_observe_id("time-pos", fmt),  # pylint: disable=protected-access
+        _data=addressof(prop), prop=prop, value=value
+    )
+
+
+def _rate(player: mpv.MPV, fmt: int, size: int) -> float:
+    values = []
+    observer = lambda _name, value: values.append(value)  # noqa: E731
+    player.observe_property("time-pos", observer, fmt)
+    event = _event(fmt)
+    start = perf_counter()
+    for _ in range(size):
+        player._dispatch(event)  # pylint: disable=protected-access
+    elapsed = perf_counter() - start
+    player.unobserve_property("time-pos", observer, fmt)
+    assert values == [1.5] * size
+    return size / elapsed
+
+
+def bench(size: int) -> None:
+    """Entrega `size` mudanças de `time-pos` em cada formato."""
+    player = mpv.MPV(start_event_thread=False)
+    node = _rate(player, mpv.MpvFormat.NODE, size)
+    double = _rate(player, mpv.MpvFormat.DOUBLE, size)
+    player.terminate()
+    print(f"{size:>8} eventos | NODE: {node:12,.0f} eventos/s | DOUBLE: {double:12,.0f} eventos/s")
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Esse módulo mede a vazão (em MB/s) das leituras de um
+stream do mpv cuja fonte é um gerador de pedaços grandes:
+o algoritmo do `mpv.GeneratorStream` (concatena e refatia
+os `bytes` a cada leitura) contra o ReadAheadStream.
+
+As leituras são de `READ_SIZE` bytes, como as do mpv.
+"""
+import sys
+from time import perf_counter
+from typing import Callable, Iterator
+from src.core.read_ahead_stream import ReadAheadStream
+
+SIZES = (1, 4, 16)  # MB de cada pedaço gerado
+TOTAL = 64 * 1_000_000  # Bytes lidos
+READ_SIZE = 64 * 1024
+
+
+class _ConcatStream:
+    """A leitura do `mpv.GeneratorStream` (o módulo precisa do libmpv para ser importado)."""
+
+    def __init__(self, generator_fun: Callable[[], Iterator[bytes]]) -> None:
+        self._read_iter = iter(generator_fun())
+        self._read_chunk = b""
+
+    def read(self, size: int) -> bytes:
+        if not self._read_chunk:
+            try:
+                self._read_chunk += next(self._read_iter)
+            except StopIteration:
+                return b""
+        rv, self._read_chunk = self._read_chunk[:size], self._read_chunk[size:]
+        return rv
+
+
+def _rate(stream, readinto: bool) -> float:
+    buffer = memoryview(bytearray(READ_SIZE))
+    start = perf_counter()
+    total = 0
+    while True:
+        count = stream.readinto(buffer) if readinto else len(stream.read(READ_SIZE))
+        if not count:
+            break
+        total += count
+    assert total == TOTAL
+    return total / (perf_counter() - start) / 1e6
+
+
+def bench(size: int) -> None:
+    """Lê `TOTAL` bytes gerados em pedaços de `size` MB."""
+    chunk = bytes(size * 1_000_000)
+
+    def generator() -> Iterator[bytes]:
+        for _ in range(TOTAL // len(chunk)):
+            yield chunk
+
+    concat = _rate(_ConcatStream(generator), readinto=False)
+    stream = ReadAheadStream.from_generator(generator)
+    read_ahead = _rate(stream, readinto=True)
+    stream.close()
+    print(f"{size:>3} MB por pedaço | concatenando: {concat:8.1f} MB/s | "
+          f"ReadAheadStream: {read_ahead:8.1f} MB/s")
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
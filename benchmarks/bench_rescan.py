@@ -0,0 +1,65 @@
+"""
+Esse módulo mede a nova varredura incremental da
+biblioteca (LibraryManifest) numa árvore sintética:
+a primeira varredura, uma sem mudanças e uma com
+um álbum novo, comparadas ao número de pastas.
+"""
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from src.core.library_manifest import LibraryManifest
+
+SIZES = (10**4, 10**5, 2 * 10**5)
+FILES_PER_FOLDER = 12
+
+
+def _tree(root: Path, size: int) -> None:
+    """Cria `size` arquivos de áudio (mais uma capa por álbum) em artista/álbum/faixa."""
+    for album in range(size // FILES_PER_FOLDER):
+        _album(root / f"Artista {album // 10}" / f"Álbum {album}")
+
+
+def _album(folder: Path) -> None:
+    folder.mkdir(parents=True)
+    (folder / "cover.jpg").touch()
+    for index in range(FILES_PER_FOLDER):
+        (folder / f"{index:02} - Faixa {index}.flac").touch()
+
+
+def _timed(function) -> float:
+    start = perf_counter()
+    function()
+    return (perf_counter() - start) * 1e3
+
+
+def bench(size: int) -> None:
+    """Cria uma árvore com `size` arquivos e mede as varreduras."""
+    with tempfile.TemporaryDirectory() as folder:
+        root = Path(folder) / "music"
+        _tree(root, size)
+        manifest = LibraryManifest(Path(folder) / "library.json")
+        full = _timed(lambda: manifest.rescan([root]))
+        save = _timed(manifest.save)
+        load = _timed(lambda: LibraryManifest.load(Path(folder) / "library.json"))
+        unchanged = _timed(manifest.rescan)
+        _album(root / "Artista 0" / "Álbum novo")
+        changed = _timed(manifest.rescan)
+        checked = _timed(lambda: manifest.rescan(check_files=True))
+        print(
+            f"{size:>8} arquivos ({manifest.folder_count} pastas) | completa: {full:8.1f}ms"
+            f" | sem mudanças: {unchanged:7.1f}ms | um álbum novo: {changed:7.1f}ms"
+            f" | conferindo os arquivos: {checked:8.1f}ms"
+            f" | salvar/carregar: {save:6.1f}ms/{load:6.1f}ms"
+        )
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Esse módulo mede a construção, a memória e a latência
+das buscas do SearchIndex numa playlist grande.
+"""
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from random import Random
+from time import perf_counter
+from src.core.playlist import Track, Playlist
+from src.core.search_index import SearchIndex
+
+SIZES = (10**4, 2 * 10**5)
+QUERIES = ("faixa 12345", "album 77", "artista 99/álbum", "ção", "flac", "canção do mar", "xyz")
+REPEAT = 200
+
+
+def _playlist(size: int) -> Playlist:
+    random = Random(size)
+    words = ("Canção", "Amor", "Mar", "Saudade", "Coração", "Noite", "Lua", "Estrada")
+    playlist = Playlist()
+    playlist.add_many(
+        Track(
+            Path(f"/home/user/Música/Artista {i // 200}/Álbum {i // 12}/{i % 12:02} - Faixa {i}.flac"),
+            title=" ".join(random.sample(words, 3)) + f" {i}"
+        )
+        for i in range(size)
+    )
+    return playlist
+
+
+def bench(size: int) -> None:
+    """Mede o índice sobre uma playlist com `size` trilhas."""
+    playlist = _playlist(size)
+    start = perf_counter()
+    index = SearchIndex(playlist)
+    build = perf_counter() - start
+    index.detach()
+    del index
+    gc.collect()
+    tracemalloc.start()
+    index = SearchIndex(playlist)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{size:>8} trilhas | construção: {build * 1e3:.0f}ms | memória: {memory / 2**20:.1f}MB")
+    for query in QUERIES:
+        start = perf_counter()
+        for _ in range(REPEAT):
+            results = index.search(query)
+        mean = (perf_counter() - start) / REPEAT
+        print(f"{'':>8}   {query!r:>20}: {mean * 1e3:7.3f}ms ({len(results)} resultados)")
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
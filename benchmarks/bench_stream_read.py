@@ -0,0 +1,97 @@
+"""
+Esse módulo mede a vazão (em MB/s) do callback de
+leitura dos protocolos registrados com
+`MPV.register_stream_protocol`, chamando-o como o
+libmpv chama: com um buffer C de `BUFFER_SIZE` bytes.
+
+Compara a cópia antiga (byte a byte, em Python), o
+`read()` com uma cópia só e o `readinto()` direto no
+buffer. Precisa do libmpv (só para registrar o protocolo).
+"""
+import io
+import sys
+from ctypes import POINTER, byref, c_char, create_string_buffer
+from time import perf_counter
+from src.mpv import mpv
+
+SIZES = (5, 50)  # MB lidos
+BUFFER_SIZE = 64 * 1024  # Bytes pedidos por chamada
+
+
+class _ReadStream:
+    """Só `read`: o callback copia o resultado para o buffer do mpv."""
+
+    def __init__(self, data: bytes) -> None:
+        self._file = io.BytesIO(data)
+        self.size = len(data)
+
+    def read(self, size: int) -> bytes:
+        return self._file.read(size)
+
+
+class _ReadIntoStream(_ReadStream):
+    """Com `readinto`: o BytesIO escreve direto no buffer do mpv."""
+
+    def readinto(self, buffer: memoryview) -> int:
+        return self._file.readinto(buffer)
+
+
+def _per_byte(_userdata, buf, bufsize, frontend) -> int:
+    """O callback de antes: uma atribuição em Python por byte."""
+    data = frontend.read(bufsize)
+    for i in range(len(data)):
+        buf[i] = data[i]
+    return len(data)
+
+
+def _rate(player: mpv.MPV, proto: str, size: int) -> float:
+    """Abre `proto://` como o libmpv e lê tudo pelo callback de leitura, em MB/s."""
+    info = mpv.StreamCallbackInfo()
+    open_backend = player._stream_protocol_cbs[proto][0]  # pylint: disable=protected-access
+    assert open_backend(None, f"{proto}://bench".encode(), byref(info)) == 0
+    buffer = create_string_buffer(BUFFER_SIZE)
+    pointer = POINTER(c_char)(buffer)
+    start = perf_counter()
+    total = 0
+    while True:
+        read = info.read(None, pointer, BUFFER_SIZE)
+        if read <= 0:
+            break
+        total += read
+    elapsed = perf_counter() - start
+    info.close(None)
+    assert total == size
+    return size / elapsed / 1e6
+
+
+def bench(size: int) -> None:
+    """Lê `size` MB por cada caminho do callback de leitura."""
+    data = bytes(range(256)) * (size * 1_000_000 // 256)
+    size = len(data)
+    player = mpv.MPV(ao="null", video="no")
+    player.register_stream_protocol("benchread", lambda _uri: _ReadStream(data))
+    player.register_stream_protocol("benchinto", lambda _uri: _ReadIntoStream(data))
+    # A cópia antiga, só nos primeiros MB (é lenta demais para todos)
+    sample = data[:min(size, 2_000_000)]
+    frontend = _ReadStream(sample)
+    pointer = POINTER(c_char)(create_string_buffer(BUFFER_SIZE))
+    start = perf_counter()
+    while _per_byte(None, pointer, BUFFER_SIZE, frontend):
+        pass
+    per_byte = len(sample) / (perf_counter() - start) / 1e6
+    read = _rate(player, "benchread", size)
+    readinto = _rate(player, "benchinto", size)
+    player.terminate()
+    print(f"{size / 1e6:>5.0f} MB | byte a byte: {per_byte:8.1f} MB/s | "
+          f"read(): {read:8.1f} MB/s | readinto(): {readinto:8.1f} MB/s")
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
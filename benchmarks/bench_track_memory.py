@@ -0,0 +1,49 @@
+"""
+Esse módulo compara a memória por trilha de uma Playlist
+com o armazenamento padrão (instâncias de Track) e com a
+TrackStore em colunas.
+"""
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from src.core.playlist import Track, Playlist
+from src.core.track_store import TrackStore
+
+SIZES = (10**4, 10**5, 5 * 10**5)
+
+
+def _track_paths(size: int):
+    """Gera paths parecidos com uma biblioteca real: artista/álbum/faixa."""
+    for i in range(size):
+        yield Path(f"/home/user/Música/Artista {i // 200}/Álbum {i // 12}/{i % 12:02} - Faixa {i}.flac")
+
+
+def measure(size: int, compact: bool) -> float:
+    """Retorna os bytes por trilha de uma playlist com `size` trilhas."""
+    gc.collect()
+    tracemalloc.start()
+    playlist = Playlist(store=TrackStore() if compact else None)
+    playlist.add_many(Track(path, duration=180.0) for path in _track_paths(size))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del playlist
+    return current / size
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        dataclass_bytes = measure(size, compact=False)
+        columnar_bytes = measure(size, compact=True)
+        print(
+            f"{size:>8} trilhas | Track: {dataclass_bytes:7.1f} B/trilha"
+            f" | TrackStore: {columnar_bytes:7.1f} B/trilha"
+            f" | {dataclass_bytes / columnar_bytes:.1f}x menor"
+        )
+
+
+if __name__ == "__main__":
+    main()
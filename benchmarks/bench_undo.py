@@ -0,0 +1,70 @@
+"""
+Esse módulo mede o custo do histórico de desfazer
+(PlaylistHistory) por edição, comparado a copiar a
+sequência da playlist inteira a cada edição.
+"""
+import sys
+from random import Random
+from time import perf_counter
+from src.core.playlist import Track, Playlist
+from src.core.playlist_history import PlaylistHistory
+
+SIZES = (10**4, 10**5, 10**6)
+EDITS = 200
+
+
+def _playlist(size: int) -> Playlist:
+    playlist = Playlist()
+    playlist.add_many(Track(f"/home/user/Música/{i // 12}/{i % 12:02}.flac") for i in range(size))
+    return playlist
+
+
+def _edit(playlist: Playlist, random: Random) -> None:
+    playlist.move(random.randrange(len(playlist)), random.randrange(len(playlist)))
+
+
+def bench(size: int) -> None:
+    """Mede `EDITS` movimentos aleatórios sem histórico, com cópias e com o histórico."""
+    playlist = _playlist(size)
+    random = Random(0)
+    start = perf_counter()
+    for _ in range(EDITS):
+        _edit(playlist, random)
+    plain = (perf_counter() - start) / EDITS
+
+    copies = []
+    start = perf_counter()
+    for _ in range(EDITS):
+        copies.append((list(playlist._tracks), playlist.current_index))
+        _edit(playlist, random)
+    copied = (perf_counter() - start) / EDITS
+    copy_size = sum(sys.getsizeof(entries) for entries, _ in copies) / EDITS
+    copies.clear()
+
+    history = PlaylistHistory(playlist, memory_budget=2**40, max_steps=EDITS)
+    start = perf_counter()
+    for _ in range(EDITS):
+        _edit(playlist, random)
+    shared = (perf_counter() - start) / EDITS
+    step_size = history.memory_usage / EDITS
+    start = perf_counter()
+    while history.undo():
+        pass
+    undo = (perf_counter() - start) / EDITS
+    print(
+        f"{size:>8} trilhas | edição: {plain * 1e6:7.1f}µs"
+        f" | com cópia: {copied * 1e6:9.1f}µs ({copy_size / 1024:8.1f}KB/passo)"
+        f" | com histórico: {shared * 1e6:7.1f}µs ({step_size / 1024:6.1f}KB/passo)"
+        f" | desfazer: {undo * 1e6:7.1f}µs"
+    )
+
+
+def main() -> None:
+    """Executa o benchmark para cada tamanho em `SIZES` (ou os passados na linha de comando)."""
+    sizes = tuple(int(arg) for arg in sys.argv[1:]) or SIZES
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,412 @@
+"""
+Esse módulo contém o leitor de metadados (título,
+artista, álbum e duração) dos arquivos de áudio,
+que decodifica só os cabeçalhos dos formatos MP3,
+FLAC, Ogg (Vorbis e Opus) e MP4, sem abrir o mpv.
+"""
+import mmap
+import os
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from src.core.type_hints import AudioMetadata, PathType
+from src.core.config import METADATA_CHUNK_SIZE
+from src.core.track import Track
+
+_Buffer = Any  # `mmap.mmap` ou `bytes`: ambos aceitam fatias e `find`
+_Fields = Dict[str, Any]
+
+_SYNC_WINDOW = 64 * 1024  # Bytes procurados pelo primeiro frame MP3 depois da tag
+_OGG_PACKET_LIMIT = 64 * 1024  # Bytes guardados do pacote de comentários (o resto é capa)
+_OGG_TAIL_WINDOW = 64 * 1024  # Bytes lidos por vez, do fim, atrás da última página
+
+_ID3_FIELDS = {b"TIT2": "title", b"TPE1": "artist", b"TALB": "album", b"TLEN": "length"}
+_ID3_FIELDS_V22 = {b"TT2": "title", b"TP1": "artist", b"TAL": "album", b"TLE": "length"}
+_ID3_ENCODINGS = ("latin-1", "utf-16", "utf-16-be", "utf-8")
+_VORBIS_FIELDS = {b"TITLE": "title", b"ARTIST": "artist", b"ALBUM": "album"}
+_MP4_FIELDS = {b"\xa9nam": "title", b"\xa9ART": "artist", b"\xa9alb": "album"}
+
+# Tabelas do cabeçalho de frame MPEG: kbps por (MPEG1?, camada) e Hz por versão
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+}
+_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _int(data: bytes, order: str = "big") -> int:
+    return int.from_bytes(data, order)
+
+
+def _syncsafe(data: bytes) -> int:
+    """Inteiro "syncsafe" do ID3v2: 7 bits por byte."""
+    value = 0
+    for byte in data:
+        value = (value << 7) | (byte & 0x7F)
+    return value
+
+
+def _id3_text(body: bytes) -> Optional[str]:
+    """Decodifica um frame de texto do ID3v2 (o primeiro valor, se houver vários)."""
+    if len(body) < 2 or body[0] >= len(_ID3_ENCODINGS):
+        return None
+    text = body[1:].decode(_ID3_ENCODINGS[body[0]], "replace")
+    return text.split("\0", 1)[0].strip() or None
+
+
+def _id3v2(data: _Buffer, fields: _Fields) -> int:
+    """Lê os frames de texto de uma tag ID3v2 no início. Retorna onde a tag termina."""
+    major, flags = data[3], data[5]
+    size = _syncsafe(data[6:10])
+    limit = 10 + size
+    pos = 10
+    if flags & 0x40:  # Cabeçalho estendido
+        pos += _syncsafe(data[10:14]) if major == 4 else 4 + _int(data[10:14])
+    known = _ID3_FIELDS_V22 if major == 2 else _ID3_FIELDS
+    header = 6 if major == 2 else 10
+    while pos + header <= limit:
+        if major == 2:
+            frame_id, frame_size = data[pos:pos + 3], _int(data[pos + 3:pos + 6])
+        else:
+            frame_id, raw_size = data[pos:pos + 4], data[pos + 4:pos + 8]
+            frame_size = _syncsafe(raw_size) if major == 4 else _int(raw_size)
+        if not frame_id.strip(b"\0"):  # Preenchimento
+            break
+        field = known.get(frame_id)
+        if field is not None and field not in fields:
+            text = _id3_text(data[pos + header:pos + header + frame_size])
+            if text is not None:
+                fields[field] = text
+        pos += header + frame_size
+    return limit + (10 if flags & 0x10 else 0)  # Rodapé
+
+
+def _mpeg_header(header: bytes) -> Optional[Tuple[bool, int, int, int, bool, int, int]]:
+    """
+    Decodifica o cabeçalho de um frame MPEG: `(MPEG1?, camada, kbps, Hz,
+    mono?, amostras por frame, tamanho do frame)`, ou None se não for válido.
+    """
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version, layer_bits = (header[1] >> 3) & 3, (header[1] >> 1) & 3
+    bitrate_index, rate_index = header[2] >> 4, (header[2] >> 2) & 3
+    if version == 1 or layer_bits == 0 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1, layer = version == 3, 4 - layer_bits
+    bitrate = _BITRATES[(mpeg1, layer)][bitrate_index]
+    rate = _SAMPLE_RATES[version][rate_index]
+    padding = (header[2] >> 1) & 1
+    if layer == 1:
+        samples, length = 384, (12 * bitrate * 1000 // rate + padding) * 4
+    else:
+        samples = 1152 if mpeg1 or layer == 2 else 576
+        length = samples // 8 * bitrate * 1000 // rate + padding
+    return mpeg1, layer, bitrate, rate, header[3] >> 6 == 3, samples, length
+
+
+def _mp3(data: _Buffer, start: int, size: int, fields: _Fields) -> None:
+    """Calcula a duração pelo cabeçalho Xing/Info ou VBRI, ou pelo bitrate (CBR)."""
+    window = data[start:start + _SYNC_WINDOW]
+    first = None
+    index = window.find(b"\xff")
+    while index != -1:
+        header = _mpeg_header(window[index:index + 4])
+        if header is not None:
+            first = first or (index, header)
+            # Confirma pelo frame seguinte, para não aceitar um 0xFF qualquer
+            following = start + index + header[6]
+            if following >= size or _mpeg_header(data[following:following + 4]) is not None:
+                first = (index, header)
+                break
+        index = window.find(b"\xff", index + 1)
+    if first is None:
+        return
+    index, (mpeg1, _, bitrate, rate, mono, samples, _) = first
+    frame = start + index
+    side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+    xing = frame + 4 + side_info
+    frames = None
+    if data[xing:xing + 4] in (b"Xing", b"Info"):
+        if _int(data[xing + 4:xing + 8]) & 1:
+            frames = _int(data[xing + 8:xing + 12])
+    elif data[frame + 36:frame + 40] == b"VBRI":
+        frames = _int(data[frame + 50:frame + 54])
+    if frames:
+        fields["duration"] = frames * samples / rate
+    elif "length" in fields and fields["length"].isdigit():  # TLEN, em ms
+        fields["duration"] = int(fields["length"]) / 1000
+    else:
+        audio = size - frame - (128 if data[size - 128:size - 125] == b"TAG" else 0)
+        fields["duration"] = audio * 8 / (bitrate * 1000)
+
+
+def _id3v1(data: _Buffer, size: int, fields: _Fields) -> None:
+    """Lê a tag ID3v1 do fim do arquivo, se não houver ID3v2."""
+    tag = data[size - 128:size] if size >= 128 else b""
+    if tag[:3] != b"TAG":
+        return
+    for field, start in (("title", 3), ("artist", 33), ("album", 63)):
+        value = tag[start:start + 30].split(b"\0", 1)[0].decode("latin-1").strip()
+        if value:
+            fields.setdefault(field, value)
+
+
+def _vorbis_comments(block: bytes, fields: _Fields) -> None:
+    """Lê um bloco de comentários Vorbis (FLAC, Ogg); tolera um bloco cortado."""
+    pos = 4 + _int(block[0:4], "little")
+    count = _int(block[pos:pos + 4], "little")
+    pos += 4
+    for _ in range(count):
+        if pos + 4 > len(block):
+            break
+        length = _int(block[pos:pos + 4], "little")
+        key, _, value = block[pos + 4:pos + 4 + length].partition(b"=")
+        pos += 4 + length
+        field = _VORBIS_FIELDS.get(key.upper())
+        if field is not None and field not in fields and value:
+            fields[field] = value.decode("utf-8", "replace")
+
+
+def _flac(data: _Buffer, start: int, size: int, fields: _Fields) -> None:
+    """Lê os blocos STREAMINFO e VORBIS_COMMENT, pulando os demais (capas, tabelas)."""
+    pos = start + 4
+    while pos + 4 <= size:
+        header, length = data[pos], _int(data[pos + 1:pos + 4])
+        body = pos + 4
+        if header & 0x7F == 0:  # STREAMINFO
+            info = data[body + 10:body + 18]
+            rate = (info[0] << 12) | (info[1] << 4) | (info[2] >> 4)
+            total = ((info[3] & 0x0F) << 32) | _int(info[4:8])
+            if rate and total:
+                fields["duration"] = total / rate
+        elif header & 0x7F == 4:
+            _vorbis_comments(data[body:body + length], fields)
+        if header & 0x80:  # Último bloco
+            break
+        pos = body + length
+
+
+def _ogg_packets(data: _Buffer, size: int, count: int) -> Tuple[List[bytes], bytes]:
+    """
+    Remonta os `count` primeiros pacotes do primeiro fluxo lógico (guardando
+    até `_OGG_PACKET_LIMIT` bytes de cada). Retorna os pacotes e o serial do fluxo.
+    """
+    packets: List[bytes] = []
+    current = bytearray()
+    serial = data[14:18]
+    pos = 0
+    while len(packets) < count and pos + 27 <= size and data[pos:pos + 4] == b"OggS":
+        segments = data[pos + 26]
+        lacing = data[pos + 27:pos + 27 + segments]
+        body = pos + 27 + segments
+        next_page = body + sum(lacing)
+        if data[pos + 14:pos + 18] == serial:
+            for length in lacing:
+                if len(current) < _OGG_PACKET_LIMIT:
+                    current += data[body:body + length]
+                body += length
+                if length < 255:  # Fim do pacote
+                    packets.append(bytes(current))
+                    current = bytearray()
+                    if len(packets) == count:
+                        break
+        pos = next_page
+    if current and len(packets) < count:
+        packets.append(bytes(current))
+    return packets, serial
+
+
+def _ogg_last_granule(data: _Buffer, size: int, serial: bytes) -> Optional[int]:
+    """Posição (em amostras) da última página do fluxo, procurando do fim para o começo."""
+    end = size
+    while end > 0:
+        start = max(0, end - _OGG_TAIL_WINDOW)
+        pos = data.rfind(b"OggS", start, end)
+        while pos != -1:
+            granule = _int(data[pos + 6:pos + 14], "little")
+            if data[pos + 14:pos + 18] == serial and granule != 2**64 - 1:
+                return granule
+            pos = data.rfind(b"OggS", start, pos)
+        end = start + 3  # Um "OggS" pode estar no limite entre as janelas
+        if start == 0:
+            break
+    return None
+
+
+def _ogg(data: _Buffer, size: int, fields: _Fields) -> None:
+    """Lê o cabeçalho e os comentários de um Ogg Vorbis ou Opus, e a duração pela última página."""
+    packets, serial = _ogg_packets(data, size, 2)
+    if not packets:
+        return
+    identification = packets[0]
+    if identification.startswith(b"\x01vorbis"):
+        rate, pre_skip, prefix = _int(identification[12:16], "little"), 0, b"\x03vorbis"
+    elif identification.startswith(b"OpusHead"):
+        rate, pre_skip, prefix = 48000, _int(identification[10:12], "little"), b"OpusTags"
+    else:
+        return
+    if len(packets) > 1 and packets[1].startswith(prefix):
+        _vorbis_comments(packets[1][len(prefix):], fields)
+    granule = _ogg_last_granule(data, size, serial)
+    if granule is not None and rate:
+        fields["duration"] = max(0, granule - pre_skip) / rate
+
+
+def _atoms(data: _Buffer, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """Gera `(tipo, início do conteúdo, fim)` dos atoms MP4 entre `start` e `end`."""
+    pos = start
+    while pos + 8 <= end:
+        size, kind, header = _int(data[pos:pos + 4]), data[pos + 4:pos + 8], 8
+        if size == 1:  # Tamanho em 64 bits
+            size, header = _int(data[pos + 8:pos + 16]), 16
+        elif size == 0:  # Até o fim
+            size = end - pos
+        if size < header:
+            return
+        yield kind, pos + header, min(pos + size, end)
+        pos += size
+
+
+def _atom(data: _Buffer, start: int, end: int, kind: bytes) -> Optional[Tuple[int, int]]:
+    for found, body, stop in _atoms(data, start, end):
+        if found == kind:
+            return body, stop
+    return None
+
+
+def _mp4(data: _Buffer, size: int, fields: _Fields) -> None:
+    """Lê a duração do `mvhd` e as tags do `ilst`, pulando o `mdat` (o áudio)."""
+    moov = _atom(data, 0, size, b"moov")
+    if moov is None:
+        return
+    for kind, start, end in _atoms(data, *moov):
+        if kind == b"mvhd":
+            if data[start] == 1:
+                timescale, duration = _int(data[start + 20:start + 24]), _int(data[start + 24:start + 32])
+            else:
+                timescale, duration = _int(data[start + 12:start + 16]), _int(data[start + 16:start + 20])
+            if timescale:
+                fields["duration"] = duration / timescale
+        elif kind == b"udta":
+            meta = _atom(data, start, end, b"meta")
+            if meta is None:
+                continue
+            # O `meta` do iTunes tem versão e flags antes dos filhos; o do QuickTime não
+            offset = 0 if data[meta[0] + 4:meta[0] + 8] == b"hdlr" else 4
+            items = _atom(data, meta[0] + offset, meta[1], b"ilst")
+            for item, item_start, item_end in _atoms(data, *items) if items else ():
+                field = _MP4_FIELDS.get(item)
+                value = _atom(data, item_start, item_end, b"data") if field else None
+                if value is not None and field not in fields:
+                    # Depois do tipo (4 bytes) e da localidade (4 bytes)
+                    fields[field] = data[value[0] + 8:value[1]].decode("utf-8", "replace")
+
+
+def empty_metadata() -> AudioMetadata:
+    """Metadados de um arquivo ilegível ou de formato desconhecido."""
+    return {"title": None, "artist": None, "album": None, "duration": None}
+
+
+def parse_metadata(data: _Buffer, size: int) -> AudioMetadata:
+    """
+    Lê os metadados de um arquivo de áudio já em memória (`bytes` ou
+    `mmap`), reconhecendo o formato pelo conteúdo, não pela extensão.
+    Um formato desconhecido, ou um cabeçalho inválido, não tem metadados.
+    """
+    fields: _Fields = {}
+    try:
+        head = data[:12]
+        if head[:3] == b"ID3":
+            end = _id3v2(data, fields)
+            if data[end:end + 4] == b"fLaC":
+                _flac(data, end, size, fields)
+            else:
+                _mp3(data, end, size, fields)
+        elif head[:4] == b"fLaC":
+            _flac(data, 0, size, fields)
+        elif head[:4] == b"OggS":
+            _ogg(data, size, fields)
+        elif head[4:8] == b"ftyp":
+            _mp4(data, size, fields)
+        elif _mpeg_header(head[:4]) is not None:
+            _id3v1(data, size, fields)
+            _mp3(data, 0, size, fields)
+    except (IndexError, ValueError, KeyError):  # Cabeçalho cortado ou inválido
+        pass
+    return {
+        "title": fields.get("title"),
+        "artist": fields.get("artist"),
+        "album": fields.get("album"),
+        "duration": fields.get("duration")
+    }
+
+
+def read_metadata(path: PathType) -> AudioMetadata:
+    """
+    Lê os metadados de um arquivo de áudio.
+
+    O arquivo é mapeado em memória (mmap) e só as páginas dos cabeçalhos
+    são lidas do disco: as tags, o primeiro frame (MP3), os blocos de
+    metadados (FLAC), as primeiras e a última página (Ogg) e o `moov`
+    (MP4), pulando o áudio e as capas. Repassa os erros ao abrir o arquivo.
+    """
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return empty_metadata()
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if hasattr(mmap, "MADV_RANDOM"):  # Sem ler adiante além dos cabeçalhos
+                data.madvise(mmap.MADV_RANDOM)
+            return parse_metadata(data, size)
+
+
+def _read_or_empty(path: PathType) -> AudioMetadata:
+    """`read_metadata` para leituras em lote: um arquivo ilegível não tem metadados."""
+    try:
+        return read_metadata(path)
+    except OSError:
+        return empty_metadata()
+
+
+def read_many(
+    paths: Iterable[PathType],
+    executor: Optional[Executor] = None,
+    chunk_size: int = METADATA_CHUNK_SIZE
+) -> Iterator[AudioMetadata]:
+    """
+    Lê os metadados de vários arquivos, na ordem dada. Com um `executor`
+    (um `ProcessPoolExecutor`, para usar vários núcleos), os arquivos são
+    divididos em tarefas de `chunk_size`; sem ele, são lidos aqui mesmo.
+    Arquivos ilegíveis não têm metadados.
+    """
+    if executor is None:
+        return map(_read_or_empty, paths)
+    return executor.map(_read_or_empty, paths, chunksize=chunk_size)
+
+
+def fill_metadata(
+    tracks: List[Track],
+    executor: Optional[Executor] = None,
+    chunk_size: int = METADATA_CHUNK_SIZE
+) -> None:
+    """
+    Preenche o título e a duração das trilhas locais que ainda não os têm,
+    antes de elas entrarem na playlist (as trilhas de um TrackStore são cópias):
+
+        with ProcessPoolExecutor() as pool:
+            fill_metadata(tracks, pool)
+        playlist.add_many(tracks)
+    """
+    pending = [
+        track for track in tracks
+        if track.source == "local" and (track.title is None or track.duration is None)
+    ]
+    metadata = read_many((track.path for track in pending), executor, chunk_size)
+    for track, fields in zip(pending, metadata):
+        if track.title is None:
+            track.title = fields["title"]
+        if track.duration is None:
+            track.duration = fields["duration"]
@@ -0,0 +1,380 @@
+"""
+Esse módulo contém a classe BlockList, uma
+sequência em blocos usada como estrutura base
+da Playlist para operações posicionais rápidas.
+"""
+import sys
+from bisect import bisect_right
+from itertools import accumulate, chain, count, repeat
+from typing import (
+    Any, Callable, Dict, Generic, Hashable, Iterable,
+    Iterator, List, Optional, Set, Tuple, TypeVar, Union
+)
+from src.utils.operations_utils import FenwickTree
+
+T = TypeVar("T")
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+class BlockList(Generic[T]):
+    """
+    Sequência dividida em blocos de tamanho limitado.
+
+    Uma árvore de Fenwick guarda o tamanho de cada bloco, então
+    acessar, inserir e remover por posição custam O(log n) para achar
+    o bloco mais O(tamanho do bloco) dentro dele. Um índice `chave -> bloco`
+    permite achar a posição de um item (`index`) e testar se ele
+    pertence à sequência sem percorrê-la. As chaves, dadas por `key`,
+    precisam ser únicas.
+
+    O índice só é montado na primeira busca por chave: uma sequência
+    criada com muitos itens já pode ser lida sem esse custo.
+
+    `snapshot` cria uma cópia imutável que compartilha os blocos com a
+    sequência (custo O(número de blocos)). Os blocos compartilhados são
+    copiados só na primeira escrita (copy-on-write), então cada edição
+    depois de um snapshot copia no máximo alguns blocos.
+    """
+    _LOAD = 256  # Blocos são divididos ao passar de 2 * _LOAD itens
+
+    def __init__(
+        self,
+        items: Iterable[T] = (),
+        key: Callable[[T], Hashable] = _identity
+    ) -> None:
+        self._key = key
+        self._blocks: List[List[T]] = []
+        self._block_of: Optional[Dict[Hashable, List[T]]] = None  # Montado sob demanda
+        self._block_pos: Dict[int, int] = {}
+        # ids dos blocos criados depois do último snapshot (os demais são
+        # compartilhados com ele); None se nenhum snapshot foi criado
+        self._owned: Optional[Set[int]] = None
+        self._sizes = FenwickTree()
+        self._len = 0
+        self.extend(items)
+
+    def _rebuild(self) -> None:
+        """Refaz a Fenwick e as posições dos blocos depois de dividir/juntar blocos."""
+        self._sizes = FenwickTree.from_values(len(block) for block in self._blocks)
+        self._block_pos = {id(block): pos for pos, block in enumerate(self._blocks)}
+
+    def _index(self) -> Dict[Hashable, List[T]]:
+        """Retorna o índice `chave -> bloco`, montando-o se ainda não existir."""
+        if self._block_of is None:
+            key = self._key
+            self._block_of = {
+                key(item): block for block in self._blocks for item in block}
+        return self._block_of
+
+    def _own(self, block_index: int) -> List[T]:
+        """Retorna o bloco para ser alterado, copiando-o antes se for compartilhado."""
+        block = self._blocks[block_index]
+        if self._owned is None or id(block) in self._owned:
+            return block
+        copy = block[:]
+        self._owned.add(id(copy))
+        self._blocks[block_index] = copy
+        del self._block_pos[id(block)]
+        self._block_pos[id(copy)] = block_index
+        if self._block_of is not None:
+            self._block_of.update(zip(map(self._key, copy), repeat(copy)))
+        return copy
+
+    def _new_block(self, items: List[T]) -> List[T]:
+        """Registra um bloco criado depois do último snapshot."""
+        if self._owned is not None:
+            self._owned.add(id(items))
+        return items
+
+    def _locate(self, index: int) -> Tuple[int, int]:
+        """Converte uma posição em (bloco, deslocamento), aceitando índices negativos."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(f"O index ({index}) está fora da sequência ({self._len}).")
+        return self._sizes.search(index)
+
+    def _split(self, block_index: int) -> None:
+        """Divide um bloco que passou do tamanho máximo."""
+        block = self._own(block_index)
+        half = self._new_block(block[self._LOAD:])
+        del block[self._LOAD:]
+        if self._block_of is not None:
+            key = self._key
+            for item in half:
+                self._block_of[key(item)] = half
+        self._blocks.insert(block_index + 1, half)
+        self._rebuild()
+
+    def _merge(self, block_index: int) -> None:
+        """Junta um bloco pequeno demais a um vizinho, ou descarta se estiver vazio."""
+        blocks = self._blocks
+        if not blocks[block_index]:
+            del blocks[block_index]
+        else:
+            neighbour = block_index + 1 if block_index + 1 < len(blocks) else block_index - 1
+            if neighbour < 0:
+                return
+            first, second = sorted((block_index, neighbour))
+            if len(blocks[first]) + len(blocks[second]) > 2 * self._LOAD:
+                return
+            target, source = self._own(first), blocks[second]
+            if self._block_of is not None:
+                key = self._key
+                for item in source:
+                    self._block_of[key(item)] = target
+            target.extend(source)
+            del blocks[second]
+        self._rebuild()
+
+    def append(self, item: T) -> None:
+        """Adiciona um item no final da sequência."""
+        if not self._blocks:
+            self._blocks.append(self._new_block([]))
+            self._rebuild()
+        block = self._own(len(self._blocks) - 1)
+        block.append(item)
+        if self._block_of is not None:
+            self._block_of[self._key(item)] = block
+        self._len += 1
+        self._sizes.add(len(self._blocks) - 1, 1)
+        if len(block) > 2 * self._LOAD:
+            self._split(len(self._blocks) - 1)
+
+    def extend(self, items: Iterable[T]) -> None:
+        """
+        Adiciona vários itens no final da sequência.
+
+        Os itens são agrupados direto em blocos novos e a Fenwick
+        é refeita uma única vez, em vez de uma vez por item.
+        """
+        items = list(items)
+        if not items:
+            return
+        blocks = self._blocks
+        block_of = self._block_of
+        key = self._key
+        start = 0
+        if blocks and len(blocks[-1]) < self._LOAD:
+            last = self._own(len(blocks) - 1)
+            start = self._LOAD - len(last)
+            last.extend(items[:start])
+            if block_of is not None:
+                block_of.update(zip(map(key, items[:start]), repeat(last)))
+        for chunk_start in range(start, len(items), self._LOAD):
+            chunk = self._new_block(items[chunk_start:chunk_start + self._LOAD])
+            blocks.append(chunk)
+            if block_of is not None:
+                block_of.update(zip(map(key, chunk), repeat(chunk)))
+        # O tamanho muda por último: leituras em outra thread durante o
+        # `extend` continuam vendo uma sequência consistente
+        self._rebuild()
+        self._len += len(items)
+
+    def insert(self, index: int, item: T) -> None:
+        """Insere um item antes da posição `index`, como em `list.insert`."""
+        if index < 0:
+            index = max(0, index + self._len)
+        if index >= self._len:
+            self.append(item)
+            return
+        block_index, offset = self._sizes.search(index)
+        block = self._own(block_index)
+        block.insert(offset, item)
+        if self._block_of is not None:
+            self._block_of[self._key(item)] = block
+        self._len += 1
+        self._sizes.add(block_index, 1)
+        if len(block) > 2 * self._LOAD:
+            self._split(block_index)
+
+    def pop(self, index: int = -1) -> T:
+        """Remove e retorna o item na posição `index`."""
+        block_index, offset = self._locate(index)
+        block = self._own(block_index)
+        item = block.pop(offset)
+        if self._block_of is not None:
+            del self._block_of[self._key(item)]
+        self._len -= 1
+        self._sizes.add(block_index, -1)
+        if len(block) < self._LOAD // 4:
+            self._merge(block_index)
+        return item
+
+    def move(self, from_index: int, to_index: int) -> None:
+        """Move o item de `from_index` para que passe a ocupar `to_index`."""
+        item = self.pop(from_index)
+        self.insert(to_index if to_index >= 0 else to_index + self._len + 1, item)
+
+    def index(self, item: T) -> int:
+        """Retorna a posição de um item pela sua chave, ou ValueError."""
+        return self.index_of_key(self._key(item))
+
+    def index_of_key(self, key: Hashable) -> int:
+        """Retorna a posição do item com essa chave, ou ValueError."""
+        block = self._index().get(key)
+        if block is None:
+            raise ValueError(f"{key!r} não está na sequência.")
+        if self._key is _identity:
+            offset = block.index(key)
+        else:
+            offset = list(map(self._key, block)).index(key)
+        return self._sizes.prefix_sum(self._block_pos[id(block)]) + offset
+
+    def has_key(self, key: Hashable) -> bool:
+        """Verifica se algum item tem essa chave."""
+        return key in self._index()
+
+    def clear(self) -> None:
+        """Remove todos os itens."""
+        self._blocks = []
+        self._block_of = None
+        self._owned = None
+        self._len = 0
+        self._rebuild()
+
+    def snapshot(self) -> "BlockListSnapshot[T]":
+        """Retorna uma cópia imutável da sequência, que compartilha os blocos com ela."""
+        self._owned = set()
+        return BlockListSnapshot(self._blocks, self._len)
+
+    def restore(self, snapshot: "BlockListSnapshot[T]") -> List[Tuple[int, List[T], List[T]]]:
+        """
+        Volta a sequência para o conteúdo de `snapshot`, compartilhando os blocos dele.
+
+        Só os blocos que não estão nas duas versões são percorridos. Retorna
+        os trechos alterados, em ordem, como `(posição, itens removidos, itens
+        inseridos)`: aplicados um depois do outro, levam ao novo conteúdo.
+        """
+        old, new = self._blocks, list(snapshot.blocks)
+        old_ids, new_ids = list(map(id, old)), list(map(id, new))
+        common = set(old_ids).intersection(new_ids)
+        new_pos = dict(zip(new_ids, count()))
+        # Cada trecho alterado começa depois de um bloco comum (ou no início)
+        anchors = {-1}
+        anchors.update(
+            new_pos[old_ids[pos - 1]] for pos, block_id in enumerate(old_ids)
+            if pos and block_id not in common and old_ids[pos - 1] in common)
+        anchors.update(
+            pos - 1 for pos, block_id in enumerate(new_ids)
+            if pos and block_id not in common and new_ids[pos - 1] in common)
+        old_pos = dict(zip(old_ids, count()))
+        runs = []
+        for anchor in sorted(anchors):
+            old_start = 0 if anchor < 0 else old_pos[new_ids[anchor]] + 1
+            old_end = old_start
+            while old_end < len(old) and old_ids[old_end] not in common:
+                old_end += 1
+            new_end = anchor + 1
+            while new_end < len(new) and new_ids[new_end] not in common:
+                new_end += 1
+            if old_end > old_start or new_end > anchor + 1:
+                runs.append((old_start, old_end, anchor + 1, new_end))
+        key = self._key
+        if self._block_of is not None:
+            for old_start, old_end, new_start, new_end in runs:
+                for block in old[old_start:old_end]:
+                    for item in block:
+                        del self._block_of[key(item)]
+            for old_start, old_end, new_start, new_end in runs:
+                for block in new[new_start:new_end]:
+                    self._block_of.update(zip(map(key, block), repeat(block)))
+        self._blocks = new
+        self._owned = set()
+        self._len = len(snapshot)
+        self._rebuild()
+        changes = []
+        for old_start, old_end, new_start, new_end in runs:
+            removed = list(chain.from_iterable(old[old_start:old_end]))
+            inserted = list(chain.from_iterable(new[new_start:new_end]))
+            # Tira os itens iguais (pela chave) do começo e do fim do trecho
+            head = 0
+            while (head < min(len(removed), len(inserted))
+                   and key(removed[head]) == key(inserted[head])):
+                head += 1
+            tail = 0
+            while (tail < min(len(removed), len(inserted)) - head
+                   and key(removed[-1 - tail]) == key(inserted[-1 - tail])):
+                tail += 1
+            if len(removed) > head + tail or len(inserted) > head + tail:
+                changes.append((
+                    self._sizes.prefix_sum(new_start) + head,
+                    removed[head:len(removed) - tail],
+                    inserted[head:len(inserted) - tail]
+                ))
+        return changes
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(index, slice):
+            return list(self)[index]
+        block_index, offset = self._locate(index)
+        return self._blocks[block_index][offset]
+
+    def __contains__(self, item: Any) -> bool:
+        try:
+            return self._key(item) in self._index()
+        except (AttributeError, TypeError):
+            return False
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self._blocks)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (BlockList, list, tuple)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BlockList({list(self)!r})"
+
+
+class BlockListSnapshot(Generic[T]):
+    """
+    Cópia imutável de uma BlockList, criada por `BlockList.snapshot`.
+
+    Os blocos são compartilhados com a sequência original, que os copia
+    antes de alterá-los: o snapshot pode ser lido em outra thread enquanto
+    a sequência continua sendo editada.
+    """
+    __slots__ = ("blocks", "_len", "_starts")
+
+    def __init__(self, blocks: List[List[T]], length: int) -> None:
+        self.blocks: Tuple[List[T], ...] = tuple(blocks)
+        self._len = length
+        self._starts: Optional[List[int]] = None  # Posição do início de cada bloco
+
+    def unshared_blocks(self, other: Optional["BlockListSnapshot"] = None) -> List[List[T]]:
+        """Retorna os blocos deste snapshot que `other` não compartilha."""
+        shared = set() if other is None else set(map(id, other.blocks))
+        return [block for block in self.blocks if id(block) not in shared]
+
+    def unshared_size(self, other: Optional["BlockListSnapshot"] = None) -> int:
+        """Estima os bytes dos blocos deste snapshot que `other` não compartilha."""
+        return sys.getsizeof(self.blocks) + sum(map(sys.getsizeof, self.unshared_blocks(other)))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(f"O index ({index}) está fora da sequência ({self._len}).")
+        if self._starts is None:
+            self._starts = [0, *accumulate(map(len, self.blocks))]
+        block_index = bisect_right(self._starts, index) - 1
+        return self.blocks[block_index][index - self._starts[block_index]]
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self.blocks)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"BlockListSnapshot({list(self)!r})"
@@ -62,9 +62,69 @@ MPV_LOGLEVELS_ERRORS = ("error", "fatal")
 LOGGING_SCOPES = {
     "playlist": "core.playlist",
     "player": "core.player",
-    "controller": "core.controller"
+    "controller": "core.controller",
+    "playlist_journal": "core.playlist_journal",
+    "playlist_sync": "core.playlist_sync",
+    "gapless": "core.gapless",
+    "library_scanner": "core.library_scanner",
+    "library_manifest": "core.library_manifest",
+    "library_watcher": "core.library_watcher",
+    "mpv_prober": "core.mpv_prober"
 }
 
 LOGGING_PATH_OUTPUT= "./log"
+LOGGING_QUEUE_SIZE = 10_000 # Registros na fila de log antes de começar a descartar
+LOGGING_BATCH_SIZE = 256 # Registros escritos no arquivo entre cada flush
+
+PLAYLIST_MODES = ("loop", "one_repeat", "shuffle")
+
+PLAYLIST_PATH = "./src/resources/playlist.json" # Snapshot da playlist
+LIBRARY_MANIFEST_PATH = "./src/resources/library.json" # Pastas varridas e o estado dos arquivos
+PLAYLIST_JOURNAL_PATH = "./src/resources/playlist.journal" # Alterações desde o snapshot
+JOURNAL_COMPACT_EVERY = 10_000 # Registros no journal antes de compactar em segundo plano
+
+LOADER_CHUNK_SIZE = 64 * 1024 # Bytes lidos do snapshot por vez no carregamento em segundo plano
+LOADER_BATCH_SIZE = 1_000 # Trilhas adicionadas à playlist por lote
+LOADER_READY_AHEAD = 2 # Trilhas após a atual necessárias para a playlist estar "pronta"
+
+# Extensões (em minúsculas) dos arquivos aceitos ao varrer pastas
+AUDIO_EXTENSIONS = frozenset((
+    ".mp3", ".flac", ".ogg", ".oga", ".opus", ".m4a", ".mp4", ".aac",
+    ".wav", ".wma", ".aiff", ".aif", ".alac", ".ape", ".wv", ".mka"
+))
+SCANNER_WORKERS = 8 # Threads que leem pastas ao mesmo tempo (o disco lento é o gargalo)
+SCANNER_BATCH_SIZE = 1_000 # Arquivos encontrados adicionados à playlist por lote
+METADATA_CHUNK_SIZE = 256 # Arquivos lidos por tarefa do pool de processos dos metadados
+# Opções das instâncias do mpv que só leem a duração e as tags dos arquivos
+PROBER_MPV_OPTIONS = {
+    "ao": "null",
+    "video": "no",
+    "pause": "yes",
+    "idle": "yes",
+    "config": "no",
+    "load-scripts": "no",
+    "ytdl": "no",
+    "input-default-bindings": "no",
+    "input-terminal": "no"
+}
+PROBER_WORKERS = 2 # Instâncias do mpv lendo arquivos ao mesmo tempo
+PROBER_QUEUE_SIZE = 64 # Arquivos esperando uma instância livre antes de `probe` bloquear
+PROBER_TIMEOUT = 10.0 # Segundos para um arquivo carregar antes de a instância ser recriada
+STREAM_READ_AHEAD = 4 * 1024 * 1024 # Bytes lidos adiante pelos streams do mpv (ReadAheadStream)
+STREAM_CHUNK_SIZE = 256 * 1024 # Bytes lidos por vez de um arquivo aberto como stream
+MMAP_PROTOCOL = "mmap" # Protocolo do mpv que lê os arquivos locais mapeados em memória (mmap://)
+WATCHER_SETTLE = 0.5 # Segundos sem eventos antes de aplicar as mudanças observadas
+WATCHER_MAX_DELAY = 5.0 # Segundos máximos entre o primeiro evento e a aplicação
+WATCHER_POLL_INTERVAL = 30.0 # Segundos entre as varreduras sem inotify
+
+SEARCH_RESULTS_LIMIT = 50 # Resultados retornados por padrão numa busca
+
+# Opções do mpv da reprodução sem pausas: abre a próxima trilha antes do fim
+# da atual e emenda o áudio das duas
+GAPLESS_MPV_OPTIONS = {
+    "prefetch-playlist": "yes",
+    "gapless-audio": "yes"
+}
 
-PLAYLIST_MODES = ("loop", "one_repeat")
+UNDO_MAX_STEPS = 200 # Edições da playlist que podem ser desfeitas
+UNDO_MEMORY_BUDGET = 32 * 2**20 # Bytes (estimados) guardados pelo histórico de desfazer/refazer
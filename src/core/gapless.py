@@ -0,0 +1,160 @@
+"""
+Esse módulo contém a classe GaplessQueue, que
+toca a Playlist sem pausas entre as trilhas,
+deixando a próxima trilha pré-carregada no mpv.
+"""
+from threading import RLock
+from typing import Any, List, Optional, Tuple
+from src.core.type_hints import PlaylistChange
+from src.core.config import LOGGING_SCOPES, GAPLESS_MPV_OPTIONS
+from src.utils.logging_utils import log
+from src.core.playlist import Playlist
+from src.core.playlist_sync import claim_mpv_playlist, release_mpv_playlist
+
+_LOGGING_SCOPE = "gapless"
+
+_Command = Tuple[Any, ...]
+
+
+class GaplessQueue:
+    """
+    Reprodução sem pausas (gapless) da Playlist.
+
+    A playlist interna do mpv fica com duas entradas: a trilha atual e a
+    próxima, dada por `Playlist.get_next` (que já segue o modo e a ordem
+    aleatória). Com `prefetch-playlist`, o mpv abre a próxima trilha antes
+    do fim da atual e, com `gapless-audio`, emenda o áudio das duas, sem
+    recriar o demuxer e o decoder na troca.
+
+    Quando o mpv passa para a trilha pré-carregada, a playlist avança
+    (`Playlist.next`), a entrada anterior sai e a nova próxima entra.
+    Qualquer alteração da playlist (edição, modo, ordem aleatória, trilha
+    atual) recalcula a próxima: se ela mudou, a entrada pré-carregada é
+    trocada, o que também descarta o que o mpv já tinha carregado dela.
+    No modo "one_repeat", não há próxima: o mpv repete a trilha (`loop-file`).
+
+    O avanço observado na thread de eventos do mpv altera a playlist com
+    `Playlist.lock`, como o PlaylistSync. Só um dos dois controla cada mpv:
+    criar um desliga o anterior (ver `claim_mpv_playlist`).
+    """
+
+    def __init__(self, player: Any, playlist: Playlist) -> None:
+        """Prepara a reprodução de `playlist` no `player` (um `mpv.MPV`), sem começá-la."""
+        self._player = player
+        self.playlist = playlist
+        self._lock = RLock()
+        self._pending = 0  # Comandos enviados sem resposta
+        self._stale = False  # Houve uma observação ignorada por comandos pendentes
+        self._current: Optional[str] = None  # Path da entrada 0 (tocando); None se parado
+        self._queued: Optional[str] = None  # Path da entrada 1 (pré-carregada)
+        self._active = False  # Entre `play` e a playlist ficar sem trilha atual
+        self._loop_file: Optional[str] = None  # Valor enviado de `loop-file`
+        self._advancing = False
+        self._attached = True
+        claim_mpv_playlist(player, self)
+        self._send([("set", name, value) for name, value in GAPLESS_MPV_OPTIONS.items()])
+        playlist.add_listener(self._on_change)
+        player.observe_property("playlist-pos", self._on_position)
+
+    def detach(self) -> None:
+        """Para de acompanhar a playlist (o mpv continua tocando o que tem)."""
+        with self._lock:
+            if not self._attached:
+                return
+            self._attached = False
+            self._active = False
+        self.playlist.remove_listener(self._on_change)
+        self._player.unobserve_property("playlist-pos", self._on_position)
+        release_mpv_playlist(self._player, self)
+
+    def play(self) -> None:
+        """Começa a tocar a trilha atual, com a próxima já na fila."""
+        with self._lock:
+            if not self._attached:
+                return
+            self._active = True
+            self._current = None
+            self._send(self._sync_commands())
+
+    def _send(self, commands: List[_Command]) -> None:
+        """Envia os comandos em sequência pelo `command_async`, sem esperar."""
+        if not commands:
+            return
+        with self._lock:
+            self._pending += len(commands)
+            for command in commands:
+                self._player.command_async(*command, callback=self._on_reply)
+
+    def _on_reply(self, error: Optional[Exception], result: Any) -> Any:
+        """Resposta de um comando (na thread de eventos do mpv)."""
+        if error is not None:
+            log("Falha num comando da fila gapless do mpv: %r", "error",
+                LOGGING_SCOPES[_LOGGING_SCOPE], args=(error,))
+        with self._lock:
+            self._pending -= 1
+            recheck = self._pending == 0 and self._stale
+            self._stale = False if recheck else self._stale
+        if recheck:  # Uma observação foi ignorada: lê a posição atual
+            self._on_position("playlist-pos", self._player.playlist_pos)
+        return result
+
+    def _upcoming(self) -> Optional[str]:
+        """Path da trilha que deve estar pré-carregada, ou None."""
+        if self.playlist.mode == "one_repeat":
+            return None
+        next_ = self.playlist.get_next()
+        return None if next_ is None else str(next_[0].path)
+
+    def _sync_commands(self) -> List[_Command]:
+        """
+        Comandos que deixam o mpv com a trilha atual da playlist e a próxima,
+        mexendo só no que mudou.
+        """
+        commands: List[_Command] = []
+        loop_file = "inf" if self.playlist.mode == "one_repeat" else "no"
+        if loop_file != self._loop_file:
+            commands.append(("set", "loop-file", loop_file))
+            self._loop_file = loop_file
+        track = self.playlist.get_current_track()
+        current = None if track is None else str(track.path)
+        if current is None:
+            commands.append(("stop",))
+            self._current = self._queued = None
+            self._active = False
+            return commands
+        if current != self._current:  # A trilha atual mudou fora do mpv: recomeça
+            commands.append(("loadfile", current, "replace"))
+            self._current, self._queued = current, None
+        upcoming = self._upcoming()
+        if upcoming != self._queued:  # Invalida a pré-carregada
+            if self._queued is not None:
+                commands.append(("playlist-remove", 1))
+            if upcoming is not None:
+                commands.append(("loadfile", upcoming, "append"))
+            self._queued = upcoming
+        return commands
+
+    def _on_change(self, change: PlaylistChange) -> None:
+        """Listener da playlist: atualiza a trilha atual e a pré-carregada no mpv."""
+        with self._lock:
+            if self._advancing or not self._active:
+                return
+            self._send(self._sync_commands())
+
+    def _on_position(self, _name: str, position: Optional[int]) -> None:
+        """Observador de `playlist-pos` (na thread de eventos do mpv)."""
+        # `Playlist.lock` antes do `_lock`, na mesma ordem do listener
+        with self.playlist.lock, self._lock:
+            if self._pending:
+                self._stale = True
+                return
+            if not self._active or position != 1 or self._queued is None:
+                return
+            # O mpv passou para a trilha pré-carregada: a playlist avança junto
+            self._advancing = True
+            try:
+                self.playlist.next(force_next=True)
+            finally:
+                self._advancing = False
+            self._current, self._queued = self._queued, None
+            self._send([("playlist-remove", 0)] + self._sync_commands())
@@ -0,0 +1,315 @@
+"""
+Esse módulo contém a classe LibraryManifest, que
+guarda o estado das pastas varridas (mtime das pastas,
+tamanho e mtime dos arquivos) para que uma nova varredura
+leia só o que mudou.
+"""
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from pathlib import Path
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Tuple
+from src.core.type_hints import FileStamp, LibraryDelta, PathType
+from src.core.config import (
+    LOGGING_SCOPES,
+    LIBRARY_MANIFEST_PATH,
+    AUDIO_EXTENSIONS,
+    SCANNER_WORKERS
+)
+from src.utils.files_utils import atomic_write
+from src.utils.logging_utils import log
+from src.utils.paths_utils import stat_directory
+from src.core.playlist import Playlist
+from src.core.track import Track
+
+_LOGGING_SCOPE = "library_manifest"
+
+_CHUNK_SIZE = 64 # Pastas visitadas por tarefa do pool
+
+# Uma pasta no manifesto: (mtime em ns, {arquivo: (tamanho, mtime em ns)}, subpastas)
+_Folder = Tuple[int, Dict[str, FileStamp], List[str]]
+
+# O resultado da visita a uma pasta: o novo registro (None se ela sumiu) e as
+# diferenças (adicionados, removidos com o tamanho e o mtime, modificados)
+_Visit = Tuple[Optional[_Folder], List[str], List[Tuple[str, FileStamp]], List[str]]
+
+
+class LibraryManifest:
+    """
+    Estado das pastas da biblioteca na última varredura, salvo em JSON.
+
+    Criar ou apagar uma entrada muda o mtime da pasta, então `rescan`
+    faz um `stat` por pasta e só lista de novo (e dá um `stat` em cada
+    arquivo de) as pastas com outro mtime: numa biblioteca sem mudanças,
+    o custo é proporcional ao número de pastas, não de arquivos. As pastas
+    são visitadas por nível, em paralelo, como no LibraryScanner.
+
+    Reescrever um arquivo no mesmo lugar não muda o mtime da pasta; para
+    encontrar essas alterações, `rescan(check_files=True)` confere também
+    os arquivos das pastas sem mudanças (custo proporcional aos arquivos).
+
+        manifest = LibraryManifest.load()
+        delta = manifest.rescan(["~/Música"])
+        apply_delta(playlist, delta)
+        manifest.save()
+    """
+
+    def __init__(
+        self,
+        path: PathType = LIBRARY_MANIFEST_PATH,
+        extensions: AbstractSet[str] = AUDIO_EXTENSIONS,
+        workers: int = SCANNER_WORKERS
+    ) -> None:
+        self.path = Path(path)
+        self.extensions = extensions
+        self.workers = workers
+        self.roots: List[str] = []
+        self._folders: Dict[str, _Folder] = {}
+
+    @classmethod
+    def load(cls, path: PathType = LIBRARY_MANIFEST_PATH, **kwargs) -> "LibraryManifest":
+        """
+        Carrega o manifesto salvo em `path`. Um arquivo inexistente ou
+        ilegível é um manifesto vazio (a próxima varredura lê tudo de novo).
+        """
+        manifest = cls(path, **kwargs)
+        try:
+            data = json.loads(manifest.path.read_text(encoding="utf-8"))
+            roots = [str(root) for root in data["roots"]]
+            folders: Dict[str, _Folder] = {
+                folder: (
+                    int(mtime),
+                    {name: (int(size), int(stamp)) for name, (size, stamp) in files.items()},
+                    [str(name) for name in subfolders]
+                )
+                for folder, (mtime, files, subfolders) in data["folders"].items()
+            }
+        except FileNotFoundError:
+            return manifest
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            log("O manifesto da biblioteca '%s' está corrompido e será refeito: %r", "warning",
+                LOGGING_SCOPES[_LOGGING_SCOPE], args=(manifest.path, error))
+            return manifest
+        manifest.roots, manifest._folders = roots, folders
+        return manifest
+
+    def save(self) -> None:
+        """Grava o manifesto em `path`, de forma atômica."""
+        data = {"roots": self.roots, "folders": self._folders}
+        atomic_write(
+            self.path,
+            lambda file: file.write(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        )
+
+    def __len__(self) -> int:
+        """Quantidade de arquivos no manifesto."""
+        return sum(len(files) for _, files, _ in self._folders.values())
+
+    def __iter__(self) -> Iterator[str]:
+        """Gera os paths de todos os arquivos do manifesto."""
+        for folder, (_, files, _) in self._folders.items():
+            for name in files:
+                yield os.path.join(folder, name)
+
+    @property
+    def folder_count(self) -> int:
+        """Quantidade de pastas no manifesto."""
+        return len(self._folders)
+
+    def iter_folders(self) -> Iterator[str]:
+        """Gera os paths de todas as pastas do manifesto."""
+        return iter(list(self._folders))
+
+    def rescan(
+        self,
+        roots: Optional[Iterable[PathType]] = None,
+        check_files: bool = False
+    ) -> LibraryDelta:
+        """
+        Varre `roots` (por padrão, as da última varredura) comparando com o
+        manifesto, que passa a refletir o estado atual, e retorna as diferenças.
+        Os arquivos de pastas que não estão mais em `roots` contam como removidos.
+        Uma pasta de `roots` que não existe é um erro (por exemplo, um disco
+        desmontado não deve esvaziar a biblioteca); o manifesto fica como estava.
+        """
+        if roots is not None:
+            roots = list(dict.fromkeys(
+                os.path.abspath(os.path.expanduser(root)) for root in roots))
+        else:
+            roots = self.roots
+        for root in roots:
+            if not os.path.isdir(root):
+                raise NotADirectoryError(f"A pasta '{root}' não existe.")
+        self.roots = roots
+        previous = self._folders
+        self._folders = {}
+        delta, removed = self._walk(roots, previous, check_files)
+        for path, (_, files, _) in previous.items():
+            if path not in self._folders:  # A pasta sumiu (ou saiu de `roots`)
+                removed.update((os.path.join(path, name), stamp) for name, stamp in files.items())
+        return self._finish(delta, removed)
+
+    def refresh(self, folders: Iterable[PathType], check_files: bool = True) -> LibraryDelta:
+        """
+        Visita de novo só as pastas dadas (e as subpastas novas delas),
+        por exemplo as apontadas por um observador do sistema de arquivos,
+        e retorna as diferenças. As pastas que sumiram saem do manifesto com
+        tudo o que está dentro delas. Por padrão, confere também os arquivos
+        das pastas sem mudanças (uma reescrita no lugar não muda a pasta).
+        """
+        paths = list(dict.fromkeys(os.path.abspath(folder) for folder in folders))
+        delta, removed = self._walk(paths, self._folders, check_files)
+        return self._finish(delta, removed)
+
+    def _walk(
+        self,
+        level: List[str],
+        previous: Dict[str, _Folder],
+        check_files: bool
+    ) -> Tuple[LibraryDelta, Dict[str, FileStamp]]:
+        """
+        Visita as pastas de `level`, nível por nível, registrando-as no
+        manifesto; desce para as subpastas que ainda não estão nele. Retorna
+        as diferenças e os arquivos removidos, com o tamanho e o mtime.
+        """
+        delta: LibraryDelta = {"added": [], "removed": [], "modified": [], "moved": []}
+        removed: Dict[str, FileStamp] = {}
+        folders = self._folders
+        missing: List[str] = []
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="library-manifest") as pool:
+            while level:
+                # Em pedaços: uma tarefa do pool por pasta custaria mais que o `stat`
+                chunks = [level[start:start + _CHUNK_SIZE]
+                          for start in range(0, len(level), _CHUNK_SIZE)]
+                visits = chain.from_iterable(pool.map(
+                    lambda chunk: [self._visit(path, previous.get(path), check_files)
+                                   for path in chunk],
+                    chunks
+                ))
+                next_level: List[str] = []
+                for path, (folder, added, gone, modified) in zip(level, visits):
+                    if folder is None:
+                        missing.append(path)
+                        continue
+                    old = folders.get(path)
+                    folders[path] = folder
+                    delta["added"] += added
+                    delta["modified"] += modified
+                    removed.update(gone)
+                    for name in folder[2]:
+                        subfolder = os.path.join(path, name)
+                        if subfolder not in folders:  # Nova, ou ainda não visitada nesta varredura
+                            next_level.append(subfolder)
+                    if old is not None and old[2] != folder[2]:
+                        missing += [os.path.join(path, name)
+                                    for name in set(old[2]).difference(folder[2])]
+                level = list(dict.fromkeys(next_level))
+        for path in missing:
+            self._forget(path, removed)
+        return delta, removed
+
+    def _forget(self, path: str, removed: Dict[str, FileStamp]) -> None:
+        """Tira do manifesto uma pasta que sumiu e tudo o que está dentro dela."""
+        prefix = os.path.join(path, "")
+        for folder in [folder for folder in self._folders
+                       if folder == path or folder.startswith(prefix)]:
+            _, files, _ = self._folders.pop(folder)
+            removed.update((os.path.join(folder, name), stamp) for name, stamp in files.items())
+
+    def _finish(self, delta: LibraryDelta, removed: Dict[str, FileStamp]) -> LibraryDelta:
+        """
+        Completa as diferenças: um arquivo removido e um adicionado com o
+        mesmo tamanho e mtime (que um `rename` mantém) viram um movido,
+        quando esse par é o único com esses valores.
+        """
+        removed_by_stamp: Dict[FileStamp, Optional[str]] = {}
+        for path, stamp in removed.items():
+            removed_by_stamp[stamp] = None if stamp in removed_by_stamp else path
+        added_by_stamp: Dict[FileStamp, Optional[str]] = {}
+        for path in delta["added"] if removed else ():
+            folder, name = os.path.split(path)
+            stamp = self._folders[folder][1][name]
+            added_by_stamp[stamp] = None if stamp in added_by_stamp else path
+        moved = {
+            removed_by_stamp[stamp]: new_path
+            for stamp, new_path in added_by_stamp.items()
+            if new_path is not None and removed_by_stamp.get(stamp) is not None
+        }
+        if moved:
+            targets = set(moved.values())
+            delta["added"] = [path for path in delta["added"] if path not in targets]
+        delta["removed"] = [path for path in removed if path not in moved]
+        delta["moved"] = list(moved.items())
+        return delta
+
+    def _visit(self, path: str, previous: Optional[_Folder], check_files: bool) -> _Visit:
+        """Compara uma pasta com o registro anterior (numa thread do pool)."""
+        try:
+            mtime = os.stat(path).st_mtime_ns  # Antes de listar: uma mudança no meio fica para a próxima
+            if previous is not None and previous[0] == mtime:
+                if not check_files:
+                    return previous, [], [], []
+                return self._check_files(path, previous)
+            files, subfolders = stat_directory(path, self.extensions)
+        except (FileNotFoundError, NotADirectoryError):
+            return None, [], [], []
+        except OSError as error:  # Sem permissão, por exemplo: mantém o registro anterior
+            log("Não foi possível ler a pasta '%s': %s", "warning",
+                LOGGING_SCOPES[_LOGGING_SCOPE], args=(path, error))
+            return previous, [], [], []
+        old_files = {} if previous is None else previous[1]
+        added, modified = [], []
+        for name, stamp in files.items():
+            old = old_files.get(name)
+            if old is None:
+                added.append(os.path.join(path, name))
+            elif old != stamp:
+                modified.append(os.path.join(path, name))
+        removed = [(os.path.join(path, name), stamp)
+                   for name, stamp in old_files.items() if name not in files]
+        return (mtime, files, subfolders), sorted(added), removed, modified
+
+    def _check_files(self, path: str, previous: _Folder) -> _Visit:
+        """Confere o tamanho e o mtime dos arquivos de uma pasta sem mudanças."""
+        mtime, old_files, subfolders = previous
+        files: Dict[str, FileStamp] = {}
+        removed, modified = [], []
+        for name, old in old_files.items():
+            file_path = os.path.join(path, name)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                removed.append((file_path, old))
+                continue
+            files[name] = (stat.st_size, stat.st_mtime_ns)
+            if files[name] != old:
+                modified.append(file_path)
+        return (mtime, files, subfolders), [], removed, modified
+
+
+def apply_delta(playlist: Playlist, delta: LibraryDelta) -> List[Track]:
+    """
+    Aplica as diferenças de uma varredura na playlist: remove as trilhas
+    dos arquivos que sumiram, troca o path das movidas (na mesma posição,
+    mantendo os dados e a trilha atual) e adiciona as novas, no fim. Os
+    modificados continuam onde estão. Retorna as trilhas novas rejeitadas
+    (já existentes).
+    """
+    for path in delta["removed"]:
+        track = Track(Path(path))
+        if playlist.has_track(track):
+            playlist.remove(track)
+    for old_path, new_path in delta["moved"]:
+        track = Track(Path(old_path))
+        if not playlist.has_track(track):
+            continue
+        index = playlist.index(track)
+        was_current = playlist.current_index == index
+        old = playlist.pop(index)
+        moved = Track(Path(new_path), old.source, title=old.title, duration=old.duration)
+        if not playlist.has_track(moved):
+            playlist.insert(index, moved)
+            if was_current:
+                playlist.current_index = index
+    return playlist.add_many(Track(Path(path)) for path in delta["added"])
@@ -0,0 +1,183 @@
+"""
+Esse módulo contém a classe LibraryScanner, que
+varre pastas em paralelo e adiciona os arquivos
+de áudio encontrados à playlist em lotes.
+"""
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from queue import SimpleQueue
+from threading import Event, Thread, current_thread
+from typing import AbstractSet, Callable, Iterable, List, Optional, Tuple, Union
+from src.core.type_hints import PathType, ScanProgress
+from src.core.config import (
+    LOGGING_SCOPES,
+    AUDIO_EXTENSIONS,
+    SCANNER_WORKERS,
+    SCANNER_BATCH_SIZE
+)
+from src.utils.logging_utils import log
+from src.utils.paths_utils import scan_directory
+from src.core.audio_metadata import fill_metadata
+from src.core.playlist import Playlist
+from src.core.track import Track
+
+_LOGGING_SCOPE = "library_scanner"
+
+# (pasta, arquivos de áudio, subpastas, erro da leitura)
+_Result = Tuple[str, List[str], List[str], Optional[OSError]]
+
+
+class LibraryScanner:
+    """
+    Varre uma ou mais pastas (e as subpastas) numa thread de fundo e
+    adiciona os arquivos de áudio encontrados à playlist.
+
+    Cada pasta é lida com `os.scandir` numa das `workers` threads, que
+    liberam o GIL enquanto esperam o disco; as subpastas encontradas
+    entram na fila assim que a pasta termina, então várias leituras
+    ficam em andamento ao mesmo tempo. Os arquivos vão para a playlist
+    em lotes de `batch_size` (um `add_many` por lote), ordenados dentro
+    de cada pasta; a ordem entre as pastas é a ordem em que terminam.
+
+        scanner = LibraryScanner("~/Música", playlist).start()
+        scanner.wait()
+
+    Com `metadata`, o título e a duração de cada lote são lidos dos
+    cabeçalhos dos arquivos (`fill_metadata`) antes de ele entrar na
+    playlist, no `executor` dado (um `ProcessPoolExecutor`, por exemplo).
+
+    `on_progress` recebe o progresso (na thread da varredura) a cada lote
+    e no fim. Durante a varredura, as edições da playlist devem ser feitas
+    com `lock`, que é o `Playlist.lock` da playlist (o mesmo do
+    PlaylistLoader e das observações do mpv). Uma pasta de `roots` que não pode ser lida é um erro,
+    repassado por `wait`; uma subpasta ilegível é só registrada no log.
+    """
+
+    def __init__(
+        self,
+        roots: Union[PathType, Iterable[PathType]],
+        playlist: Optional[Playlist] = None,
+        workers: int = SCANNER_WORKERS,
+        batch_size: int = SCANNER_BATCH_SIZE,
+        extensions: AbstractSet[str] = AUDIO_EXTENSIONS,
+        on_progress: Optional[Callable[[ScanProgress], None]] = None,
+        metadata: bool = False,
+        executor: Optional[Executor] = None
+    ) -> None:
+        if isinstance(roots, (str, Path)):
+            roots = (roots,)
+        self.roots = [os.path.abspath(os.path.expanduser(root)) for root in roots]
+        self.playlist = Playlist() if playlist is None else playlist
+        self.workers = workers
+        self.batch_size = batch_size
+        self.extensions = extensions
+        self.on_progress = on_progress
+        self.metadata = metadata
+        self.executor = executor
+        self.finished = Event()
+        self.lock = self.playlist.lock  # Tomado a cada lote adicionado
+        self.error: Optional[Exception] = None
+        self._cancelled = Event()
+        self._progress: ScanProgress = {
+            "directories": 0, "pending": 0, "files": 0, "added": 0, "errors": 0
+        }
+        self._thread = Thread(target=self._run, name="library-scanner", daemon=True)
+
+    @property
+    def progress(self) -> ScanProgress:
+        """Cópia do progresso atual da varredura."""
+        return ScanProgress(**self._progress)
+
+    def start(self) -> "LibraryScanner":
+        """Começa a varredura em segundo plano."""
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """
+        Interrompe a varredura: as pastas ainda não lidas são descartadas
+        e os arquivos que ainda não foram adicionados também.
+        """
+        self._cancelled.set()
+        if self._thread.is_alive() and current_thread() is not self._thread:
+            self._thread.join()
+
+    @property
+    def cancelled(self) -> bool:
+        """Verifica se a varredura foi cancelada."""
+        return self._cancelled.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Espera a varredura terminar. Repassa o erro da varredura."""
+        finished = self.finished.wait(timeout)
+        if self.error is not None:
+            raise self.error
+        return finished
+
+    def _scan(self, path: str, results: "SimpleQueue[_Result]") -> None:
+        """Lê uma pasta (numa thread do pool) e coloca o resultado em `results`."""
+        if self._cancelled.is_set():
+            results.put((path, [], [], None))
+            return
+        try:
+            files, folders = scan_directory(path, self.extensions)
+        except OSError as error:
+            results.put((path, [], [], error))
+            return
+        results.put((path, files, folders, None))
+
+    def _run(self) -> None:
+        results: "SimpleQueue[_Result]" = SimpleQueue()
+        progress = self._progress
+        batch: List[Track] = []
+        pool = ThreadPoolExecutor(self.workers, thread_name_prefix="library-scanner")
+        try:
+            for root in self.roots:
+                pool.submit(self._scan, root, results)
+            progress["pending"] = len(self.roots)
+            while progress["pending"] and not self._cancelled.is_set():
+                path, files, folders, error = results.get()
+                if error is not None:
+                    self._scan_failed(path, error)
+                for folder in folders:
+                    pool.submit(self._scan, folder, results)
+                progress["pending"] += len(folders) - 1
+                progress["directories"] += 1
+                progress["files"] += len(files)
+                batch.extend(Track(Path(file)) for file in files)
+                if len(batch) >= self.batch_size:
+                    self._add_batch(batch)
+                    batch = []
+            if not self._cancelled.is_set():
+                self._add_batch(batch)
+        except Exception as error:  # pylint: disable=broad-except
+            self.error = error
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            try:
+                if self.on_progress is not None:
+                    self.on_progress(self.progress)
+            except Exception as error:  # pylint: disable=broad-except
+                self.error = error if self.error is None else self.error
+            self.finished.set()
+
+    def _scan_failed(self, path: str, error: OSError) -> None:
+        """Trata uma pasta que não pôde ser lida."""
+        self._progress["errors"] += 1
+        if path in self.roots:
+            self.error = error if self.error is None else self.error
+            return
+        log("Não foi possível ler a pasta '%s': %s", "warning",
+            LOGGING_SCOPES[_LOGGING_SCOPE], args=(path, error))
+
+    def _add_batch(self, batch: List[Track]) -> None:
+        if not batch:
+            return
+        if self.metadata:
+            fill_metadata(batch, self.executor)
+        with self.lock:
+            rejected = self.playlist.add_many(batch)
+        self._progress["added"] += len(batch) - len(rejected)
+        if self.on_progress is not None:
+            self.on_progress(self.progress)
@@ -0,0 +1,309 @@
+"""
+Esse módulo contém a classe LibraryWatcher, que
+acompanha as mudanças nas pastas da biblioteca
+(com inotify, no Linux, ou varreduras periódicas)
+e as aplica no manifesto e na playlist.
+"""
+import ctypes
+import errno
+import os
+import select
+import sys
+from struct import Struct
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Callable, Dict, Iterator, Optional, Set, Tuple
+from src.core.type_hints import LibraryDelta
+from src.core.config import (
+    LOGGING_SCOPES,
+    WATCHER_SETTLE,
+    WATCHER_MAX_DELAY,
+    WATCHER_POLL_INTERVAL
+)
+from src.utils.logging_utils import log
+from src.core.library_manifest import LibraryManifest, apply_delta
+from src.core.playlist import Playlist
+
+_LOGGING_SCOPE = "library_watcher"
+
+# Constantes de <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_UNMOUNT = 0x00002000
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+
+_WATCH_MASK = (
+    _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE |
+    _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+)
+
+_EVENT = Struct("iIII")  # struct inotify_event: wd, mask, cookie, len (seguido do nome)
+_READ_SIZE = 64 * 1024
+
+
+class _Inotify:
+    """Acesso mínimo ao inotify do Linux, pela libc (ctypes)."""
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self._rm_watch = libc.inotify_rm_watch
+        self._rm_watch.argtypes = (ctypes.c_int, ctypes.c_int)
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            number = ctypes.get_errno()
+            raise OSError(number, os.strerror(number))
+
+    def add_watch(self, path: str) -> int:
+        """Observa uma pasta e retorna o descritor do observador."""
+        watch = self._add_watch(self.fd, os.fsencode(path), _WATCH_MASK)
+        if watch < 0:
+            number = ctypes.get_errno()
+            raise OSError(number, os.strerror(number), path)
+        return watch
+
+    def rm_watch(self, watch: int) -> None:
+        """Para de observar (ignora um observador que o kernel já removeu)."""
+        self._rm_watch(self.fd, watch)
+
+    def read(self) -> Iterator[Tuple[int, int, str]]:
+        """Gera `(observador, máscara, nome)` para os eventos disponíveis, sem bloquear."""
+        while True:
+            try:
+                data = os.read(self.fd, _READ_SIZE)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset < len(data):
+                watch, mask, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                yield watch, mask, name
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class LibraryWatcher:
+    """
+    Mantém o manifesto da biblioteca (e a playlist) em dia com as
+    mudanças nas pastas, sem varreduras completas periódicas.
+
+    No Linux, cada pasta do manifesto é observada com inotify e a thread
+    do observador fica bloqueada no `select` enquanto nada acontece (sem
+    custo de CPU parado). As pastas com eventos se acumulam até `settle`
+    segundos sem eventos novos (ou `max_delay` desde o primeiro), e só
+    elas são visitadas de novo (`LibraryManifest.refresh`): a cópia de um
+    álbum inteiro vira uma única diferença. Sem inotify (outro sistema,
+    ou o limite de observadores atingido), o observador faz uma nova
+    varredura (`LibraryManifest.rescan`) a cada `poll_interval` segundos.
+
+    As diferenças são aplicadas na playlist com `apply_delta` (tomando
+    `lock`, que é o `Playlist.lock` da playlist, o mesmo do PlaylistLoader,
+    do LibraryScanner e das observações do mpv): as trilhas de arquivos movidos mudam de path no mesmo lugar
+    e as de arquivos apagados saem, e os listeners da playlist (o índice
+    de busca, o journal) acompanham. `on_delta` recebe cada diferença na
+    thread do observador. O manifesto não é salvo automaticamente.
+
+        watcher = LibraryWatcher(LibraryManifest.load(), playlist).start()
+        ...
+        watcher.stop()
+        watcher.manifest.save()
+    """
+
+    def __init__(
+        self,
+        manifest: LibraryManifest,
+        playlist: Optional[Playlist] = None,
+        on_delta: Optional[Callable[[LibraryDelta], None]] = None,
+        settle: float = WATCHER_SETTLE,
+        max_delay: float = WATCHER_MAX_DELAY,
+        poll_interval: float = WATCHER_POLL_INTERVAL,
+        use_inotify: bool = True
+    ) -> None:
+        self.manifest = manifest
+        self.playlist = playlist
+        self.on_delta = on_delta
+        self.settle = settle
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        # Tomado a cada diferença aplicada: o `Playlist.lock`, se há uma playlist
+        self.lock = Lock() if playlist is None else playlist.lock
+        self.ready = Event()  # Sinalizado depois da varredura inicial
+        self.error: Optional[Exception] = None
+        self._use_inotify = use_inotify and sys.platform.startswith("linux")
+        self._inotify: Optional[_Inotify] = None
+        self._watches: Dict[int, str] = {}  # Observador -> pasta
+        self._watched: Dict[str, int] = {}  # Pasta -> observador
+        self._stopping = Event()
+        self._stop_lock = Lock()
+        self._wake_read, self._wake_write = os.pipe()
+        self._thread = Thread(target=self._run, name="library-watcher", daemon=True)
+
+    @property
+    def backend(self) -> str:
+        """"inotify" ou "polling", conforme o que está em uso."""
+        return "inotify" if self._inotify is not None else "polling"
+
+    def start(self) -> "LibraryWatcher":
+        """
+        Começa a observar em segundo plano. Antes, uma nova varredura
+        aplica o que mudou enquanto o programa estava fechado.
+        """
+        self._thread.start()
+        return self
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Espera a varredura inicial. Repassa o erro do observador."""
+        ready = self.ready.wait(timeout)
+        if self.error is not None:
+            raise self.error
+        return ready
+
+    def stop(self) -> None:
+        """
+        Para de observar, sem aplicar as mudanças ainda acumuladas.
+        Chamar de novo não faz nada.
+        """
+        with self._stop_lock:
+            if self._stopping.is_set():
+                return
+            self._stopping.set()
+        os.write(self._wake_write, b"\0")
+        if self._thread.is_alive():
+            self._thread.join()
+        os.close(self._wake_read)
+        os.close(self._wake_write)
+
+    def _run(self) -> None:
+        try:
+            self._apply(self.manifest.rescan())
+            if self._use_inotify:
+                self._start_inotify()
+            self.ready.set()
+            if self._inotify is not None:
+                self._watch_loop()
+            else:
+                self._poll_loop()
+        except Exception as error:  # pylint: disable=broad-except
+            self.error = error
+        finally:
+            if self._inotify is not None:
+                self._inotify.close()
+            self.ready.set()
+
+    def _apply(self, delta: LibraryDelta) -> None:
+        """Aplica uma diferença na playlist e avisa `on_delta`, se houve mudanças."""
+        if not any(delta.values()):
+            return
+        if self.playlist is not None:
+            with self.lock:
+                apply_delta(self.playlist, delta)
+        if self.on_delta is not None:
+            self.on_delta(delta)
+
+    def _start_inotify(self) -> None:
+        """Começa a observar as pastas do manifesto; sem inotify, fica na varredura periódica."""
+        try:
+            self._inotify = _Inotify()
+            self._sync_watches()
+        except (OSError, AttributeError) as error:  # AttributeError: libc sem inotify
+            log("inotify indisponível (%s), usando varreduras a cada %.0fs", "warning",
+                LOGGING_SCOPES[_LOGGING_SCOPE], args=(error, self.poll_interval))
+            if self._inotify is not None:
+                self._inotify.close()
+            self._inotify = None
+            self._watches.clear()
+            self._watched.clear()
+            return
+        # Mudanças entre a varredura inicial e os observadores
+        self._apply(self.manifest.rescan())
+        self._sync_watches()
+
+    def _sync_watches(self) -> None:
+        """Observa as pastas novas do manifesto e esquece as que saíram dele."""
+        inotify = self._inotify
+        assert inotify is not None
+        folders = set(self.manifest.iter_folders())
+        for folder in [folder for folder in self._watched if folder not in folders]:
+            watch = self._watched.pop(folder)
+            # O observador pode já estar com outro path (a mesma pasta, movida)
+            if self._watches.get(watch) == folder:
+                del self._watches[watch]
+                inotify.rm_watch(watch)
+        for folder in folders.difference(self._watched):
+            try:
+                watch = inotify.add_watch(folder)
+            except OSError as error:
+                if error.errno in (errno.ENOENT, errno.ENOTDIR):  # Sumiu: o próximo evento trata
+                    continue
+                raise  # ENOSPC: o limite de observadores (fs.inotify.max_user_watches)
+            self._watches[watch] = folder
+            self._watched[folder] = watch
+
+    def _watch_loop(self) -> None:
+        inotify = self._inotify
+        assert inotify is not None
+        dirty: Set[str] = set()
+        overflow = unmounted = False
+        first = last = 0.0
+        while not self._stopping.is_set():
+            timeout = None
+            if dirty or overflow:
+                timeout = max(0.0, min(last + self.settle, first + self.max_delay) - monotonic())
+            readable, _, _ = select.select([inotify.fd, self._wake_read], [], [], timeout)
+            if self._wake_read in readable:
+                return
+            if readable:
+                for watch, mask, _ in inotify.read():
+                    overflow = overflow or bool(mask & _IN_Q_OVERFLOW)  # Eventos perdidos
+                    unmounted = unmounted or bool(mask & _IN_UNMOUNT)
+                    folder = self._watches.get(watch)
+                    if folder is None:
+                        continue
+                    if mask & _IN_IGNORED:  # O kernel removeu o observador
+                        del self._watches[watch]
+                        if self._watched.get(folder) == watch:
+                            del self._watched[folder]
+                    if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED):
+                        dirty.add(os.path.dirname(folder))  # O pai vê a pasta sumir
+                    dirty.add(folder)
+                last = monotonic()
+                first = first or last
+                if last < first + self.max_delay:
+                    continue
+                # Eventos sem parar (uma cópia longa): `max_delay` desde o primeiro, aplica já
+            # `settle` sem eventos (ou `max_delay` desde o primeiro): aplica
+            if unmounted:
+                # Um disco desmontado não deve esvaziar a biblioteca (como em `rescan`)
+                log("Uma pasta da biblioteca foi desmontada; as mudanças foram ignoradas", "warning",
+                    LOGGING_SCOPES[_LOGGING_SCOPE])
+                delta = None
+            elif overflow:
+                delta = self.manifest.rescan()
+            else:
+                delta = self.manifest.refresh(
+                    folder for folder in dirty
+                    if folder in self._watched or os.path.dirname(folder) in self._watched
+                )
+            dirty.clear()
+            overflow = unmounted = False
+            first = 0.0
+            self._sync_watches()
+            if delta is not None:
+                self._apply(delta)
+
+    def _poll_loop(self) -> None:
+        while not self._stopping.wait(self.poll_interval):
+            self._apply(self.manifest.rescan())
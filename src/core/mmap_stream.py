@@ -0,0 +1,109 @@
+"""
+Esse módulo contém a classe MmapStream e o protocolo
+`mmap://` do mpv, que lê os arquivos locais por um
+mapeamento em memória, com dicas de leitura adiante.
+"""
+import mmap
+import os
+from typing import Any, Optional
+from src.core.type_hints import PathType
+from src.core.config import MMAP_PROTOCOL, STREAM_READ_AHEAD
+
+_PREFIX = f"{MMAP_PROTOCOL}://"
+
+
+def mmap_uri(path: PathType) -> str:
+    """URI `mmap://` de um arquivo local (o path absoluto, sem codificação)."""
+    return _PREFIX + os.path.abspath(path)
+
+
+class MmapStream:
+    """
+    Stream do mpv (`read`, `readinto`, `seek`, `size`, `close`) servido
+    direto de um arquivo mapeado em memória.
+
+    `readinto` copia do mapeamento para o buffer do mpv com uma cópia
+    só (sem `bytes` intermediários), e `read` retorna uma fatia
+    (`memoryview`) do próprio mapeamento. O mapeamento é marcado como
+    sequencial (`MADV_SEQUENTIAL`) e, a cada metade da janela lida, os
+    próximos `read_ahead` bytes são pedidos ao kernel (`MADV_WILLNEED`),
+    que os lê em segundo plano enquanto o mpv decodifica o que já tem.
+    """
+
+    def __init__(self, path: PathType, read_ahead: int = STREAM_READ_AHEAD) -> None:
+        self.read_ahead = read_ahead
+        self._position = 0
+        self._advised = 0  # Fim da última janela pedida ao kernel
+        self._map: Optional[mmap.mmap] = None
+        with open(path, "rb") as file:
+            self.size = os.fstat(file.fileno()).st_size
+            if self.size:  # Um arquivo vazio não pode ser mapeado
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map) if self._map is not None else memoryview(b"")
+        if self._map is not None and hasattr(mmap, "MADV_SEQUENTIAL"):
+            self._map.madvise(mmap.MADV_SEQUENTIAL)
+
+    def readinto(self, buffer: Any) -> int:
+        """Copia os próximos bytes para `buffer` e retorna quantos; 0 é o fim."""
+        target = memoryview(buffer).cast("B")
+        count = min(len(target), self.size - self._position)
+        if count <= 0:
+            return 0
+        self._advise()
+        target[:count] = self._view[self._position:self._position + count]
+        self._position += count
+        return count
+
+    def read(self, size: int) -> memoryview:
+        """Os próximos `size` bytes, como uma fatia do mapeamento (sem cópia)."""
+        count = max(0, min(size, self.size - self._position))
+        if count:
+            self._advise()
+        data = self._view[self._position:self._position + count]
+        self._position += count
+        return data
+
+    def seek(self, offset: int) -> int:
+        """Vai para `offset` (limitado ao tamanho do arquivo) e retorna o novo offset."""
+        self._position = max(0, min(offset, self.size))
+        self._advised = 0  # A próxima leitura pede a janela a partir daqui
+        return self._position
+
+    def close(self) -> None:
+        self._view.release()
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:  # Ainda há fatias de `read` em uso: fecha quando sumirem
+                pass
+            self._map = None
+
+    def _advise(self) -> None:
+        """Pede ao kernel a próxima janela, quando a leitura passa da metade da anterior."""
+        if self._map is None or not hasattr(mmap, "MADV_WILLNEED"):
+            return
+        if self._position < self._advised - self.read_ahead // 2:
+            return
+        start = self._position - self._position % mmap.PAGESIZE  # O início deve ser alinhado
+        length = min(self.read_ahead, self.size - start)
+        self._map.madvise(mmap.MADV_WILLNEED, start, length)
+        self._advised = start + length
+
+
+def open_mmap_stream(uri: str) -> MmapStream:
+    """
+    Abre o stream de um URI `mmap://` (para `register_stream_protocol`).
+    Um arquivo que não pode ser aberto é um ValueError, que o mpv trata
+    como falha ao carregar.
+    """
+    if not uri.startswith(_PREFIX):
+        raise ValueError(uri)
+    try:
+        return MmapStream(uri[len(_PREFIX):])
+    except OSError as error:
+        raise ValueError(f"{uri}: {error}") from error
+
+
+def register_mmap_protocol(player: Any) -> None:
+    """Registra o protocolo `mmap://` num `mpv.MPV`."""
+    player.register_stream_protocol(MMAP_PROTOCOL, open_mmap_stream)
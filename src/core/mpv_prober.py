@@ -0,0 +1,226 @@
+"""
+Esse módulo contém a classe MpvProber, que lê os
+metadados dos arquivos que o leitor de cabeçalhos
+não entende com instâncias do mpv sem áudio nem vídeo,
+criadas uma vez e reutilizadas para vários arquivos.
+"""
+import os
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from queue import Queue
+from threading import Event, Thread
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+from src.core.type_hints import AudioMetadata, PathType
+from src.core.config import (
+    LOGGING_SCOPES,
+    PROBER_MPV_OPTIONS,
+    PROBER_WORKERS,
+    PROBER_QUEUE_SIZE,
+    PROBER_TIMEOUT
+)
+from src.utils.logging_utils import log
+from src.core.audio_metadata import empty_metadata
+from src.core.track import Track
+
+_LOGGING_SCOPE = "mpv_prober"
+
+_END_FILE_ERROR = 4  # MpvEventEndFile.ERROR: o arquivo não pôde ser aberto
+
+_Job = Optional[Tuple[PathType, "Future[AudioMetadata]"]]
+
+
+def _default_factory() -> Any:
+    # Importado aqui para que o módulo não dependa da libmpv só por ser importado
+    from src.mpv import mpv  # pylint: disable=import-outside-toplevel
+    return mpv.MPV(**PROBER_MPV_OPTIONS)
+
+
+class _Probe:
+    """Uma instância do mpv que abre um arquivo por vez e lê os metadados."""
+
+    def __init__(self, factory: Callable[[], Any], timeout: float) -> None:
+        self.player = factory()
+        self.timeout = timeout
+        self._loaded = Event()  # Sinalizado quando o arquivo abriu ou falhou
+        self._failed = False
+        self._closed = False
+        self.player.event_callback("file-loaded")(self._on_loaded)
+        self.player.event_callback("end-file")(self._on_end_file)
+
+    def _on_loaded(self, _event: Any) -> None:
+        self._loaded.set()
+
+    def _on_end_file(self, event: Any) -> None:
+        # O `stop` do arquivo anterior também gera um end-file (ABORTED), ignorado
+        if event.data.reason == _END_FILE_ERROR:
+            self._fail()
+
+    def _on_loadfile(self, error: Optional[Exception], _result: Any) -> None:
+        if error is not None:
+            self._fail()
+
+    def _fail(self) -> None:
+        self._failed = True
+        self._loaded.set()
+
+    def read(self, path: PathType) -> Optional[AudioMetadata]:
+        """
+        Lê os metadados de um arquivo. Retorna None se o mpv não abrir o
+        arquivo ou não responder aos pedidos das propriedades a tempo.
+        """
+        self._loaded.clear()
+        self._failed = False
+        self.player.command_async("loadfile", os.fspath(path), "replace", callback=self._on_loadfile)
+        if not self._loaded.wait(self.timeout):
+            return None
+        if self._failed:
+            return empty_metadata()
+        # Os dois pedidos vão juntos: uma só ida e volta até a thread do mpv
+        duration = self.player.get_property_async("duration")
+        tags = self.player.get_property_async("metadata")
+        self.player.command_async("stop")  # Libera o arquivo sem esperar a resposta
+        try:
+            value = duration.result(self.timeout)
+            tags_value = tags.result(self.timeout)
+        except FutureTimeoutError:  # A instância não responde: quem chama a recria
+            return None
+        metadata = empty_metadata()
+        metadata["duration"] = float(value) if isinstance(value, (int, float)) and value > 0 else None
+        fields = {str(key).lower(): value for key, value in (tags_value or {}).items()}
+        for field in ("title", "artist", "album"):
+            value = fields.get(field)
+            metadata[field] = value if isinstance(value, str) and value else None
+        return metadata
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self.player.terminate()
+
+
+class MpvProber:
+    """
+    Lê os metadados (título, artista, álbum e duração) dos arquivos com o
+    próprio mpv, para os formatos que `audio_metadata` não decodifica.
+
+    Criar uma instância do mpv custa muito mais do que ler um arquivo, então
+    cada uma das `workers` threads cria a sua instância (sem áudio, sem
+    vídeo, pausada: `PROBER_MPV_OPTIONS`) em `start` e a reutiliza: para
+    cada arquivo, `loadfile` assíncrono, espera pelo `file-loaded`, pede a
+    duração e as tags juntas (`get_property_async`) e `stop`. Um arquivo que
+    não abre rende metadados vazios; um que não carrega (ou cujas
+    propriedades não chegam) em `timeout` segundos também, e a instância
+    presa é substituída por outra.
+
+    Os arquivos esperam numa fila de até `queue_size` itens: `probe` bloqueia
+    quando ela está cheia, então quem gera os paths não passa muito à frente.
+
+        with MpvProber().start() as prober:
+            for metadata in prober.probe_many(paths):
+                ...
+
+    `factory` cria as instâncias (por padrão, `mpv.MPV(**PROBER_MPV_OPTIONS)`).
+    """
+
+    def __init__(
+        self,
+        workers: int = PROBER_WORKERS,
+        queue_size: int = PROBER_QUEUE_SIZE,
+        timeout: float = PROBER_TIMEOUT,
+        factory: Optional[Callable[[], Any]] = None
+    ) -> None:
+        self.workers = workers
+        self.timeout = timeout
+        self._factory = _default_factory if factory is None else factory
+        self._jobs: "Queue[_Job]" = Queue(queue_size)
+        self._threads: List[Thread] = []
+
+    def start(self) -> "MpvProber":
+        """
+        Cria as instâncias do mpv e começa a atender os pedidos. As instâncias
+        são criadas aqui (e não nas threads) para que uma falha apareça já.
+        """
+        probes: List[_Probe] = []
+        try:
+            for _ in range(self.workers):
+                probes.append(_Probe(self._factory, self.timeout))
+        except Exception:
+            for probe in probes:
+                probe.close()
+            raise
+        for index, probe in enumerate(probes):
+            thread = Thread(target=self._work, args=(probe,), name=f"mpv-prober-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def probe(self, path: PathType) -> "Future[AudioMetadata]":
+        """Pede os metadados de um arquivo. Bloqueia enquanto a fila estiver cheia."""
+        future: "Future[AudioMetadata]" = Future()
+        self._jobs.put((path, future))
+        return future
+
+    def probe_many(self, paths: Iterable[PathType]) -> Iterator[AudioMetadata]:
+        """Gera os metadados dos arquivos, na mesma ordem, com vários em andamento."""
+        window: Deque["Future[AudioMetadata]"] = deque()
+        limit = self._jobs.maxsize + self.workers
+        for path in paths:
+            window.append(self.probe(path))
+            if len(window) > limit:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+    def fill_metadata(self, tracks: List[Track]) -> None:
+        """
+        Preenche o título e a duração das trilhas locais que ainda não os têm
+        (depois de `audio_metadata.fill_metadata`, só sobram os formatos que
+        o leitor de cabeçalhos não conhece).
+        """
+        pending = [
+            track for track in tracks
+            if track.source == "local" and (track.title is None or track.duration is None)
+        ]
+        for track, fields in zip(pending, self.probe_many(track.path for track in pending)):
+            if track.title is None:
+                track.title = fields["title"]
+            if track.duration is None:
+                track.duration = fields["duration"]
+
+    def close(self) -> None:
+        """Termina os pedidos já na fila e fecha as instâncias do mpv."""
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+
+    def __enter__(self) -> "MpvProber":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def _work(self, probe: _Probe) -> None:
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    return
+                path, future = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    metadata = probe.read(path)
+                    if metadata is None:
+                        log("O mpv não abriu '%s' em %.0fs; recriando a instância", "warning",
+                            LOGGING_SCOPES[_LOGGING_SCOPE], args=(path, self.timeout))
+                        probe.close()
+                        probe = _Probe(self._factory, self.timeout)
+                        metadata = empty_metadata()
+                except Exception as error:  # pylint: disable=broad-except
+                    future.set_exception(error)
+                else:
+                    future.set_result(metadata)
+        finally:
+            probe.close()
@@ -17,6 +17,10 @@ from src.core.config import (
     MPV_LOGLEVELS_ERRORS
 )
 from src.exceptions.player_exception import InvalidAudioChannelError
+from src.core.playlist import Playlist
+from src.core.playlist_sync import PlaylistSync
+from src.core.gapless import GaplessQueue
+from src.core.mmap_stream import mmap_uri, register_mmap_protocol
 
 
 class Player:
@@ -45,6 +49,7 @@ class Player:
         self._player.speed = options.get(
             "speed_rate", DEFAULT_PLAYER_OPTIONS["speed_rate"])
         self._player.mute = options.get("mute", DEFAULT_PLAYER_OPTIONS["mute"])
+        register_mmap_protocol(self._player)
 
         self._properties: PlayerProperties = {
             **DEFAULT_PLAYER_OPTIONS, "debug": options.get("debug", False)}
@@ -94,12 +99,35 @@ class Player:
         self._properties["audio_channel"] = channel
         self._player.audio_channel = self._properties["audio_channel"]
 
-    def play(self, audio_path: AudioPathType) -> None:
-        """Começa a reprodução de um áudio."""
+    def play(self, audio_path: AudioPathType, mmap: bool = False) -> None:
+        """
+        Começa a reprodução de um áudio. Com `mmap`, um arquivo local é
+        lido pelo protocolo `mmap://` (ver MmapStream), e não pelo mpv.
+        """
         if not isinstance(audio_path, str):
             audio_path = str(audio_path)
+        if mmap and "://" not in audio_path:
+            audio_path = mmap_uri(audio_path)
         self._player.play(audio_path)
 
+    def sync_playlist(self, playlist: Playlist) -> PlaylistSync:
+        """
+        Espelha `playlist` na playlist interna do mpv, que passa a trocar de
+        trilha sozinho. `PlaylistSync.play` começa a tocar a trilha atual.
+        Desliga o espelhamento ou a reprodução gapless anterior.
+        """
+        return PlaylistSync(self._player, playlist)
+
+    def play_gapless(self, playlist: Playlist) -> GaplessQueue:
+        """
+        Começa a tocar a trilha atual de `playlist` sem pausas entre as
+        trilhas: a próxima fica pré-carregada no mpv (ver GaplessQueue).
+        Desliga o espelhamento ou a reprodução gapless anterior.
+        """
+        queue = GaplessQueue(self._player, playlist)
+        queue.play()
+        return queue
+
     def pause(self) -> None:
         """Pausa a reprodução atual."""
         self._player.pause = True
@@ -4,13 +4,16 @@ reponsável por controlar quando e de que
 forma cada musica será tocada e salvada
 localmente.
 """
-from dataclasses import dataclass, field
-from uuid import uuid4
-from typing import Optional, List, Iterator, Tuple, Unpack, Union
+from threading import RLock
+from weakref import finalize
+from typing import (
+    Callable, Optional, List, Iterable, Iterator, Hashable, Tuple, Unpack, Union
+)
 from src.core.type_hints import (
-    AudioPathType,
-    AudioSourceType,
+    TrackId,
     PlaylistModes,
+    ShuffleState,
+    PlaylistChange,
     LoggingLevel,
     PlaylistDebugOptions,
     PlaylistDebugConfig
@@ -22,42 +25,76 @@ from src.exceptions.playlist_exceptions import (
     # PlaylistEmptyError
 )
 from src.utils.operations_utils import increment_index
-from src.utils.logging_utils import log
+from src.utils.logging_utils import log, LogSampler
 from src.core.config import LOGGING_SCOPES, PLAYLIST_MODES
+from src.core.block_list import BlockList, BlockListSnapshot
+from src.core.track import Track
+from src.core.track_store import TrackStorage, TrackTable
+from src.core.shuffle import ShuffleOrder
 
 _LOGGING_SCOPE = "playlist"
 
+PlaylistListener = Callable[[PlaylistChange], None]
 
-@dataclass(eq=False, slots=True)
-class Track:
-    """Representa uma trilha na playlist."""
-    path: AudioPathType
-    source: AudioSourceType = "local"
-    title: Optional[str] = field(default=None, kw_only=True)
-    duration: Optional[float] = field(default=None, kw_only=True)
-    id: str = field(init=False, default_factory=lambda: uuid4().hex)
 
-    def __eq__(self, other):
-        if not isinstance(other, Track):
-            return NotImplemented
-        return (
-            self.path == other.path and
-            self.source == other.source
-        )
+class PlaylistState:
+    """
+    Estado imutável de uma Playlist, criado por `Playlist.snapshot`.
+
+    As entradas são um `BlockListSnapshot`, que compartilha os blocos com
+    a playlist: criar um estado custa O(número de blocos), não O(n), e ele
+    pode ser lido (por exemplo, pela interface ou por uma thread que o
+    salva) enquanto a playlist continua sendo editada, sem locks.
+    """
+    __slots__ = ("entries", "current_index", "mode", "_store", "__weakref__")
+
+    def __init__(
+        self,
+        entries: BlockListSnapshot,
+        current_index: Optional[int],
+        mode: PlaylistModes,
+        store: TrackStorage
+    ) -> None:
+        self.entries = entries
+        self.current_index = current_index
+        self.mode = mode
+        self._store = store
+
+    def get_current_track(self) -> Optional[Track]:
+        """Retorna a trilha atual do estado ou None."""
+        if self.current_index is None:
+            return None
+        return self[self.current_index]
 
-    def __str__(self) -> str:
-        return f"{self.path} - {self.source}"
+    def __getitem__(self, index: Union[int, slice]) -> Union[Track, List[Track]]:
+        if isinstance(index, slice):
+            return list(map(self._store.get, self.entries[index]))
+        return self._store.get(self.entries[index])
+
+    def __iter__(self) -> Iterator[Track]:
+        return map(self._store.get, self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
 
 
 class Playlist:
     """
     Representa uma playlist, com métodos para adicionar/removes trilhas, pegar
     a atual, limpar toda a playlist, modos, etc.
+
+    A playlist não é thread-safe. `lock` (um RLock) é o lock combinado das
+    edições: quem a edita fora da thread dona (o PlaylistLoader e as
+    observações do mpv no PlaylistSync e na GaplessQueue) o toma, e a
+    thread dona deve tomá-lo nas suas edições enquanto algum deles está ativo.
     """
-    _tracks: List[Track]
-    _tracks_ids: List[str]
+    _tracks: BlockList
+    _store: TrackStorage
     current_index: Optional[int]
     _mode: PlaylistModes
+    _shuffle: Optional[ShuffleOrder]
+    _listeners: List[PlaylistListener]
+    lock: RLock
     debug: bool
     debug_config: PlaylistDebugConfig
 
@@ -65,58 +102,121 @@ class Playlist:
         self,
         mode: PlaylistModes = "loop",
         *,
+        store: Optional[TrackStorage] = None,
+        shuffle_seed: Optional[int] = None,
         debug: bool = False,
         **debug_options: Unpack[PlaylistDebugOptions]
     ) -> None:
-        """Inicializa a classe Playlist."""
+        """
+        Inicializa a classe Playlist.
+
+        `store` define onde as trilhas ficam guardadas; por padrão, uma
+        `TrackTable` com as próprias instâncias. Para bibliotecas grandes,
+        passe uma `TrackStore` (uma por playlist). `shuffle_seed` fixa a
+        semente do modo "shuffle"; sem ela, uma semente aleatória é usada.
+        """
         self.debug = debug
         default_debug_config: PlaylistDebugConfig = {
                 "log_in_file": True,
                 "clear_old_log": True,
-                "allowed_logging_levels": ("info", "debug", "warning", "error", "critical")
+                "allowed_logging_levels": ("info", "debug", "warning", "error", "critical"),
+                "element_logs_per_second": 5.0
             }
         self.debug_config = {
             **default_debug_config,
             **debug_options # Configuração aplicada
         }
+        self._element_log_sampler = LogSampler(
+            self.debug_config["element_logs_per_second"], burst=10)
         self._log_handler("Instanciando Playlist", "debug")
-        self._tracks = []
-        self._tracks_ids = []
+        # O armazenamento guarda as trilhas (e o mapa por id, na ordem original);
+        # a sequência em blocos guarda só as entradas, indexadas pela chave do
+        # armazenamento: posição, inserção, remoção e busca em O(log n)
+        self._store = TrackTable() if store is None else store
+        self._tracks = BlockList(key=self._store.entry_key)
         self.current_index = None
         self._mode = mode
+        self._shuffle_seed = shuffle_seed
+        self._shuffle = None
+        self._listeners = []
+        self.lock = RLock()
+        if mode == "shuffle":
+            self._start_shuffle()
+
+    def add_listener(self, listener: PlaylistListener) -> None:
+        """
+        Registra uma função chamada a cada alteração da playlist
+        (inserção, remoção, movimento, limpeza, modo e trilha atual).
+        """
+        self._listeners.append(listener)
 
-    def _log_handler(self, message: str, level: LoggingLevel) -> None:
-        """Handler que gera logs somente em modo debug."""
+    def remove_listener(self, listener: PlaylistListener) -> None:
+        """Remove uma função registrada por `add_listener`."""
+        self._listeners.remove(listener)
+
+    def _notify(self, change: PlaylistChange) -> None:
+        """Envia uma alteração aos listeners."""
+        for listener in self._listeners:
+            listener(change)
+
+    def _log_handler(self, message: str, level: LoggingLevel, *args) -> None:
+        """
+        Handler que gera logs somente em modo debug.
+
+        `message` é um formato no estilo `%` e `args` os seus valores: nada é
+        formatado se o modo debug ou o nível estiverem desligados.
+        """
         if self.debug and level in self.debug_config["allowed_logging_levels"]:
             log(
                 message,
                 level,
                 LOGGING_SCOPES[_LOGGING_SCOPE],
                 self.debug_config["log_in_file"],
-                self.debug_config["clear_old_log"]
+                self.debug_config["clear_old_log"],
+                args
             )
 
+    def _log_element(self, message: str, level: LoggingLevel, *args) -> None:
+        """
+        Handler dos logs por elemento (acessos, iterações, verificações),
+        amostrados por um `LogSampler` para não gerar um log por trilha.
+        """
+        if not self.debug or level not in self.debug_config["allowed_logging_levels"]:
+            return
+        sampler = self._element_log_sampler
+        if not sampler.allow():
+            return
+        dropped = sampler.take_dropped()
+        if dropped:
+            message += " (+%d eventos omitidos)"
+            args += (dropped,)
+        self._log_handler(message, level, *args)
+
     def clear(self) -> None:
         """Limpa a playlist."""
         self._log_handler("Limpando a playlist", "info")
         self._tracks.clear()
-        self._tracks_ids.clear()
+        self._store.clear()
+        self.current_index = None
+        if self._shuffle is not None:
+            self._start_shuffle()
+        if self._listeners:
+            self._notify({"kind": "clear"})
 
-    def get_by_id(self, track_id: str) -> Optional[Track]:
+    def get_by_id(self, track_id: TrackId) -> Optional[Track]:
         """
         Procura e pega uma trilha por id.
 
         Se não encontrada, retorna None
         """
-        return next((track for track in self if track.id == track_id), None)
+        entry = self._store.get_by_id(track_id)
+        return None if entry is None else self._store.get(entry)
 
     def get_all(self, in_original_pos: bool = False) -> List[Track]:
         """Retorna todas as trilhas nas respectivas posições."""
-        tracks = self._tracks[:]
         if in_original_pos:
-            tracks_by_id = {track.id: track for track in self}
-            return [tracks_by_id[id_] for id_ in self._tracks_ids]
-        return tracks
+            return list(map(self._store.get, self._store.entries()))
+        return list(map(self._store.get, self._tracks))
 
     def has_track(
         self,
@@ -125,8 +225,8 @@ class Playlist:
         raises_if: bool = False
     ) -> bool:
         """Verifica se tem uma trilha na playlist."""
-        self._log_handler(f"Verificando a trilha ({track}) (raise: {raises})", "debug")
-        result = track in self
+        self._log_element("Verificando a trilha (%s) (raise: %s)", "debug", track, raises)
+        result = self._find(track) is not None
         if raises is not None and result is raises_if:
             raise raises
         return result
@@ -143,13 +243,116 @@ class Playlist:
 
     def add(self, track: Track) -> None:
         """Adiciona uma trilha à playlist."""
-        self._log_handler(f"[add()] Adicionando item na playlist: ({track})", "info")
-        self.has_track(track, TrackExistsError(track.path), True)
-        if len(self) == 0:
+        self._log_handler("[add()] Adicionando item na playlist: (%s)", "info", track)
+        if self._find(track) is not None:
+            raise TrackExistsError(track.path)
+        was_empty = len(self) == 0
+        if was_empty:
+            self.current_index = 0
+        entry = self._store.put(track)
+        self._tracks.append(entry)
+        self._shuffle_add((entry,), was_empty)
+        if self._listeners:
+            self._notify(
+                {"kind": "insert", "index": len(self) - 1, "tracks": [self._store.get(entry)]})
+        self._log_handler("[add()] A trilha (%s) foi adicionada na playlist", "debug", track)
+
+    def add_many(self, tracks: Iterable[Track]) -> List[Track]:
+        """
+        Adiciona várias trilhas de uma vez, na ordem dada.
+
+        As duplicadas (já na playlist ou repetidas em `tracks`) são
+        rejeitadas numa única passada e retornadas juntas, sem interromper
+        a adição das demais. Gera um único log de resumo. Se `tracks`
+        levantar uma exceção no meio, nenhuma trilha é adicionada.
+        """
+        has_key = self._tracks.has_key
+        key_of = self._store.key_of
+        entry_key = self._store.entry_key
+        put = self._store.put
+        seen = set()
+        added = []
+        rejected: List[Track] = []
+        try:
+            for track in tracks:
+                key = key_of(track)
+                if key is not None and (key in seen or has_key(key)):
+                    rejected.append(track)
+                    continue
+                entry = put(track)
+                seen.add(entry_key(entry))
+                added.append(entry)
+        except BaseException:
+            # `tracks` falhou no meio: nada foi adicionado à sequência ainda
+            for entry in added:
+                self._store.discard(entry)
+            raise
+        if added:
+            start = len(self)
+            was_empty = start == 0
+            self._tracks.extend(added)
+            if self.current_index is None:
+                self.current_index = 0
+            self._shuffle_add(added, was_empty)
+            if self._listeners:
+                tracks = list(map(self._store.get, added))
+                self._notify({"kind": "insert", "index": start, "tracks": tracks})
+        self._log_handler(
+            "[add_many()] %d trilhas adicionadas, %d duplicadas rejeitadas",
+            "warning" if rejected else "info",
+            len(added),
+            len(rejected)
+        )
+        return rejected
+
+    def insert(self, track_index: int, track: Track) -> None:
+        """
+        Insere uma trilha antes da posição `track_index`.
+
+        A trilha atual continua sendo a mesma.
+        """
+        self._log_handler("[insert()] Inserindo (%s) no index %d.", "info", track, track_index)
+        if self._find(track) is not None:
+            raise TrackExistsError(track.path)
+        track_index = max(0, min(track_index, len(self)))
+        was_empty = len(self) == 0
+        entry = self._store.put(track)
+        self._tracks.insert(track_index, entry)
+        if self.current_index is None:
             self.current_index = 0
-        self._tracks.append(track)
-        self._tracks_ids.append(track.id)
-        self._log_handler(f"[add()] A trilha ({track}) foi adicionada na playlist", "debug")
+        elif track_index <= self.current_index:
+            self.current_index += 1
+        self._shuffle_add((entry,), was_empty)
+        if self._listeners:
+            self._notify(
+                {"kind": "insert", "index": track_index, "tracks": [self._store.get(entry)]})
+        self._log_handler(
+            "[insert()] A trilha (%s) foi inserida no index %d.", "debug", track, track_index)
+
+    def move(self, from_index: int, to_index: int) -> None:
+        """
+        Move a trilha de `from_index` para `to_index`, reordenando a playlist.
+
+        A trilha atual continua sendo a mesma.
+        """
+        self._log_handler("[move()] Movendo o index %d para %d.", "info", from_index, to_index)
+        for index in (from_index, to_index):
+            if not 0 <= index < len(self):
+                raise IndexError(
+                    f"O index passado ({index}) está fora da playlist ({len(self)}).")
+        self._tracks.move(from_index, to_index)
+        current = self.current_index
+        if current is not None:
+            if current == from_index:
+                self.current_index = to_index
+            elif from_index < current <= to_index:
+                self.current_index = current - 1
+            elif to_index <= current < from_index:
+                self.current_index = current + 1
+        if self._listeners:
+            self._notify({"kind": "move", "index": from_index, "to_index": to_index})
+        self._log_handler(
+            "[move()] O index %d foi movido para %d.", "debug", from_index, to_index)
 
     def pop(self, track_index: int = -1) -> Optional[Track]:
         """
@@ -157,13 +360,12 @@ class Playlist:
 
         Retorna a trilha removida ou None, caso ela não exista.
         """
-        self._log_handler(f"[pop()] Removendo o index {track_index} da playlist.", "info")
+        self._log_handler("[pop()] Removendo o index %d da playlist.", "info", track_index)
         if not 0 <= track_index < len(self):
             raise IndexError(
                 f"O index passado ({track_index}) está fora da playlist ({len(self)}).")
-        removed_track = self._tracks.pop(track_index)
-        self._tracks_ids.remove(removed_track.id)
-        self._log_handler(f"[pop()] O index {track_index} foi removido da playlist.", "debug")
+        removed_track = self._remove_at(track_index)
+        self._log_handler("[pop()] O index %d foi removido da playlist.", "debug", track_index)
         return removed_track
 
     def remove(self, track: Track) -> Optional[Track]:
@@ -172,26 +374,205 @@ class Playlist:
 
         Retorna a trilha removida ou None.
         """
-        self._log_handler(f"[remove()] Removendo a trilha ({track}) da playlist.", "info")
-        self.has_track(track, TrackNotExistsError(track.path))
-        track_index = self._tracks.index(track)
-        removed_track = self._tracks.pop(track_index)
-        self._tracks_ids.remove(removed_track.id)
-        self._log_handler(f"[remove()] A trilha ({track}) foi removida da playlist.", "debug")
+        self._log_handler("[remove()] Removendo a trilha (%s) da playlist.", "info", track)
+        key = self._find(track)
+        if key is None:
+            raise TrackNotExistsError(track.path)
+        removed_track = self._remove_at(self._tracks.index_of_key(key))
+        self._log_handler("[remove()] A trilha (%s) foi removida da playlist.", "debug", track)
         return removed_track
 
+    def index(self, track: Track) -> int:
+        """Retorna a posição de uma trilha na playlist em O(log n)."""
+        key = self._find(track)
+        if key is None:
+            raise TrackNotExistsError(track.path)
+        return self._tracks.index_of_key(key)
+
+    def _find(self, track: Track) -> Optional[Hashable]:
+        """Retorna a chave da entrada da trilha na sequência, ou None se ela não está lá."""
+        key = self._store.key_of(track)
+        if key is None or not self._tracks.has_key(key):
+            return None
+        return key
+
+    def _remove_at(self, track_index: int) -> Track:
+        """
+        Remove a trilha em `track_index` mantendo os índices.
+
+        Se a trilha atual for removida, a seguinte passa a ser a atual.
+        """
+        entry = self._tracks.pop(track_index)
+        removed_track = self._store.get(entry)
+        if self._shuffle is not None:
+            self._shuffle.discard(self._store.entry_key(entry))
+        self._store.discard(entry)
+        current = self.current_index
+        if current is not None:
+            if not self._tracks:
+                self.current_index = None
+            elif track_index < current:
+                self.current_index = current - 1
+            elif current >= len(self._tracks):
+                self.current_index = 0
+        if self._listeners:
+            self._notify({"kind": "remove", "index": track_index, "tracks": [removed_track]})
+        return removed_track
+
+    def _load_entries(self, entries: List, current_index: Optional[int] = None) -> None:
+        """
+        Adiciona ao final entradas que já estão no armazenamento (ex.: de um
+        snapshot), sem verificar duplicadas nem ler as trilhas.
+        """
+        if not entries:
+            return
+        was_empty = len(self) == 0
+        self._tracks.extend(entries)
+        if self.current_index is None:
+            self.current_index = 0 if current_index is None else current_index
+        self._shuffle_add(entries, was_empty)
+
+    def snapshot(self) -> PlaylistState:
+        """
+        Retorna o estado atual da playlist (trilhas, trilha atual e modo),
+        imutável e compartilhando a estrutura com ela.
+        """
+        state = PlaylistState(self._tracks.snapshot(), self.current_index, self._mode, self._store)
+        token = self._store.pin()
+        if token is not None:
+            finalize(state, self._store.unpin, token)
+        return state
+
+    def restore(self, state: PlaylistState) -> None:
+        """
+        Volta as trilhas da playlist para as de um estado criado por `snapshot`.
+
+        Só os trechos diferentes entre os dois são refeitos, e os listeners
+        recebem todas as remoções (do fim para o começo) e depois todas as
+        inserções desses trechos. A trilha atual continua a mesma
+        se ainda estiver na playlist; senão, passa a ser a do estado. O modo
+        não é alterado.
+        """
+        if state._store is not self._store:
+            raise ValueError("O estado não pertence a essa playlist.")
+        self._log_handler("[restore()] Restaurando um estado da playlist.", "info")
+        entry_key = self._store.entry_key
+        get = self._store.get
+        current = self.current_index
+        current_key = None if current is None else entry_key(self._tracks[current])
+        was_empty = len(self) == 0
+        changes = self._tracks.restore(state.entries)
+        removed = [entry for _, entries, _ in changes for entry in entries]
+        inserted = [entry for _, _, entries in changes for entry in entries]
+        notifications = [
+            (start, list(map(get, old)), list(map(get, new))) for start, old, new in changes
+        ] if self._listeners else []
+        # Trilhas só movidas de um trecho para outro continuam armazenadas
+        removed_keys = set(map(entry_key, removed))
+        inserted_positions = {
+            entry_key(entry): start + offset
+            for start, _, entries in changes for offset, entry in enumerate(entries)
+        }
+        for entry in removed:
+            key = entry_key(entry)
+            if key not in inserted_positions:
+                if self._shuffle is not None:
+                    self._shuffle.discard(key)
+                self._store.discard(entry)
+        revived = [entry for entry in inserted if entry_key(entry) not in removed_keys]
+        for entry in revived:
+            self._store.revive(entry)
+        # A trilha atual: fora dos trechos alterados, só é deslocada
+        if current is None:
+            current = state.current_index
+        elif current_key in inserted_positions:
+            current = inserted_positions[current_key]
+        else:
+            shift = 0
+            for start, old, new in changes:
+                if current < start - shift:
+                    break
+                if current < start - shift + len(old):
+                    shift = None  # A trilha atual foi removida
+                    break
+                shift += len(new) - len(old)
+            current = state.current_index if shift is None else current + shift
+        if current is not None and not 0 <= current < len(self._tracks):
+            current = 0 if self._tracks else None
+        self.current_index = current
+        if self._shuffle is not None:
+            if was_empty or not self._tracks:
+                self._start_shuffle()
+            else:
+                self._shuffle_add(revived, False)
+        # Todas as remoções (do fim para o começo, nas posições antigas) antes
+        # das inserções: uma trilha movida entre trechos não fica duplicada
+        removals, insertions, shift = [], [], 0
+        for start, old_tracks, new_tracks in notifications:
+            if old_tracks:
+                removals.append((start - shift, old_tracks))
+            if new_tracks:
+                insertions.append((start, new_tracks))
+            shift += len(new_tracks) - len(old_tracks)
+        for start, old_tracks in reversed(removals):
+            self._notify({"kind": "remove", "index": start, "tracks": old_tracks})
+        for start, new_tracks in insertions:
+            self._notify({"kind": "insert", "index": start, "tracks": new_tracks})
+        if self._listeners:
+            self._notify({"kind": "current", "index": self.current_index})
+        self._log_handler(
+            "[restore()] %d trilhas removidas e %d inseridas em %d trechos.",
+            "debug", len(removed), len(inserted), len(changes))
+
+    def _start_shuffle(self) -> None:
+        """Começa uma nova ordem aleatória a partir da trilha atual."""
+        entry_key = self._store.entry_key
+        current = None
+        if self.current_index is not None:
+            current = entry_key(self._tracks[self.current_index])
+        self._shuffle = ShuffleOrder(
+            map(entry_key, self._tracks),
+            first=current,
+            seed=self._shuffle_seed
+        )
+
+    def _shuffle_add(self, entries: Iterable, was_empty: bool) -> None:
+        """Coloca entradas novas na ordem aleatória, se o modo "shuffle" estiver ativo."""
+        if self._shuffle is None:
+            return
+        if was_empty:  # A primeira trilha vira a atual da ordem
+            self._start_shuffle()
+            return
+        entry_key = self._store.entry_key
+        for entry in entries:
+            self._shuffle.add(entry_key(entry))
+
+    def _shuffled_index(self, key: Optional[Hashable]) -> Optional[int]:
+        """Converte uma chave da ordem aleatória em posição na playlist."""
+        return None if key is None else self._tracks.index_of_key(key)
+
     def get_next(self) -> Optional[Tuple[Track, int]]:
         """Retorna a próxima trilha e o seu index ou None."""
         if self.current_index is None:
             return None
-        new_index = increment_index(self.current_index, len(self))
+        if self._shuffle is not None:
+            new_index = self._shuffled_index(self._shuffle.peek_next())
+            if new_index is None:
+                return None
+        else:
+            new_index = increment_index(self.current_index, len(self))
         return self[new_index], new_index
 
     def get_previous(self) -> Optional[Tuple[Track, int]]:
         """Retorna a trilha anterior e o seu index ou None."""
         if self.current_index is None:
             return None
-        new_index = increment_index(self.current_index, len(self), -1)
+        if self._shuffle is not None:
+            new_index = self._shuffled_index(self._shuffle.peek_previous())
+            if new_index is None:  # Início da ordem aleatória: fica na atual
+                new_index = self.current_index
+        else:
+            new_index = increment_index(self.current_index, len(self), -1)
         return self[new_index], new_index
 
     def next(self, force_next: bool = False) -> Optional[Track]:
@@ -205,11 +586,17 @@ class Playlist:
         if self.current_index is None or next_ is None:
             return None
         _, new_index = next_
-        if self._mode == "loop" or force_next:  # Em 'loop', continua normalmente
+        if self._shuffle is not None:  # Em 'shuffle', avança na ordem aleatória
+            self._shuffle.next()
+            self.current_index = new_index
+        elif self._mode == "loop" or force_next:  # Em 'loop', continua normalmente
             self.current_index = new_index
         # Sem 'loop', fica na mesma trilha
-        self._log_handler(f"[next()] Trilha mudada para: {self.get_current_track()}", "debug")
-        return self.get_current_track()
+        if self._listeners:
+            self._notify({"kind": "current", "index": self.current_index, "step": "next"})
+        track = self.get_current_track()
+        self._log_handler("[next()] Trilha mudada para: %s", "debug", track)
+        return track
 
     def previous(self, force_previous: bool = False) -> Optional[Track]:
         """
@@ -222,16 +609,37 @@ class Playlist:
         if self.current_index is None or next_ is None:
             return None
         _, new_index = next_
-        if self._mode == "loop" or force_previous:  # Em 'loop', continua normalmente
+        if self._shuffle is not None:  # Em 'shuffle', volta na ordem aleatória
+            self._shuffle.previous()
+            self.current_index = new_index
+        elif self._mode == "loop" or force_previous:  # Em 'loop', continua normalmente
             self.current_index = new_index
         # Sem 'loop', fica na mesma trilha
-        self._log_handler(f"[previous()] Trilha mudada para: ({self.get_current_track()})", "debug")
-        return self.get_current_track()
+        if self._listeners:
+            self._notify({"kind": "current", "index": self.current_index, "step": "previous"})
+        track = self.get_current_track()
+        self._log_handler("[previous()] Trilha mudada para: (%s)", "debug", track)
+        return track
+
+    def select(self, track_index: int) -> Track:
+        """
+        Passa para a trilha em `track_index`.
+
+        Retorna a trilha.
+        """
+        self._log_handler("[select()] Indo para o index %d.", "info", track_index)
+        if not 0 <= track_index < len(self):
+            raise IndexError(
+                f"O index passado ({track_index}) está fora da playlist ({len(self)}).")
+        self.current_index = track_index
+        if self._listeners:
+            self._notify({"kind": "current", "index": track_index})
+        return self[track_index]
 
     @property
     def mode(self) -> PlaylistModes:
         """Modo da reprodução da playlist."""
-        self._log_handler("[mode()] Acessando propriedade 'mode'.", "info")
+        self._log_element("[mode()] Acessando propriedade 'mode'.", "info")
         return self._mode
 
     @mode.setter
@@ -240,28 +648,81 @@ class Playlist:
         self._log_handler("[mode.setter()] Alternando o valor do modo", "info")
         if mode not in PLAYLIST_MODES:
             raise InvalidPlaylistModeError(mode)
+        if mode == "shuffle" and self._shuffle is None:
+            self._start_shuffle()
+        elif mode != "shuffle":
+            self._shuffle = None
         self._mode = mode
-        self._log_handler(f"[mode.setter()] O modo foi alterado para {mode}", "debug")
+        if self._listeners:
+            self._notify({"kind": "mode", "mode": mode})
+        self._log_handler("[mode.setter()] O modo foi alterado para %s", "debug", mode)
+
+    def shuffle_state(self) -> Optional[ShuffleState]:
+        """
+        Retorna o estado do modo "shuffle" para ser persistido, ou None fora dele.
+
+        As trilhas (já sorteadas e ainda no pool) são salvas pela posição
+        atual na playlist.
+        """
+        if self._shuffle is None:
+            return None
+        state = self._shuffle.state()
+        index_of_key = self._tracks.index_of_key
+        return {
+            "seed": state["seed"],
+            "random_state": state["random_state"],
+            "order": [index_of_key(key) for key in state["order"]],
+            "cursor": state["cursor"],
+            "pool": [index_of_key(key) for key in state["pool"]]
+        }
+
+    def restore_shuffle(self, state: ShuffleState) -> None:
+        """
+        Restaura um estado salvo por `shuffle_state` e ativa o modo "shuffle".
+
+        A ordem já sorteada e as próximas trilhas voltam iguais, sem sortear
+        a playlist de novo. Trilhas que não estavam no estado vão para o pool.
+        """
+        self._log_handler("[restore_shuffle()] Restaurando a ordem aleatória.", "info")
+        entry_key = self._store.entry_key
+        order = [entry_key(self._tracks[index]) for index in state["order"]]
+        pool = [entry_key(self._tracks[index]) for index in state["pool"]]
+        known = set(order)
+        known.update(pool)
+        pool.extend(key for key in map(entry_key, self._tracks) if key not in known)
+        self._shuffle = ShuffleOrder.from_state(
+            pool,
+            order,
+            state["cursor"],
+            state["seed"],
+            state["random_state"]
+        )
+        self._mode = "shuffle"
+        if 0 <= state["cursor"] < len(order):
+            self.current_index = state["order"][state["cursor"]]
+        if self._listeners:
+            self._notify({"kind": "mode", "mode": "shuffle"})
+            self._notify({"kind": "current", "index": self.current_index})
 
     def __eq__(self, other: Union[List[Track], Tuple[Track, ...], "Playlist"]) -> bool:
-        if isinstance(other, (list, tuple)):
-            return self._tracks == other
-        if isinstance(other, Playlist):
-            return self._tracks == other.get_all()
+        if isinstance(other, (list, tuple, Playlist)):
+            return len(self) == len(other) and self.get_all() == list(other)
         return NotImplemented
 
-    def __getitem__(self, index: int) -> Track:
-        self._log_handler(f"[__getitem__] Pegando o index {index} da playlist", "debug")
-        return self._tracks[index]
+    def __getitem__(self, index: Union[int, slice]) -> Union[Track, List[Track]]:
+        self._log_element("[__getitem__] Pegando o index %s da playlist", "debug", index)
+        if isinstance(index, slice):
+            return list(map(self._store.get, self._tracks[index]))
+        return self._store.get(self._tracks[index])
 
     def __contains__(self, other) -> bool:
         if not isinstance(other, Track):
             return False
-        return other in self._tracks
+        return self._find(other) is not None
 
     def __iter__(self) -> Iterator[Track]:
-        self._log_handler("[__iter__()] Iterando sob a playlist", "debug")
-        return iter(self._tracks)
+        self._log_element("[__iter__()] Iterando sob a playlist", "debug")
+        return map(self._store.get, self._tracks)
 
     def __len__(self) -> int:
         return len(self._tracks)
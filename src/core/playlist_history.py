@@ -0,0 +1,137 @@
+"""
+Esse módulo contém a classe PlaylistHistory,
+responsável por desfazer e refazer as edições
+da playlist.
+"""
+import sys
+from collections import deque
+from typing import Deque, Tuple
+from src.core.type_hints import PlaylistChange
+from src.core.config import UNDO_MAX_STEPS, UNDO_MEMORY_BUDGET
+from src.core.playlist import Playlist, PlaylistState
+
+_EDITS = ("insert", "remove", "move", "clear")  # Alterações que podem ser desfeitas
+
+_Step = Tuple[PlaylistState, int]  # (estado, bytes estimados só dele)
+
+
+class PlaylistHistory:
+    """
+    Pilhas de desfazer/refazer das edições de uma playlist.
+
+    A cada edição (inserção, remoção, movimento ou limpeza), o estado
+    anterior da playlist (`Playlist.snapshot`) vai para a pilha de desfazer.
+    Os estados compartilham os blocos da sequência, então cada passo guarda
+    só os blocos que a edição copiou, não a playlist inteira. O custo de um
+    passo é estimado pelos blocos que ele não divide com o estado seguinte
+    e pelas trilhas que só esses blocos mantêm vivas (as que a edição
+    removeu, estimadas pelo armazenamento da playlist); os passos mais
+    antigos são descartados ao passar de `max_steps` ou de `memory_budget`
+    bytes.
+
+    Mudanças de trilha atual e de modo não são desfeitas.
+    """
+
+    def __init__(
+        self,
+        playlist: Playlist,
+        memory_budget: int = UNDO_MEMORY_BUDGET,
+        max_steps: int = UNDO_MAX_STEPS
+    ) -> None:
+        """Cria o histórico e passa a acompanhar as edições de `playlist`."""
+        self.playlist = playlist
+        self.memory_budget = memory_budget
+        self.max_steps = max_steps
+        self._undo: Deque[_Step] = deque()
+        self._redo: Deque[_Step] = deque()
+        self._state = playlist.snapshot()  # Estado depois da última edição
+        self._restoring = False
+        playlist.add_listener(self._on_change)
+
+    def detach(self) -> None:
+        """Para de acompanhar a playlist."""
+        self.playlist.remove_listener(self._on_change)
+
+    def clear(self) -> None:
+        """Descarta todos os passos guardados."""
+        self._undo.clear()
+        self._redo.clear()
+        self._state = self.playlist.snapshot()
+
+    @property
+    def memory_usage(self) -> int:
+        """Bytes estimados guardados pelos passos de desfazer e refazer."""
+        return sum(cost for _, cost in self._undo) + sum(cost for _, cost in self._redo)
+
+    def can_undo(self) -> bool:
+        """Verifica se há uma edição para desfazer."""
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        """Verifica se há uma edição desfeita para refazer."""
+        return bool(self._redo)
+
+    def undo(self) -> bool:
+        """Desfaz a última edição. Retorna False se não há o que desfazer."""
+        return self._move(self._undo, self._redo)
+
+    def redo(self) -> bool:
+        """Refaz a última edição desfeita. Retorna False se não há o que refazer."""
+        return self._move(self._redo, self._undo)
+
+    def _move(self, source: Deque[_Step], target: Deque[_Step]) -> bool:
+        """Restaura o topo de `source`, guardando o estado atual em `target`."""
+        if not source:
+            return False
+        state, _ = source.pop()
+        current = self.playlist.snapshot()
+        target.append((current, self._cost(current, state)))
+        self._restoring = True
+        try:
+            self.playlist.restore(state)
+        finally:
+            self._restoring = False
+        self._state = self.playlist.snapshot()  # Com a trilha atual de agora
+        self._trim()
+        return True
+
+    def _on_change(self, change: PlaylistChange) -> None:
+        """Listener da playlist: guarda o estado anterior a cada edição."""
+        if self._restoring or change["kind"] not in _EDITS:
+            return
+        previous = self._state
+        self._state = self.playlist.snapshot()
+        self._undo.append((previous, self._cost(previous, self._state)))
+        self._redo.clear()
+        self._trim()
+
+    def _cost(self, state: PlaylistState, other: PlaylistState) -> int:
+        """
+        Bytes estimados guardados só por `state`: os blocos que `other` não
+        compartilha e as trilhas desses blocos que não estão em `other`.
+        """
+        store = self.playlist._store  # pylint: disable=protected-access
+        entry_key = store.entry_key
+        own = state.entries.unshared_blocks(other.entries)
+        kept = {
+            entry_key(entry)
+            for block in other.entries.unshared_blocks(state.entries) for entry in block
+        }
+        cost = sys.getsizeof(state.entries.blocks) + sum(map(sys.getsizeof, own))
+        for block in own:
+            for entry in block:
+                if entry_key(entry) not in kept:
+                    cost += store.entry_size(entry)
+        return cost
+
+    def _trim(self) -> None:
+        """Descarta os passos mais antigos além dos limites, e depois os refazer mais distantes."""
+        usage = self.memory_usage
+        while self._undo and (len(self._undo) > self.max_steps or usage > self.memory_budget):
+            usage -= self._undo.popleft()[1]
+        while self._redo and (len(self._redo) > self.max_steps or usage > self.memory_budget):
+            usage -= self._redo.popleft()[1]
+
+    def __len__(self) -> int:
+        return len(self._undo)
+
@@ -0,0 +1,330 @@
+"""
+Esse módulo contém a classe PlaylistJournal,
+responsável por salvar a playlist localmente
+sem reescrever o arquivo inteiro a cada alteração.
+"""
+import json
+import os
+from pathlib import Path
+from threading import Lock, Thread
+from typing import IO, Any, Dict, Iterator, Optional, Tuple
+from src.core.type_hints import PlaylistChange, PathType, ShuffleState
+from src.core.config import (
+    LOGGING_SCOPES,
+    PLAYLIST_PATH,
+    PLAYLIST_JOURNAL_PATH,
+    JOURNAL_COMPACT_EVERY
+)
+from src.exceptions.playlist_exceptions import (
+    TrackExistsError,
+    TrackNotExistsError
+)
+from src.utils.logging_utils import log
+from src.core.playlist import Playlist
+from src.core.playlist_snapshot import read_json, restore_mode, write_json
+from src.core.track import Track
+
+_LOGGING_SCOPE = "playlist_journal"
+_OLD_SUFFIX = ".old"  # Journal já rotacionado, esperando a compactação
+
+
+def _dumps(record: Dict[str, Any]) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+class PlaylistJournal:
+    """
+    Persistência da playlist em snapshot + journal.
+
+    Cada alteração da playlist vira uma linha JSON acrescentada ao journal,
+    então salvar custa o mesmo para qualquer tamanho de playlist. A cada
+    `compact_every` registros, o journal é rotacionado e uma thread de fundo
+    aplica o journal antigo sobre o snapshot, gravando um snapshot novo de
+    forma atômica. Ao iniciar, `load` lê o snapshot e reaplica os journals;
+    uma última linha incompleta (escrita interrompida) é descartada.
+
+    No modo "shuffle", a ordem aleatória (`Playlist.shuffle_state`) vai no
+    snapshot e no registro de troca para o modo; os avanços registrados
+    depois dela são refeitos com `next`/`previous` ao carregar, então a
+    ordem continua de onde parou.
+
+    Cada journal começa com a sua geração (um registro "generation"), e o
+    snapshot guarda a do último journal aplicado nele. Um journal que o
+    snapshot já contém (a compactação gravou o snapshot mas não chegou a
+    apagá-lo) é descartado em vez de reaplicado, já que os registros por
+    posição (remoções, movimentos) não podem ser aplicados duas vezes.
+    """
+
+    def __init__(
+        self,
+        path: PathType = PLAYLIST_PATH,
+        journal_path: PathType = PLAYLIST_JOURNAL_PATH,
+        compact_every: int = JOURNAL_COMPACT_EVERY,
+        sync: bool = False
+    ) -> None:
+        """
+        Inicializa o journal.
+
+        Com `sync`, cada registro é enviado ao disco (`fsync`) antes de
+        retornar, ao custo de uma escrita síncrona por alteração.
+        """
+        self.path = Path(path)
+        self.journal_path = Path(journal_path)
+        self.old_journal_path = Path(str(journal_path) + _OLD_SUFFIX)
+        self.compact_every = compact_every
+        self.sync = sync
+        self._playlist: Optional[Playlist] = None
+        self._file: Optional[IO[str]] = None
+        self._records = 0
+        self._lock = Lock()
+        self._compactor: Optional[Thread] = None
+        self._covered = 0  # Geração do último journal aplicado no snapshot
+        self._generation: Optional[int] = None  # Do journal atual (None: sem cabeçalho)
+
+    def load(self, playlist: Optional[Playlist] = None) -> Playlist:
+        """
+        Recupera a playlist salva (snapshot + journal) e passa a registrar
+        as suas alterações.
+
+        Se `playlist` (vazia) for dada, as trilhas são carregadas nela,
+        mantendo o seu armazenamento e as opções de debug.
+        """
+        playlist = Playlist() if playlist is None else playlist
+        covered = self._read_snapshot(playlist)
+        self.recover(playlist, covered)
+        return playlist
+
+    def recover(self, playlist: Playlist, journal_generation: int = 0) -> None:
+        """
+        Reaplica os journals numa playlist que já tem o snapshot carregado
+        (ex.: pelo `PlaylistLoader`) e passa a registrar as suas alterações.
+        `journal_generation` é a do snapshot: os journals que ele já contém
+        são descartados.
+        """
+        covered = journal_generation
+        replayed_old = False
+        old_generation = self._generation_of(self.old_journal_path)
+        if self.old_journal_path.exists():  # Compactação anterior não terminou
+            if old_generation is not None and old_generation <= covered:
+                self.old_journal_path.unlink()  # Já está no snapshot
+            else:
+                self._replay(playlist, self.old_journal_path)
+                replayed_old = True
+        generation = self._generation_of(self.journal_path)
+        if generation is not None and generation <= covered:
+            self.journal_path.unlink()  # Já está no snapshot
+            generation = None
+        valid_size = self._replay(playlist, self.journal_path)
+        latest = max(value for value in (covered, old_generation, generation) if value is not None)
+        if replayed_old:
+            # Tudo já está em memória: grava o snapshot agora e recomeça o journal
+            write_json(playlist, self.path, journal_generation=latest)
+            self.old_journal_path.unlink()
+            self.journal_path.unlink(missing_ok=True)
+            covered, generation = latest, None
+        elif self.journal_path.exists():
+            os.truncate(self.journal_path, valid_size)  # Descarta uma linha incompleta
+        self._covered = covered
+        self._generation = generation
+        self.attach(playlist)
+
+    def attach(self, playlist: Playlist) -> None:
+        """Passa a registrar as alterações de `playlist` no journal."""
+        self.detach()
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._open_journal()
+        self._records = 0
+        self._playlist = playlist
+        playlist.add_listener(self._on_change)
+
+    def detach(self) -> None:
+        """Para de registrar as alterações e fecha o journal."""
+        if self._playlist is not None:
+            self._playlist.remove_listener(self._on_change)
+            self._playlist = None
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def close(self) -> None:
+        """Para de registrar e espera a compactação em andamento terminar."""
+        self.detach()
+        if self._compactor is not None:
+            self._compactor.join()
+            self._compactor = None
+
+    def compact(self, wait: bool = False) -> bool:
+        """
+        Rotaciona o journal e o compacta no snapshot em segundo plano.
+
+        Retorna False se uma compactação anterior ainda não terminou.
+        Com `wait`, espera a compactação terminar.
+        """
+        with self._lock:
+            if self._compactor is not None and self._compactor.is_alive():
+                return False
+            if self.old_journal_path.exists():  # Uma compactação anterior falhou
+                return False
+            attached = self._file is not None
+            if attached:
+                self._file.close()
+            if self.journal_path.exists():
+                os.replace(self.journal_path, self.old_journal_path)
+            # O snapshot compactado cobre o journal rotacionado, e o novo é o seguinte
+            covered = self._covered if self._generation is None else self._generation
+            self._generation = covered + 1
+            if attached:
+                self._open_journal()
+            self._records = 0
+            # A ordem aleatória de agora é a do fim do journal rotacionado
+            shuffle = None if self._playlist is None else self._playlist.shuffle_state()
+            self._compactor = Thread(
+                target=self._compact_old_journal,
+                args=(shuffle, covered),
+                name="playlist-journal-compactor",
+                daemon=True
+            )
+            self._compactor.start()
+        if wait:
+            self._compactor.join()
+        return True
+
+    def _on_change(self, change: PlaylistChange) -> None:
+        """Listener da playlist: acrescenta a alteração ao journal."""
+        record: Dict[str, Any] = dict(change)
+        if change["kind"] == "remove":  # A posição (e a quantidade) basta para reaplicar
+            count = len(record.pop("tracks"))
+            if count > 1:
+                record["count"] = count
+        elif "tracks" in record:
+            record["tracks"] = [track.to_record() for track in record["tracks"]]
+        elif change["kind"] == "mode" and change["mode"] == "shuffle" and self._playlist is not None:
+            record["shuffle"] = self._playlist.shuffle_state()
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(_dumps(record))
+            self._file.flush()
+            if self.sync:
+                os.fsync(self._file.fileno())
+            self._records += 1
+            should_compact = self._records >= self.compact_every
+        if should_compact:
+            self.compact()
+
+    def _open_journal(self) -> None:
+        """
+        Abre o journal atual para acrescentar registros; um journal novo
+        começa com a sua geração. Deve ser chamado com `_lock`.
+        """
+        self._file = open(self.journal_path, "a", encoding="utf-8")
+        if self._file.tell() == 0:
+            if self._generation is None:
+                self._generation = self._covered + 1
+            self._file.write(_dumps({"kind": "generation", "generation": self._generation}))
+            self._file.flush()
+
+    def _compact_old_journal(self, shuffle: Optional[ShuffleState], covered: int) -> None:
+        """
+        Aplica o journal rotacionado sobre o snapshot e grava o resultado,
+        com a ordem aleatória `shuffle` (a da playlist na rotação) e a
+        geração `covered` (a do journal rotacionado).
+        """
+        try:
+            playlist = Playlist()
+            self._read_snapshot(playlist)
+            if self.old_journal_path.exists():
+                self._replay(playlist, self.old_journal_path)
+            write_json(playlist, self.path, shuffle=shuffle, journal_generation=covered)
+            with self._lock:
+                self._covered = covered
+            self.old_journal_path.unlink(missing_ok=True)
+        except Exception as error:  # pylint: disable=broad-except
+            # O journal antigo é mantido e reaplicado no próximo `load`
+            log("Falha ao compactar o journal: %r", "error", LOGGING_SCOPES[_LOGGING_SCOPE],
+                args=(error,))
+
+    def _read_snapshot(self, playlist: Playlist) -> int:
+        """
+        Carrega as trilhas, a trilha atual e o modo do snapshot na playlist.
+        Retorna a geração do último journal aplicado no snapshot.
+        """
+        data = read_json(self.path)
+        playlist.add_many(map(Track.from_record, data["tracks"]))
+        if data["current_index"] is not None and len(playlist):
+            playlist.current_index = data["current_index"]
+        restore_mode(playlist, data["mode"], data["shuffle"])
+        return data["journal_generation"]
+
+    def _generation_of(self, journal_path: Path) -> Optional[int]:
+        """Geração de um journal (o seu primeiro registro), ou None sem ele."""
+        for _, record in self._records_of(journal_path):
+            if record.get("kind") == "generation":
+                return int(record["generation"])
+            return None
+        return None
+
+    def _replay(self, playlist: Playlist, journal_path: Path) -> int:
+        """
+        Reaplica um journal na playlist. Retorna quantos bytes do journal
+        são válidos (até a primeira linha incompleta ou inválida).
+        """
+        valid_size = 0
+        for size, record in self._records_of(journal_path):
+            try:
+                self._apply(playlist, record)
+            except (LookupError, TypeError, ValueError, TrackExistsError, TrackNotExistsError):
+                break  # Registro inválido: o resto do journal é descartado
+            valid_size += size
+        return valid_size
+
+    def _apply(self, playlist: Playlist, record: Dict[str, Any]) -> None:
+        """Aplica um registro do journal na playlist (o de geração não altera nada)."""
+        kind = record["kind"]
+        if kind == "insert":
+            tracks = [Track.from_record(data) for data in record["tracks"]]
+            # Duplicadas tornam o registro inválido, seja no fim ou no meio
+            keys = set()
+            for track in tracks:
+                if track.key in keys or track in playlist:
+                    raise TrackExistsError(track.path)
+                keys.add(track.key)
+            if record["index"] >= len(playlist):
+                playlist.add_many(tracks)
+            else:
+                for offset, track in enumerate(tracks):
+                    playlist.insert(record["index"] + offset, track)
+        elif kind == "remove":
+            for _ in range(record.get("count", 1)):
+                playlist.pop(record["index"])
+        elif kind == "move":
+            playlist.move(record["index"], record["to_index"])
+        elif kind == "clear":
+            playlist.clear()
+        elif kind == "mode":
+            restore_mode(playlist, record["mode"], record.get("shuffle"))
+        elif kind == "current":
+            # Avanços no modo "shuffle" são refeitos, para a ordem continuar igual
+            if playlist.mode == "shuffle" and record.get("step") == "next":
+                playlist.next()
+            elif playlist.mode == "shuffle" and record.get("step") == "previous":
+                playlist.previous()
+            playlist.current_index = record["index"]
+
+    def _records_of(self, journal_path: Path) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Itera (tamanho em bytes, registro) das linhas completas de um journal."""
+        try:
+            file = open(journal_path, "rb")
+        except FileNotFoundError:
+            return
+        with file:
+            for line in file:
+                if not line.endswith(b"\n"):
+                    return
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    return
+                yield len(line), record
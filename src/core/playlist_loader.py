@@ -0,0 +1,265 @@
+"""
+Esse módulo contém a classe PlaylistLoader, que
+carrega o snapshot em JSON da playlist (e o journal
+das alterações seguintes) em segundo plano, deixando
+a trilha atual tocável antes de o arquivo inteiro ser lido.
+"""
+import json
+from pathlib import Path
+from threading import Event, Thread
+from typing import IO, Any, Iterator, List, Optional, Tuple
+from src.core.type_hints import PathType
+from src.core.config import (
+    PLAYLIST_PATH,
+    PLAYLIST_JOURNAL_PATH,
+    LOADER_CHUNK_SIZE,
+    LOADER_BATCH_SIZE,
+    LOADER_READY_AHEAD
+)
+from src.exceptions.playlist_exceptions import CorruptedPlaylistFileError
+from src.core.playlist import Playlist
+from src.core.playlist_journal import PlaylistJournal
+from src.core.playlist_snapshot import restore_mode
+from src.core.track import Track
+
+_WHITESPACE = " \t\n\r"
+
+
+class _JsonReader:
+    """Lê valores JSON de um arquivo aos poucos, em pedaços de `chunk_size`."""
+
+    def __init__(self, file: IO[str], chunk_size: int) -> None:
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Lê mais um pedaço, descartando o que já foi consumido. Retorna False no fim."""
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Retorna o próximo caractere que não é espaço, ou "" no fim do arquivo."""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consome o próximo caractere, que precisa ser um de `chars`."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Esperado um de {chars!r}, encontrado {char!r}.")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decodifica o próximo valor JSON completo."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # Um número no fim do buffer pode continuar no próximo pedaço
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_json_snapshot(
+    path: PathType,
+    chunk_size: int = LOADER_CHUNK_SIZE
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Lê um snapshot em JSON aos poucos, gerando `(chave, valor)` para cada
+    campo do objeto e `("track", registro)` para cada trilha de `"tracks"`,
+    à medida que são lidas. Um arquivo vazio não gera nada.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        reader = _JsonReader(file, chunk_size)
+        if not reader.peek():
+            return
+        try:
+            reader.expect("{")
+            if reader.peek() == "}":
+                return
+            while True:
+                key = reader.value()
+                reader.expect(":")
+                if key == "tracks":
+                    reader.expect("[")
+                    if reader.peek() == "]":
+                        reader.expect("]")
+                    else:
+                        while True:
+                            yield "track", reader.value()
+                            if reader.expect(",]") == "]":
+                                break
+                else:
+                    yield key, reader.value()
+                if reader.expect(",}") == "}":
+                    return
+        except ValueError as error:  # JSONDecodeError é um ValueError
+            raise CorruptedPlaylistFileError(str(path)) from error
+
+
+class PlaylistLoader:
+    """
+    Carrega um snapshot em JSON na playlist numa thread de fundo.
+
+    As trilhas são adicionadas em lotes de `batch_size`. O evento `ready`
+    é sinalizado assim que a trilha atual salva e as `ready_ahead`
+    seguintes estão na playlist (ou quando o carregamento termina), então
+    a reprodução pode começar antes do fim:
+
+        loader = PlaylistLoader().start()
+        track = loader.wait_ready()
+        if track is not None:
+            player.play(track.path)
+
+    Durante o carregamento, ler a playlist por posição (`len`, `[]`,
+    `get_current_track`) é seguro; edições devem esperar `wait_loaded`
+    ou ser feitas com `lock`, que é o `Playlist.lock` da playlist. Ele é
+    só um combinado: a Playlist não o toma sozinha, então uma edição feita
+    sem ele concorre com a thread de carregamento.
+
+    No fim, o modo salvo é aplicado e o journal (`journal_path`) é
+    reaplicado com um `PlaylistJournal`, que passa a registrar as
+    alterações seguintes (feche-o com `journal.close()`). As alterações
+    do journal podem mudar a trilha atual depois de `ready`. Com
+    `journal_path` None, só o snapshot é lido.
+    """
+
+    def __init__(
+        self,
+        path: PathType = PLAYLIST_PATH,
+        playlist: Optional[Playlist] = None,
+        batch_size: int = LOADER_BATCH_SIZE,
+        ready_ahead: int = LOADER_READY_AHEAD,
+        journal_path: Optional[PathType] = PLAYLIST_JOURNAL_PATH
+    ) -> None:
+        self.path = Path(path)
+        self.playlist = Playlist() if playlist is None else playlist
+        self.journal = None if journal_path is None else PlaylistJournal(self.path, journal_path)
+        self.batch_size = batch_size
+        self.ready_ahead = ready_ahead
+        self.ready = Event()
+        self.loaded = Event()
+        self.lock = self.playlist.lock  # Tomado a cada lote adicionado
+        self.error: Optional[Exception] = None
+        self._cancelled = False
+        self._current_index: Optional[int] = None
+        self._thread = Thread(target=self._run, name="playlist-loader", daemon=True)
+
+    def start(self) -> "PlaylistLoader":
+        """Começa o carregamento em segundo plano (nada, se já foi cancelado)."""
+        if not self._cancelled:
+            self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """Interrompe o carregamento depois do lote atual (o journal não é reaplicado)."""
+        self._cancelled = True
+        if self._thread.ident is not None:
+            self._thread.join()
+        else:  # Nunca começou
+            self.ready.set()
+            self.loaded.set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> Optional[Track]:
+        """
+        Espera a playlist ficar pronta e retorna a trilha atual (ou None se
+        ela estiver vazia ou o tempo acabar). Repassa o erro do carregamento.
+        """
+        if not self.ready.wait(timeout):
+            return None
+        if self.error is not None:
+            raise self.error
+        return self.playlist.get_current_track()
+
+    def wait_loaded(self, timeout: Optional[float] = None) -> bool:
+        """Espera o carregamento terminar. Repassa o erro do carregamento."""
+        finished = self.loaded.wait(timeout)
+        if self.error is not None:
+            raise self.error
+        return finished
+
+    def _run(self) -> None:
+        mode = None
+        shuffle = None
+        journal_generation = 0
+        batch: List[Track] = []
+        try:
+            for key, value in iter_json_snapshot(self.path):
+                if self._cancelled:
+                    return
+                if key == "track":
+                    batch.append(Track.from_record(value))
+                    if len(batch) >= self.batch_size or self._completes_ready(len(batch)):
+                        self._add_batch(batch)
+                        batch = []
+                elif key == "mode":
+                    mode = value
+                elif key == "shuffle":
+                    shuffle = value
+                elif key == "journal_generation":
+                    journal_generation = value
+                elif key == "current_index":
+                    self._current_index = value
+                    self._check_ready()
+            self._add_batch(batch)
+            with self.lock:
+                current = self._current_index
+                if current is not None and 0 <= current < len(self.playlist):
+                    self.playlist.current_index = current
+                if mode is not None:
+                    restore_mode(self.playlist, mode, shuffle)
+                if self.journal is not None and not self._cancelled:
+                    self.journal.recover(self.playlist, journal_generation)
+        except Exception as error:  # pylint: disable=broad-except
+            self.error = error
+        finally:
+            self.ready.set()
+            self.loaded.set()
+
+    def _completes_ready(self, pending: int) -> bool:
+        """Verifica se o lote pendente já basta para a playlist ficar pronta."""
+        if self.ready.is_set() or self._current_index is None:
+            return False
+        return len(self.playlist) + pending > self._current_index + self.ready_ahead
+
+    def _add_batch(self, batch: List[Track]) -> None:
+        if not batch:
+            return
+        with self.lock:
+            self.playlist.add_many(batch)
+        self._check_ready()
+
+    def _check_ready(self) -> None:
+        """Aplica a trilha atual salva e sinaliza `ready` quando ela e as seguintes existem."""
+        if self.ready.is_set() or self._current_index is None:
+            return
+        if len(self.playlist) > self._current_index + self.ready_ahead:
+            with self.lock:
+                self.playlist.current_index = self._current_index
+            self.ready.set()
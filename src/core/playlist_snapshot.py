@@ -0,0 +1,423 @@
+"""
+Esse módulo contém os formatos de snapshot da
+Playlist: o JSON, usado para importar e exportar,
+e um formato binário mapeado em memória (mmap),
+usado para iniciar rápido com playlists grandes.
+"""
+import json
+import mmap
+import os
+import sys
+from array import array
+from itertools import chain
+from math import isnan
+from pathlib import Path, PurePath
+from struct import Struct
+from typing import IO, Any, Dict, Iterator, List, Optional, Set, Tuple, Unpack
+from src.core.type_hints import (
+    PathType,
+    PlaylistModes,
+    PlaylistSnapshot,
+    PlaylistDebugOptions,
+    ShuffleState,
+    TrackId,
+    TrackKey
+)
+from src.core.config import PLAYLIST_MODES
+from src.exceptions.playlist_exceptions import CorruptedPlaylistFileError
+from src.utils.files_utils import atomic_write
+from src.core.playlist import Playlist
+from src.core.track import Track
+from src.core.track_store import TrackStorage
+
+# Formato binário (little-endian):
+#   cabeçalho | tabela de sources | tabela de linhas | ordem na playlist | heap de strings
+#   | ordem aleatória
+# As linhas ficam na ordem original de inserção; a ordem na playlist é um
+# array de números de linha. Strings são (offset, tamanho) no heap, em UTF-8.
+# A ordem aleatória (`Playlist.shuffle_state`, só no modo "shuffle") são as
+# posições de "order" e de "pool" (arrays) e o resto do estado em JSON.
+_MAGIC = b"PLSNAP\x00\x01"
+_VERSION = 2
+_VERSION_WITHOUT_SHUFFLE = 1  # Ainda lida: sem a ordem aleatória
+_PREFIX = Struct("<8sH")
+# magic, versão, modo, index atual (-1 = None), linhas, sources,
+# offset das sources, das linhas, da ordem e do heap
+_HEADER_V1 = Struct("<8sHBxqQIxxxxQQQQ")
+# ... e offset da ordem aleatória, tamanhos de "order" e "pool" e do JSON (0 = sem ela)
+_HEADER = Struct("<8sHBxqQIxxxxQQQQQQQQ")
+_STRING = Struct("<QI")
+# path (offset, tamanho), título (offset, tamanho), source, flags, duração
+_ROW = Struct("<QIQIHBxd")
+_NO_TITLE = 0xFFFFFFFF
+_NO_DURATION = float("nan")
+_PATH_OBJECT_FLAG = 1  # O path original era um `Path`, não uma `str`
+
+
+def _identity(entry: Any) -> Any:
+    return entry
+
+
+def read_json(path: PathType) -> PlaylistSnapshot:
+    """
+    Lê um snapshot em JSON. Um arquivo vazio ou inexistente
+    é uma playlist vazia.
+    """
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        text = ""
+    if not text.strip():
+        return {
+            "mode": "loop", "current_index": None, "tracks": [], "shuffle": None,
+            "journal_generation": 0
+        }
+    try:
+        data = json.loads(text)
+        return {
+            "mode": data.get("mode", "loop"),
+            "current_index": data.get("current_index"),
+            "tracks": list(data["tracks"]),
+            "shuffle": data.get("shuffle"),
+            "journal_generation": int(data.get("journal_generation", 0))
+        }
+    except (ValueError, KeyError, TypeError, AttributeError) as error:
+        raise CorruptedPlaylistFileError(str(path)) from error
+
+
+def write_json(
+    playlist: Playlist,
+    path: PathType,
+    mode: Optional[PlaylistModes] = None,
+    shuffle: Optional[ShuffleState] = None,
+    journal_generation: int = 0
+) -> None:
+    """
+    Grava a playlist em JSON, de forma atômica. `mode` e `shuffle`
+    substituem o modo e a ordem aleatória da playlist. `journal_generation`
+    é a geração do último journal já aplicado nela (ver PlaylistJournal).
+    """
+    data: PlaylistSnapshot = {
+        "mode": playlist.mode if mode is None else mode,
+        "current_index": playlist.current_index,
+        "tracks": [track.to_record() for track in playlist],
+        "shuffle": playlist.shuffle_state() if shuffle is None else shuffle,
+        "journal_generation": journal_generation
+    }
+    atomic_write(
+        Path(path),
+        lambda file: file.write(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+    )
+
+
+def import_json(path: PathType, playlist: Optional[Playlist] = None) -> Playlist:
+    """Carrega um snapshot em JSON numa playlist (vazia), criando uma se não for dada."""
+    data = read_json(path)
+    playlist = Playlist() if playlist is None else playlist
+    playlist.add_many(map(Track.from_record, data["tracks"]))
+    if data["current_index"] is not None and len(playlist):
+        playlist.current_index = data["current_index"]
+    restore_mode(playlist, data["mode"], data["shuffle"])
+    return playlist
+
+
+def restore_mode(
+    playlist: Playlist,
+    mode: PlaylistModes,
+    shuffle: Optional[ShuffleState]
+) -> None:
+    """
+    Aplica um modo salvo na playlist, restaurando a ordem aleatória salva
+    se houver (uma inválida é ignorada, e uma nova ordem começa).
+    """
+    if mode == "shuffle" and shuffle is not None and len(playlist):
+        try:
+            playlist.restore_shuffle(shuffle)
+            return
+        except (LookupError, TypeError, ValueError):
+            pass
+    playlist.mode = mode
+
+
+def write_binary(playlist: Playlist, path: PathType) -> None:
+    """Grava a playlist no formato binário, de forma atômica."""
+    tracks = playlist.get_all(in_original_pos=True)
+    row_of: Dict[TrackId, int] = {track.id: row for row, track in enumerate(tracks)}
+    order = array("I", (row_of[track.id] for track in playlist))
+    heap = bytearray()
+    strings: Dict[str, Tuple[int, int]] = {}
+
+    def put_string(value: str) -> Tuple[int, int]:
+        """Guarda uma string (uma vez só) no heap e retorna (offset, tamanho)."""
+        location = strings.get(value)
+        if location is None:
+            encoded = value.encode("utf-8", "surrogateescape")
+            location = strings[value] = (len(heap), len(encoded))
+            heap.extend(encoded)
+        return location
+
+    sources: List[str] = []
+    source_codes: Dict[str, int] = {}
+    rows = bytearray()
+    for track in tracks:
+        source_code = source_codes.get(track.source)
+        if source_code is None:
+            source_code = source_codes[track.source] = len(sources)
+            sources.append(track.source)
+        path_bytes = os.fspath(track.path).encode("utf-8", "surrogateescape")
+        path_offset = len(heap)
+        heap.extend(path_bytes)
+        title_offset, title_size = (
+            (0, _NO_TITLE) if track.title is None else put_string(track.title))
+        rows += _ROW.pack(
+            path_offset, len(path_bytes),
+            title_offset, title_size,
+            source_code,
+            _PATH_OBJECT_FLAG if isinstance(track.path, PurePath) else 0,
+            _NO_DURATION if track.duration is None else track.duration
+        )
+    source_table = b"".join(_STRING.pack(*put_string(source)) for source in sources)
+    if sys.byteorder == "big":
+        order.byteswap()
+
+    shuffle = playlist.shuffle_state()
+    shuffle_order, shuffle_pool, shuffle_meta = array("I"), array("I"), b""
+    if shuffle is not None:
+        shuffle_order.extend(shuffle["order"])
+        shuffle_pool.extend(shuffle["pool"])
+        shuffle_meta = json.dumps({
+            "seed": shuffle["seed"],
+            "random_state": shuffle["random_state"],
+            "cursor": shuffle["cursor"]
+        }).encode("utf-8")
+        if sys.byteorder == "big":
+            shuffle_order.byteswap()
+            shuffle_pool.byteswap()
+
+    sources_offset = _HEADER.size
+    rows_offset = sources_offset + len(source_table)
+    order_offset = rows_offset + len(rows)
+    heap_offset = order_offset + len(order) * order.itemsize
+    shuffle_offset = heap_offset + len(heap)
+    current_index = -1 if playlist.current_index is None else playlist.current_index
+    header = _HEADER.pack(
+        _MAGIC, _VERSION, PLAYLIST_MODES.index(playlist.mode), current_index,
+        len(tracks), len(sources),
+        sources_offset, rows_offset, order_offset, heap_offset,
+        shuffle_offset, len(shuffle_order), len(shuffle_pool), len(shuffle_meta)
+    )
+
+    def write(file: IO[bytes]) -> None:
+        for part in (
+            header, source_table, rows, order.tobytes(), heap,
+            shuffle_order.tobytes(), shuffle_pool.tobytes(), shuffle_meta
+        ):
+            file.write(part)
+
+    atomic_write(Path(path), write)
+
+
+def load_binary(
+    path: PathType,
+    *,
+    debug: bool = False,
+    **debug_options: Unpack[PlaylistDebugOptions]
+) -> Playlist:
+    """
+    Carrega um snapshot binário sem ler as trilhas: o arquivo é mapeado
+    em memória e cada `Track` só é criada quando acessada.
+
+    A playlist usa uma `MappedTrackStore`, que mantém o arquivo aberto.
+    No modo "shuffle", a ordem aleatória salva é restaurada.
+    """
+    store = MappedTrackStore(path)
+    playlist = Playlist(store=store, debug=debug, **debug_options)
+    playlist._load_entries(store.order(), store.current_index)  # pylint: disable=protected-access
+    restore_mode(playlist, store.mode, store.shuffle_state())
+    return playlist
+
+
+class MappedTrackStore(TrackStorage):
+    """
+    Armazenamento sobre um snapshot binário mapeado em memória (mmap).
+
+    Cada entrada é o número de uma linha (que também é o id da trilha);
+    as linhas do arquivo são lidas só quando acessadas, criando uma `Track`
+    nova (uma view, como na `TrackStore`). Trilhas adicionadas depois do
+    carregamento ficam em memória, em linhas após as do arquivo.
+
+    O índice `(path, source) -> linha`, usado para verificar duplicadas,
+    só é montado na primeira verificação, lendo todas as linhas.
+    """
+    entry_key = staticmethod(_identity)
+
+    def __init__(self, path: PathType) -> None:
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._read_header()
+        except (ValueError, OSError) as error:
+            self._file.close()
+            raise CorruptedPlaylistFileError(str(self.path)) from error
+        self._added: List[Track] = []
+        self._discarded: Set[int] = set()
+        self._live_from = 0  # Linhas antes dessa foram descartadas por `clear`...
+        self._revived: Set[int] = set()  # ...menos essas, de volta por `revive`
+        self._rows_by_key: Optional[Dict[TrackKey, int]] = None
+
+    def _read_header(self) -> None:
+        magic, version = _PREFIX.unpack_from(self._map, 0)
+        if magic != _MAGIC or version not in (_VERSION, _VERSION_WITHOUT_SHUFFLE):
+            raise ValueError("Cabeçalho inválido.")
+        if version == _VERSION:
+            (
+                _, _, mode, current_index, self._size, sources_size,
+                sources_offset, self._rows_offset, self._order_offset, self._heap_offset,
+                self._shuffle_offset, shuffle_order_size, shuffle_pool_size, shuffle_meta_size
+            ) = _HEADER.unpack_from(self._map, 0)
+        else:
+            (
+                _, _, mode, current_index, self._size, sources_size,
+                sources_offset, self._rows_offset, self._order_offset, self._heap_offset
+            ) = _HEADER_V1.unpack_from(self._map, 0)
+            self._shuffle_offset = shuffle_order_size = shuffle_pool_size = shuffle_meta_size = 0
+        self._shuffle_sizes = (shuffle_order_size, shuffle_pool_size, shuffle_meta_size)
+        if mode >= len(PLAYLIST_MODES):
+            raise ValueError("Cabeçalho inválido.")
+        shuffle_end = self._shuffle_offset + 4 * (shuffle_order_size + shuffle_pool_size) + shuffle_meta_size
+        if self._heap_offset > len(self._map) or shuffle_end > len(self._map):
+            raise ValueError("Arquivo truncado.")
+        self.mode: PlaylistModes = PLAYLIST_MODES[mode]
+        self.current_index: Optional[int] = None if current_index < 0 else current_index
+        self._sources = [
+            self._string(*_STRING.unpack_from(self._map, sources_offset + i * _STRING.size))
+            for i in range(sources_size)
+        ]
+
+    def _string(self, offset: int, size: int) -> str:
+        start = self._heap_offset + offset
+        return self._map[start:start + size].decode("utf-8", "surrogateescape")
+
+    def order(self) -> List[int]:
+        """Retorna as linhas do arquivo na ordem da playlist."""
+        order = array("I")
+        order.frombytes(self._map[self._order_offset:self._order_offset + self._size * 4])
+        if sys.byteorder == "big":
+            order.byteswap()
+        return order.tolist()
+
+    def shuffle_state(self) -> Optional[ShuffleState]:
+        """Retorna a ordem aleatória salva (como `Playlist.shuffle_state`), ou None."""
+        order_size, pool_size, meta_size = self._shuffle_sizes
+        if not meta_size:
+            return None
+        positions = array("I")
+        start = self._shuffle_offset
+        positions.frombytes(self._map[start:start + 4 * (order_size + pool_size)])
+        if sys.byteorder == "big":
+            positions.byteswap()
+        start += 4 * (order_size + pool_size)
+        try:
+            meta = json.loads(self._map[start:start + meta_size])
+            return {
+                "seed": meta["seed"],
+                "random_state": meta["random_state"],
+                "order": positions[:order_size].tolist(),
+                "cursor": meta["cursor"],
+                "pool": positions[order_size:].tolist()
+            }
+        except (ValueError, KeyError, TypeError):  # Inválida: uma nova ordem começa
+            return None
+
+    def _read_row(self, row: int) -> Track:
+        path_offset, path_size, title_offset, title_size, source, flags, duration = (
+            _ROW.unpack_from(self._map, self._rows_offset + row * _ROW.size))
+        path = self._string(path_offset, path_size)
+        track = Track.__new__(Track)
+        track.path = Path(path) if flags & _PATH_OBJECT_FLAG else path
+        track.source = self._sources[source]
+        track.title = None if title_size == _NO_TITLE else self._string(title_offset, title_size)
+        track.duration = None if isnan(duration) else duration
+        track.id = row
+        return track
+
+    def _index(self) -> Dict[TrackKey, int]:
+        """Monta (uma única vez) o índice de pertinência lendo todas as linhas."""
+        if self._rows_by_key is None:
+            self._rows_by_key = {
+                self._read_row(row).key: row
+                for row in chain(self._revived, range(self._live_from, self._size))
+                if row < self._size and not self._is_discarded(row)
+            }
+            for offset, track in enumerate(self._added):
+                if not self._is_discarded(self._size + offset):
+                    self._rows_by_key[track.key] = self._size + offset
+        return self._rows_by_key
+
+    def key_of(self, track: Track) -> Optional[int]:
+        return self._index().get(track.key)
+
+    def put(self, track: Track) -> int:
+        row = self._size + len(self._added)
+        added = Track(track.path, track.source, title=track.title, duration=track.duration)
+        added.id = row  # Uma cópia: a trilha adicionada não é alterada
+        self._added.append(added)
+        if self._rows_by_key is not None:
+            self._rows_by_key[track.key] = row
+        return row
+
+    def _is_discarded(self, entry: int) -> bool:
+        if entry < self._live_from:
+            return entry not in self._revived
+        return entry in self._discarded
+
+    def get(self, entry: int) -> Track:
+        if entry >= self._size:
+            return self._added[entry - self._size]
+        return self._read_row(entry)
+
+    def discard(self, entry: int) -> None:
+        if self._is_discarded(entry):
+            return
+        if self._rows_by_key is not None:
+            del self._rows_by_key[self.get(entry).key]
+        if entry < self._live_from:
+            self._revived.discard(entry)
+        else:
+            self._discarded.add(entry)
+
+    def revive(self, entry: int) -> None:
+        if not self._is_discarded(entry):
+            return
+        if self._rows_by_key is not None:
+            self._rows_by_key[self.get(entry).key] = entry
+        if entry < self._live_from:
+            self._revived.add(entry)
+        else:
+            self._discarded.discard(entry)
+
+    def get_by_id(self, track_id: TrackId) -> Optional[int]:
+        if isinstance(track_id, int) and 0 <= track_id < self._size + len(self._added):
+            if not self._is_discarded(track_id):
+                return track_id
+        return None
+
+    def entries(self) -> Iterator[int]:
+        return chain(
+            sorted(self._revived),
+            (row for row in range(self._live_from, self._size + len(self._added))
+             if row not in self._discarded)
+        )
+
+    def clear(self) -> None:
+        # As linhas não são reaproveitadas, para que os ids continuem únicos
+        self._live_from = self._size + len(self._added)
+        self._discarded = set()
+        self._revived = set()
+        self._rows_by_key = {}
+
+    def close(self) -> None:
+        """Fecha o arquivo mapeado; as trilhas do arquivo deixam de ser acessíveis."""
+        self._map.close()
+        self._file.close()
@@ -0,0 +1,225 @@
+"""
+Esse módulo contém a classe PlaylistSync, que
+espelha a Playlist na playlist interna do mpv
+enviando só as alterações.
+"""
+from os.path import isabs
+from threading import Lock, RLock
+from typing import Any, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+from src.core.type_hints import PlaylistChange, PlaylistModes
+from src.core.config import LOGGING_SCOPES
+from src.utils.logging_utils import log
+from src.core.playlist import Playlist
+from src.core.track import Track
+
+_LOGGING_SCOPE = "playlist_sync"
+
+# Propriedades de repetição do mpv para cada modo: (loop-file, loop-playlist)
+_LOOP_OPTIONS = {
+    "loop": ("no", "inf"),
+    "one_repeat": ("inf", "no"),
+    "shuffle": ("no", "inf")
+}
+
+_Command = Tuple[Any, ...]
+
+# Quem controla a playlist interna de cada mpv (um PlaylistSync ou uma GaplessQueue)
+_controllers: "WeakKeyDictionary[Any, Any]" = WeakKeyDictionary()
+_controllers_lock = Lock()
+
+
+def claim_mpv_playlist(player: Any, controller: Any) -> None:
+    """
+    Marca `controller` como o único que altera a playlist interna de
+    `player`, desligando (`detach`) o anterior, se houver: dois deles no
+    mesmo mpv desfariam as alterações um do outro.
+    """
+    with _controllers_lock:
+        previous = _controllers.get(player)
+        _controllers[player] = controller
+    if previous is not None and previous is not controller:
+        previous.detach()
+
+
+def release_mpv_playlist(player: Any, controller: Any) -> None:
+    """Desfaz o `claim_mpv_playlist` de `controller`, se ele ainda controla `player`."""
+    with _controllers_lock:
+        if _controllers.get(player) is controller:
+            del _controllers[player]
+
+
+def _path_of(track: Track) -> str:
+    return str(track.path)
+
+
+def _listable(path: str) -> bool:
+    """Verifica se o path pode ir numa playlist em memória (`loadlist memory://`)."""
+    return (isabs(path) or "://" in path) and "\n" not in path and not path.startswith("#")
+
+
+class PlaylistSync:
+    """
+    Mantém a playlist interna de um `mpv.MPV` igual a uma Playlist.
+
+    Cada alteração da playlist vira os comandos equivalentes do mpv
+    (`loadfile`/`loadlist` para inserções, `playlist-remove`,
+    `playlist-move`, `playlist-play-index`), enviados em lote por
+    `command_async`, sem recarregar a playlist nem esperar as respostas.
+    Com a playlist inteira no mpv, ele mesmo passa para a próxima trilha
+    (e pode prepará-la antes), sem passar pelo Python.
+
+    As mudanças de `playlist-pos` observadas no mpv voltam para a playlist
+    (`Playlist.select`). No modo "shuffle", o mpv avança em ordem, então
+    um avanço feito por ele é trocado pela próxima trilha da ordem aleatória.
+    As observações chegam na thread de eventos do mpv e são ignoradas
+    enquanto há comandos pendentes (as posições ainda podem mudar); a
+    playlist só é alterada com `Playlist.lock`, que as edições feitas em
+    outra thread também devem tomar.
+
+    Só um PlaylistSync ou uma GaplessQueue controla cada mpv: criar um
+    desliga o anterior (ver `claim_mpv_playlist`).
+    """
+
+    def __init__(self, player: Any, playlist: Playlist) -> None:
+        """
+        Começa a espelhar `playlist` no `player` (um `mpv.MPV`): a playlist
+        do mpv é substituída pelas trilhas atuais, sem começar a reprodução.
+        """
+        self._player = player
+        self.playlist = playlist
+        self._lock = RLock()
+        self._pending = 0  # Comandos enviados sem resposta
+        self._stale = False  # Houve uma observação ignorada por comandos pendentes
+        self._playing: Optional[int] = None  # Posição do mpv, segundo o que foi enviado
+        self._length = 0  # Tamanho da playlist do mpv, segundo o que foi enviado
+        self._insert_at = getattr(player, "mpv_version_tuple", (0, 0, 0)) >= (0, 38, 0)
+        self._attached = True
+        claim_mpv_playlist(player, self)
+        commands: List[_Command] = [("stop",)]
+        commands += self._insert_commands(0, list(playlist))
+        commands += self._mode_commands(playlist.mode)
+        self._send(commands)
+        playlist.add_listener(self._on_change)
+        player.observe_property("playlist-pos", self._on_position)
+
+    def detach(self) -> None:
+        """Para de espelhar a playlist (a playlist do mpv fica como está)."""
+        with self._lock:
+            if not self._attached:
+                return
+            self._attached = False
+        self.playlist.remove_listener(self._on_change)
+        self._player.unobserve_property("playlist-pos", self._on_position)
+        release_mpv_playlist(self._player, self)
+
+    def play(self) -> None:
+        """Começa a tocar a trilha atual da playlist no mpv."""
+        if self.playlist.current_index is not None:
+            with self._lock:
+                self._playing = self.playlist.current_index
+            self._send([("playlist-play-index", self.playlist.current_index)])
+
+    def _send(self, commands: List[_Command]) -> None:
+        """Envia os comandos em sequência pelo `command_async`, sem esperar."""
+        if not commands:
+            return
+        with self._lock:
+            self._pending += len(commands)
+            for command in commands:
+                self._player.command_async(*command, callback=self._on_reply)
+
+    def _on_reply(self, error: Optional[Exception], result: Any) -> Any:
+        """Resposta de um comando (na thread de eventos do mpv)."""
+        if error is not None:
+            log("Falha num comando da playlist do mpv: %r", "error",
+                LOGGING_SCOPES[_LOGGING_SCOPE], args=(error,))
+        with self._lock:
+            self._pending -= 1
+            recheck = self._pending == 0 and self._stale
+            self._stale = False if recheck else self._stale
+        if recheck:  # Uma observação foi ignorada: lê a posição atual
+            self._on_position("playlist-pos", self._player.playlist_pos)
+        return result
+
+    def _insert_commands(self, index: int, tracks: List[Track]) -> List[_Command]:
+        """Comandos que inserem `tracks` em `index` na playlist do mpv."""
+        paths = list(map(_path_of, tracks))
+        at_end = index >= self._length
+        self._length += len(paths)
+        if len(paths) > 1 and (at_end or self._insert_at) and all(map(_listable, paths)):
+            listing = "memory://" + "\n".join(paths)
+            if at_end:
+                return [("loadlist", listing, "append")]
+            return [("loadlist", listing, "insert-at", index)]
+        if at_end:
+            return [("loadfile", path, "append") for path in paths]
+        if self._insert_at:
+            return [
+                ("loadfile", path, "insert-at", index + offset)
+                for offset, path in enumerate(paths)
+            ]
+        # Sem "insert-at" (mpv < 0.38): acrescenta no fim e move para a posição
+        last = self._length - len(paths)
+        commands: List[_Command] = []
+        for offset, path in enumerate(paths):
+            commands.append(("loadfile", path, "append"))
+            commands.append(("playlist-move", last + offset, index + offset))
+        return commands
+
+    def _mode_commands(self, mode: PlaylistModes) -> List[_Command]:
+        loop_file, loop_playlist = _LOOP_OPTIONS[mode]
+        return [("set", "loop-file", loop_file), ("set", "loop-playlist", loop_playlist)]
+
+    def _on_change(self, change: PlaylistChange) -> None:
+        """Listener da playlist: envia ao mpv os comandos da alteração."""
+        kind = change["kind"]
+        commands: List[_Command] = []
+        if kind == "insert":
+            commands = self._insert_commands(change["index"], change["tracks"])
+        elif kind == "remove":
+            commands = [("playlist-remove", change["index"])] * len(change["tracks"])
+            self._length -= len(change["tracks"])
+        elif kind == "move":
+            from_index, to_index = change["index"], change["to_index"]
+            # O mpv move a entrada para o lugar de `to_index`, antes dela
+            commands = [("playlist-move", from_index, to_index + (from_index < to_index))]
+        elif kind == "clear":
+            commands = [("stop",)]
+            self._length = 0
+        elif kind == "mode":
+            commands = self._mode_commands(change["mode"])
+        with self._lock:
+            if kind == "current":
+                if change["index"] is not None and change["index"] != self._playing:
+                    commands = [("playlist-play-index", change["index"])]
+                    self._playing = change["index"]
+            elif self._playing is not None:
+                # O mpv desloca a posição como a playlist desloca a trilha atual
+                self._playing = self.playlist.current_index
+        self._send(commands)
+
+    def _on_position(self, _name: str, position: Optional[int]) -> None:
+        """Observador de `playlist-pos` (na thread de eventos do mpv)."""
+        if position is None or position < 0:
+            return
+        with self._lock:
+            if not self._attached:
+                return
+            if self._pending:
+                self._stale = True
+                return
+            if position == self._playing:
+                return
+            # O mpv avançou sozinho para a seguinte (ou voltou ao início, em loop)
+            natural = self._playing is not None and (
+                position == self._playing + 1 or position == 0 == self._length - 1 - self._playing)
+            self._playing = position
+        with self.playlist.lock:  # Fora do `_lock`: o listener o toma com `Playlist.lock`
+            if position >= len(self.playlist):
+                return
+            if natural and self.playlist.mode == "shuffle":
+                self.playlist.next(force_next=True)  # Notifica o listener, que toca a trilha
+            else:
+                self.playlist.select(position)
+
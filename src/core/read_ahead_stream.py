@@ -0,0 +1,232 @@
+"""
+Esse módulo contém a classe ReadAheadStream, um
+stream para os protocolos do mpv (`register_stream_protocol`)
+que lê a fonte adiante numa thread, num buffer circular.
+"""
+import io
+import os
+from threading import Condition, Thread
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Optional
+from src.core.config import STREAM_READ_AHEAD, STREAM_CHUNK_SIZE
+
+# Gera os pedaços da fonte a partir de um offset
+_Source = Callable[[int], Iterable[bytes]]
+
+
+class ReadAheadStream:
+    """
+    Stream do mpv (com `read`, `readinto`, `seek`, `size`, `close` e
+    `cancel`) que não deixa as leituras do mpv esperando código Python.
+
+    Uma thread produtora percorre a fonte e copia os pedaços num buffer
+    circular de `budget` bytes (um `bytearray` fixo, com o início e o
+    tamanho dos dados não lidos), parando quando ele enche. As leituras
+    do mpv só copiam do buffer, sem concatenar nem refatiar `bytes`:
+    o custo de cada leitura não depende do tamanho dos pedaços da fonte.
+
+    `source(offset)` gera os pedaços da fonte a partir de `offset`. Com
+    `seekable`, um `seek` para fora do que já está no buffer recomeça a
+    fonte no offset pedido (um arquivo, uma requisição HTTP com Range);
+    sem, ela recomeça do início e descarta os bytes até lá. Um `seek`
+    para a frente, dentro do buffer, só descarta o que foi pulado.
+
+        stream = ReadAheadStream.from_file(open(path, "rb"))
+        player.register_stream_protocol("meu", lambda uri: stream)
+
+    Um erro da fonte é repassado pela leitura, depois dos dados já lidos.
+    """
+
+    def __init__(
+        self,
+        source: _Source,
+        size: Optional[int] = None,
+        seekable: bool = True,
+        budget: int = STREAM_READ_AHEAD,
+        on_close: Optional[Callable[[], Any]] = None
+    ) -> None:
+        self.size = size
+        self._source = source
+        self._seekable = seekable
+        self._on_close = on_close
+        self._buffer = bytearray(budget)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # Índice, no buffer, do primeiro byte não lido
+        self._filled = 0  # Bytes não lidos no buffer
+        self._position = 0  # Offset, na fonte, do primeiro byte não lido
+        self._eof = False
+        self._error: Optional[Exception] = None
+        self._closed = False
+        self._generation = 0  # Muda a cada recomeço da fonte
+        self._condition = Condition()
+        self._thread = Thread(target=self._produce, name="read-ahead-stream", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_generator(
+        cls,
+        generator_fun: Callable[[], Iterable[bytes]],
+        size: Optional[int] = None,
+        budget: int = STREAM_READ_AHEAD
+    ) -> "ReadAheadStream":
+        """Stream de um gerador (sem offset): o `seek` o recomeça e descarta bytes até lá."""
+        return cls(lambda _offset: generator_fun(), size, seekable=False, budget=budget)
+
+    @classmethod
+    def from_file(
+        cls,
+        file: BinaryIO,
+        size: Optional[int] = None,
+        budget: int = STREAM_READ_AHEAD,
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> "ReadAheadStream":
+        """
+        Stream de um arquivo binário aberto (com `seek`), que passa a ser do
+        stream: é fechado com ele. Só a thread produtora usa o arquivo.
+        """
+        if size is None:
+            try:
+                size = os.fstat(file.fileno()).st_size
+            except (OSError, io.UnsupportedOperation):  # BytesIO, por exemplo
+                size = file.seek(0, os.SEEK_END)
+
+        def chunks(offset: int) -> Iterator[bytes]:
+            file.seek(offset)
+            while True:
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+        return cls(chunks, size, budget=budget, on_close=file.close)
+
+    @property
+    def position(self) -> int:
+        """Offset, na fonte, do próximo byte lido."""
+        return self._position
+
+    def readinto(self, buffer: Any) -> int:
+        """
+        Copia os próximos bytes para `buffer` (o buffer do próprio mpv) e
+        retorna quantos foram copiados; 0 é o fim. Só bloqueia com o buffer
+        circular vazio.
+        """
+        target = memoryview(buffer).cast("B")
+        with self._condition:
+            while not self._filled and not (self._eof or self._error or self._closed):
+                self._condition.wait()
+            if not self._filled:
+                if self._error is not None and not self._closed:
+                    raise self._error
+                return 0
+            count = min(len(target), self._filled)
+            first = min(count, len(self._buffer) - self._start)
+            target[:first] = self._view[self._start:self._start + first]
+            target[first:count] = self._view[:count - first]
+            self._consume(count)
+            return count
+
+    def read(self, size: int) -> bytes:
+        """Como `readinto`, para quem precisa de `bytes`."""
+        buffer = bytearray(size)
+        count = self.readinto(buffer)
+        del buffer[count:]
+        return bytes(buffer)
+
+    def seek(self, offset: int) -> int:
+        """Vai para `offset` e retorna o novo offset."""
+        with self._condition:
+            skip = offset - self._position
+            if 0 <= skip <= self._filled:
+                self._consume(skip)
+                return offset
+            self._generation += 1
+            self._start = self._filled = 0
+            self._position = offset
+            self._eof = False
+            self._error = None
+            self._condition.notify_all()
+            return offset
+
+    def cancel(self) -> None:
+        """Interrompe uma leitura em andamento: as próximas retornam o fim."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """
+        Para a thread produtora, que fecha a fonte (`on_close`) assim que
+        ela devolver o pedaço atual.
+        """
+        self.cancel()
+
+    def _consume(self, count: int) -> None:
+        """Descarta os `count` primeiros bytes não lidos (com a condição tomada)."""
+        self._start = (self._start + count) % len(self._buffer)
+        self._filled -= count
+        self._position += count
+        self._condition.notify_all()
+
+    def _produce(self) -> None:
+        generation = -1
+        try:
+            while True:
+                with self._condition:
+                    while generation == self._generation and not self._closed:
+                        self._condition.wait()
+                    if self._closed:
+                        return
+                    generation, offset = self._generation, self._position
+                self._fill(generation, offset)
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+
+    def _fill(self, generation: int, offset: int) -> None:
+        """Copia a fonte para o buffer até o fim, um erro ou um recomeço (`seek`, `close`)."""
+        skip = 0 if self._seekable else offset
+        chunks: Optional[Iterator[bytes]] = None
+        error: Optional[Exception] = None
+        try:
+            chunks = iter(self._source(offset if self._seekable else 0))
+            for chunk in chunks:
+                data = memoryview(chunk).cast("B")
+                if skip:
+                    skipped = min(skip, len(data))
+                    data, skip = data[skipped:], skip - skipped
+                while data:
+                    written = self._write(generation, data)
+                    if written < 0:
+                        return
+                    data = data[written:]
+        except Exception as source_error:  # pylint: disable=broad-except
+            error = source_error
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+        with self._condition:
+            if generation == self._generation:
+                self._eof = error is None
+                self._error = error
+                self._condition.notify_all()
+
+    def _write(self, generation: int, data: memoryview) -> int:
+        """
+        Copia o que couber de `data` no buffer, esperando espaço. Retorna
+        quantos bytes foram copiados, ou -1 se a fonte deve parar.
+        """
+        with self._condition:
+            size = len(self._buffer)
+            while self._filled == size and generation == self._generation and not self._closed:
+                self._condition.wait()
+            if generation != self._generation or self._closed:
+                return -1
+            count = min(len(data), size - self._filled)
+            end = (self._start + self._filled) % size
+            first = min(count, size - end)
+            self._view[end:end + first] = data[:first]
+            self._view[:count - first] = data[first:count]
+            self._filled += count
+            self._condition.notify_all()
+            return count
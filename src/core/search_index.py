@@ -0,0 +1,328 @@
+"""
+Esse módulo contém a classe SearchIndex, um índice
+de trigramas sobre os títulos e paths das trilhas
+da Playlist, para buscas por trechos de texto.
+"""
+import re
+from bisect import bisect_right
+from itertools import accumulate
+from os import fspath
+from os.path import split
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from unicodedata import normalize
+from src.core.type_hints import PlaylistChange, TrackId
+from src.core.config import SEARCH_RESULTS_LIMIT
+from src.core.playlist import Playlist
+from src.core.track import Track
+
+_COMBINING_MARKS = re.compile("[\u0300-\u036f]")
+_SEPARATORS = re.compile(r"[\W_]+")
+_CHUNK_SIZE = 256  # Documentos por bloco
+_TITLE, _PATH = 0, 1
+# Níveis de relevância, do melhor ao pior: (campo, começo de palavra)
+_TIERS = ((_TITLE, True), (_TITLE, False), (_PATH, True), (_PATH, False))
+
+
+def fold(text: str) -> str:
+    """Normaliza um texto para busca: sem acentos e sem diferença de caixa."""
+    return _COMBINING_MARKS.sub("", normalize("NFKD", text)).casefold()
+
+
+def _normalize(text: str) -> str:
+    """Texto indexado: `fold` com separadores trocados por espaço e um espaço no início."""
+    return " " + _SEPARATORS.sub(" ", fold(text)).strip()
+
+
+def _trigrams(text: str) -> Set[str]:
+    return set(map("".join, zip(text, text[1:], text[2:])))
+
+
+def _keys(text: str) -> Set[str]:
+    """
+    Chaves indexadas de um texto normalizado: os trigramas e, para cada
+    palavra, " " + a primeira letra e " " + as três primeiras (começos de palavra).
+    """
+    keys = _trigrams(text)
+    for word in text.split():
+        keys.add(" " + word[:1])
+        keys.add(" " + word[:3])
+    return keys
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Itera os números dos bits ligados de `mask`, do menor ao maior."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class _Chunk:
+    """Bloco de documentos, com o texto de cada campo juntado para buscas em C."""
+    __slots__ = ("fields", "track_ids", "_joined")
+
+    def __init__(self) -> None:
+        self.fields: Tuple[List[str], List[str]] = ([], [])
+        self.track_ids: List[Optional[TrackId]] = []
+        self._joined: Optional[List[Tuple[str, List[int]]]] = None
+
+    def invalidate(self) -> None:
+        self._joined = None
+
+    def joined(self, field: int) -> Tuple[str, List[int]]:
+        """Retorna os textos do campo juntados por "\\n" e o início de cada um."""
+        if self._joined is None:
+            self._joined = [
+                ("\n".join(texts), [0, *accumulate(len(text) + 1 for text in texts)])
+                for texts in self.fields
+            ]
+        return self._joined[field]
+
+
+class SearchIndex:
+    """
+    Índice de trigramas mantido junto com a Playlist.
+
+    Cada trilha vira um documento com o título e o path normalizados
+    (sem acentos, sem caixa e com separadores como espaço: "acao" acha
+    "Ação"). Os documentos ficam em blocos de `_CHUNK_SIZE`, e cada
+    trigrama (e cada começo de palavra) guarda, por campo, uma máscara
+    de bits dos blocos que o contêm. Uma busca combina as máscaras da
+    consulta e procura os termos (`str.find`, em C) só nos blocos possíveis.
+    Termos com 3 letras ou mais são buscados em qualquer parte do texto;
+    termos menores, só no começo de palavras.
+
+    Os resultados vêm por relevância: termos no começo de palavras do
+    título, no título, no começo de palavras do path e no path. A busca
+    para assim que os melhores `limit` resultados são conhecidos.
+
+    O índice acompanha a playlist pelos seus listeners; remover só apaga
+    o texto do documento, e o índice é refeito quando metade está morta.
+    """
+
+    def __init__(self, playlist: Optional[Playlist] = None) -> None:
+        """Cria o índice e, se `playlist` for dada, indexa e acompanha as suas trilhas."""
+        self.clear()
+        self._playlist = playlist
+        if playlist is not None:
+            self.add_many(playlist)
+            playlist.add_listener(self._on_change)
+
+    def clear(self) -> None:
+        """Remove todas as trilhas do índice."""
+        self._chunks: List[_Chunk] = []
+        # Por campo: chave (ver `_keys`) -> máscara de bits dos blocos que a contêm
+        self._postings: Tuple[Dict[str, int], Dict[str, int]] = ({}, {})
+        # Chaves e diretórios já registrados do último bloco (o único que recebe documentos)
+        self._open_keys: Tuple[Set[str], Set[str]] = (set(), set())
+        self._open_dirs: Dict[str, str] = {}
+        self._locations: Dict[TrackId, Tuple[int, int]] = {}
+        self._dead = 0
+
+    def detach(self) -> None:
+        """Para de acompanhar a playlist."""
+        if self._playlist is not None:
+            self._playlist.remove_listener(self._on_change)
+            self._playlist = None
+
+    def add(self, track: Track) -> None:
+        """Indexa uma trilha (uma já indexada é reindexada)."""
+        if track.id in self._locations:
+            self.remove(track)
+        number = self._open_chunk()
+        bit = 1 << number
+        title = _normalize(track.title or "")
+        self._register(_TITLE, _keys(title), bit)
+        # Trilhas do mesmo diretório são comuns: as chaves dele são
+        # registradas uma vez por bloco, e as do nome do arquivo a cada trilha
+        head, name = split(fspath(track.path))
+        directory = self._open_dirs.get(head)
+        if directory is None:
+            directory = self._open_dirs[head] = _normalize(head) if head else ""
+            self._register(_PATH, _keys(directory), bit)
+        name = _normalize(name)
+        self._register(_PATH, _keys(directory[-2:] + name), bit)
+        self._store(number, track.id, title, directory + name)
+
+    def add_many(self, tracks: Iterable[Track]) -> None:
+        """Indexa várias trilhas."""
+        for track in tracks:
+            self.add(track)
+
+    def _open_chunk(self) -> int:
+        """Retorna o número do bloco que recebe documentos, criando um se estiver cheio."""
+        chunks = self._chunks
+        if not chunks or len(chunks[-1].track_ids) >= _CHUNK_SIZE:
+            chunks.append(_Chunk())
+            self._open_keys = (set(), set())
+            self._open_dirs = {}
+        return len(chunks) - 1
+
+    def _register(self, field: int, keys: Set[str], bit: int) -> None:
+        """Liga o bit do bloco nas chaves ainda não registradas para ele."""
+        open_keys = self._open_keys[field]
+        new = keys - open_keys
+        if new:
+            open_keys.update(new)
+            postings = self._postings[field]
+            for key in new:
+                postings[key] = postings.get(key, 0) | bit
+
+    def _store(self, number: int, track_id: TrackId, title: str, path: str) -> None:
+        chunk = self._chunks[number]
+        chunk.fields[_TITLE].append(title)
+        chunk.fields[_PATH].append(path)
+        self._locations[track_id] = (number, len(chunk.track_ids))
+        chunk.track_ids.append(track_id)
+        chunk.invalidate()
+
+    def remove(self, track: Track) -> None:
+        """Remove uma trilha do índice, se estiver nele."""
+        location = self._locations.pop(track.id, None)
+        if location is None:
+            return
+        number, index = location
+        chunk = self._chunks[number]
+        chunk.fields[_TITLE][index] = chunk.fields[_PATH][index] = ""
+        chunk.track_ids[index] = None
+        chunk.invalidate()
+        self._dead += 1
+        if self._dead > len(self._locations) + 1024:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Refaz o índice só com os documentos vivos."""
+        alive = [
+            (track_id, (chunk.fields[_TITLE][index], chunk.fields[_PATH][index]))
+            for chunk in self._chunks
+            for index, track_id in enumerate(chunk.track_ids) if track_id is not None
+        ]
+        self.clear()
+        for track_id, (title, path) in alive:
+            number = self._open_chunk()
+            self._register(_TITLE, _keys(title), 1 << number)
+            self._register(_PATH, _keys(path), 1 << number)
+            self._store(number, track_id, title, path)
+
+    def _on_change(self, change: PlaylistChange) -> None:
+        """Listener da playlist: mantém o índice igual a ela."""
+        kind = change["kind"]
+        if kind == "insert":
+            self.add_many(change["tracks"])
+        elif kind == "remove":
+            for track in change["tracks"]:
+                self.remove(track)
+        elif kind == "clear":
+            self.clear()
+
+    def _mask(self, field: int, term: str, word_start: bool = False) -> int:
+        """Máscara dos blocos que podem conter `term` no campo (no começo de uma palavra)."""
+        postings = self._postings[field]
+        mask = (1 << len(self._chunks)) - 1
+        if word_start or len(term) < 3:
+            mask &= postings.get(" " + term[:3], 0)
+        for trigram in _trigrams(term):
+            if not mask:
+                break
+            mask &= postings.get(trigram, 0)
+        return mask
+
+    def _tier(self, chunk: _Chunk, index: int, terms: List[str]) -> Optional[int]:
+        """Nível de relevância de um documento, ou None se algum termo não está nele."""
+        title = chunk.fields[_TITLE][index]
+        path = chunk.fields[_PATH][index]
+        worst = 0
+        for term in terms:
+            spaced = " " + term
+            short = len(term) < 3  # Só vale no começo de palavras
+            if spaced in title:
+                tier = 0
+            elif not short and term in title:
+                tier = 1
+            elif spaced in path:
+                tier = 2
+            elif not short and term in path:
+                tier = 3
+            else:
+                return None
+            worst = max(worst, tier)
+        return worst
+
+    def search_ids(self, query: str, limit: int = SEARCH_RESULTS_LIMIT) -> List[TrackId]:
+        """
+        Busca as trilhas cujo título ou path contém todas as palavras
+        de `query` e retorna os ids, dos mais relevantes aos menos.
+        """
+        terms = _normalize(query).split()
+        if not terms or limit <= 0:
+            return []
+        masks: Dict[Tuple[int, str, bool], int] = {}
+
+        def mask(position: Tuple[int, bool], term: str) -> int:
+            field, word_start = position
+            if not word_start and len(term) < 3:  # Termos curtos: só começo de palavra
+                return 0
+            key = (field, term, word_start)
+            if key not in masks:
+                masks[key] = self._mask(field, term, word_start)
+            return masks[key]
+
+        # As passadas procuram o termo presente em menos blocos
+        first = min(terms, key=lambda term: (
+            (mask(_TIERS[1], term) | mask(_TIERS[3], term)).bit_count(), -len(term)))
+
+        # Na passada do nível L, os termos podem estar nas posições dos níveis
+        # <= L; um documento achado vai para o balde do seu nível real (o pior
+        # entre os termos). Ao fim da passada L, todos os documentos de nível
+        # <= L são conhecidos, então a busca para ao juntar `limit` deles.
+        buckets: List[List[Tuple[int, int]]] = [[] for _ in _TIERS]
+        seen: Set[Tuple[int, int]] = set()
+        for level in range(len(_TIERS)):
+            known = sum(len(bucket) for bucket in buckets[:level + 1])
+            if known >= limit:
+                break
+            allowed = _TIERS[:level + 1]
+            candidates = (1 << len(self._chunks)) - 1
+            for term in terms:
+                term_mask = 0
+                for position in allowed:
+                    term_mask |= mask(position, term)
+                candidates &= term_mask
+            for position in allowed:
+                field, word_start = position
+                pattern = " " + first if word_start else first
+                for number in _bits(mask(position, first) & candidates):
+                    chunk = self._chunks[number]
+                    text, starts = chunk.joined(field)
+                    found = text.find(pattern)
+                    while found >= 0:
+                        index = bisect_right(starts, found) - 1
+                        if (number, index) not in seen:
+                            seen.add((number, index))
+                            tier = self._tier(chunk, index, terms)
+                            if tier is not None:
+                                buckets[tier].append((number, index))
+                                if tier <= level:
+                                    known += 1
+                                    if known >= limit:
+                                        break
+                        found = text.find(pattern, starts[index + 1])
+                    if known >= limit:
+                        break
+                if known >= limit:
+                    break
+        chunks = self._chunks
+        return [
+            chunks[number].track_ids[index]
+            for bucket in buckets for number, index in sorted(bucket)
+        ][:limit]
+
+    def search(self, query: str, limit: int = SEARCH_RESULTS_LIMIT) -> List[Track]:
+        """Como `search_ids`, mas retorna as trilhas da playlist acompanhada."""
+        if self._playlist is None:
+            raise ValueError("O índice não acompanha uma playlist; use `search_ids`.")
+        get_by_id = self._playlist.get_by_id
+        return [get_by_id(track_id) for track_id in self.search_ids(query, limit)]
+
+    def __len__(self) -> int:
+        return len(self._locations)
@@ -0,0 +1,252 @@
+"""
+Esse módulo contém a classe ShuffleOrder, a ordem
+aleatória usada pela Playlist no modo "shuffle".
+"""
+from random import Random, randrange
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+_REMOVED = object()  # Marca uma posição removida da ordem já sorteada
+
+
+class ShuffleOrder:
+    """
+    Permutação aleatória gerada sob demanda (Fisher–Yates preguiçoso).
+
+    As chaves ainda não sorteadas ficam num "pool"; cada sorteio troca
+    a escolhida com a última do pool e a remove, em O(1). A ordem já
+    sorteada fica em `_order`, com um cursor para andar para frente e
+    para trás. Adicionar uma chave só a coloca no pool, e remover marca
+    a posição, sem refazer a permutação. Quando o pool acaba, um novo
+    ciclo começa com as mesmas chaves (ao avançar para ele, não ao
+    espiar a próxima chave).
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[Hashable] = (),
+        first: Optional[Hashable] = None,
+        seed: Optional[int] = None
+    ) -> None:
+        """
+        Cria a ordem sobre `keys`. Se `first` for dado, ele é
+        a primeira chave da ordem (a trilha que já está tocando).
+        """
+        self.seed = randrange(2**32) if seed is None else seed
+        self._random = Random(self.seed)
+        self._pool: List[Hashable] = list(keys)
+        # Chaves do pool que não valem mais: removidas ou já sorteadas.
+        # Cópias iguais são indistinguíveis, então basta uma contagem.
+        self._dead: Dict[Hashable, int] = {}
+        self._order: List[object] = []
+        self._position: Dict[Hashable, int] = {}
+        self._removed = 0
+        self._cursor = -1
+        # Primeira chave do próximo ciclo, já sorteada por `peek_next` no
+        # fim do ciclo atual, com o resto do pool dele e o estado do
+        # gerador antes do sorteio
+        self._next_cycle: Optional[Tuple[Hashable, List[Hashable], object]] = None
+        if first is not None:
+            self._kill(first)
+            self._materialize(first)
+            self._cursor = 0
+
+    def _kill(self, key: Hashable) -> None:
+        """Marca uma cópia de `key` no pool como inválida."""
+        self._dead[key] = self._dead.get(key, 0) + 1
+
+    def _materialize(self, key: Hashable) -> None:
+        self._position[key] = len(self._order)
+        self._order.append(key)
+
+    def _draw(self) -> bool:
+        """Sorteia a próxima chave do pool para o fim da ordem. Retorna False se acabou."""
+        pool = self._pool
+        dead = self._dead
+        while pool:
+            index = self._random.randrange(len(pool))
+            pool[index], pool[-1] = pool[-1], pool[index]
+            key = pool.pop()
+            count = dead.get(key)
+            if count:
+                if count == 1:
+                    del dead[key]
+                else:
+                    dead[key] = count - 1
+                continue
+            self._materialize(key)
+            return True
+        return False
+
+    def _peek_cycle(self) -> Optional[Hashable]:
+        """Sorteia (uma vez só) a primeira chave do próximo ciclo, sem começá-lo."""
+        if self._next_cycle is None:
+            pool = [key for key in self._order if key is not _REMOVED]
+            if not pool:
+                return None
+            random_state = self._random.getstate()
+            index = self._random.randrange(len(pool))
+            pool[index], pool[-1] = pool[-1], pool[index]
+            self._next_cycle = (pool.pop(), pool, random_state)
+        return self._next_cycle[0]
+
+    def _new_cycle(self) -> None:
+        """Começa o ciclo sorteado por `_peek_cycle`, descartando a ordem atual."""
+        first, pool, _ = self._next_cycle
+        self._next_cycle = None
+        self._pool = pool
+        self._dead.clear()
+        self._order = []
+        self._position = {}
+        self._removed = 0
+        self._materialize(first)
+
+    def current(self) -> Optional[Hashable]:
+        """Retorna a chave atual, ou None se nenhuma foi sorteada."""
+        if 0 <= self._cursor < len(self._order):
+            key = self._order[self._cursor]
+            return None if key is _REMOVED else key
+        return None
+
+    def peek_next(self) -> Optional[Hashable]:
+        """
+        Retorna a próxima chave sem avançar (sorteando-a se preciso). No fim
+        do ciclo, é a primeira do próximo, mas a ordem atual é mantida.
+        """
+        order = self._order
+        index = self._cursor + 1
+        while True:
+            while index < len(order):
+                if order[index] is not _REMOVED:
+                    return order[index]
+                index += 1
+            if not self._draw():
+                break
+        return self._peek_cycle()
+
+    def next(self) -> Optional[Hashable]:
+        """Avança para a próxima chave e a retorna."""
+        key = self.peek_next()
+        if key is not None:
+            position = self._position.get(key)
+            if position is None or position <= self._cursor:  # A primeira do próximo ciclo
+                self._new_cycle()
+                position = 0
+            self._cursor = position
+        return key
+
+    def peek_previous(self) -> Optional[Hashable]:
+        """Retorna a chave anterior sem voltar, ou None no início do ciclo."""
+        index = self._cursor - 1
+        while index >= 0:
+            if self._order[index] is not _REMOVED:
+                return self._order[index]
+            index -= 1
+        return None
+
+    def previous(self) -> Optional[Hashable]:
+        """Volta para a chave anterior e a retorna, ou None no início do ciclo."""
+        key = self.peek_previous()
+        if key is not None:
+            self._cursor = self._position[key]
+        return key
+
+    def add(self, key: Hashable) -> None:
+        """Adiciona uma chave ao pool de ainda não sorteadas."""
+        self._cancel_cycle()
+        self._pool.append(key)
+
+    def _cancel_cycle(self) -> None:
+        """Desfaz o sorteio do próximo ciclo (as chaves dele mudaram)."""
+        if self._next_cycle is not None:
+            self._random.setstate(self._next_cycle[2])
+            self._next_cycle = None
+
+    def discard(self, key: Hashable) -> None:
+        """Remove uma chave da ordem, sorteada ou não."""
+        self._cancel_cycle()
+        position = self._position.pop(key, None)
+        if position is None:
+            self._kill(key)
+            return
+        self._order[position] = _REMOVED
+        self._removed += 1
+        if self._removed > len(self._order) // 2 + 32:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Descarta as posições removidas da ordem já sorteada."""
+        # O cursor passa a apontar para a última chave válida até ele
+        # (se a atual foi removida, a próxima válida continua sendo a próxima)
+        live_until_cursor = sum(
+            1 for key in self._order[:self._cursor + 1] if key is not _REMOVED)
+        self._order = [key for key in self._order if key is not _REMOVED]
+        self._position = {key: index for index, key in enumerate(self._order)}
+        self._removed = 0
+        self._cursor = live_until_cursor - 1
+
+    def sorted_keys(self) -> List[Hashable]:
+        """Retorna as chaves já sorteadas, em ordem."""
+        return [key for key in self._order if key is not _REMOVED]
+
+    def _purge(self) -> None:
+        """Tira do pool as cópias inválidas, mantendo a ordem das demais."""
+        dead = self._dead
+        if not dead:
+            return
+        pool = []
+        for key in self._pool:
+            count = dead.get(key)
+            if count:
+                if count == 1:
+                    del dead[key]
+                else:
+                    dead[key] = count - 1
+                continue
+            pool.append(key)
+        self._pool = pool
+
+    def state(self) -> Dict[str, object]:
+        """
+        Retorna o estado para persistência: a semente, o estado do gerador,
+        as chaves já sorteadas, o cursor entre elas e o pool das ainda não
+        sorteadas, na ordem dele. Uma ordem recriada com `from_state`
+        continua sorteando as mesmas chaves que essa.
+        """
+        self._purge()  # Assim o pool salvo é exatamente o que os sorteios usam
+        keys = self.sorted_keys()
+        cursor = sum(1 for key in self._order[:self._cursor + 1] if key is not _REMOVED) - 1
+        if self._next_cycle is not None:  # O sorteio do próximo ciclo é refeito igual
+            random_state = self._next_cycle[2]
+        else:
+            random_state = self._random.getstate()
+        version, internal, gauss = random_state
+        return {
+            "seed": self.seed,
+            "random_state": [version, list(internal), gauss],
+            "order": keys,
+            "cursor": cursor,
+            "pool": list(self._pool)
+        }
+
+    @classmethod
+    def from_state(
+        cls,
+        pool: Iterable[Hashable],
+        order: List[Hashable],
+        cursor: int,
+        seed: int,
+        random_state: Optional[List[object]] = None
+    ) -> "ShuffleOrder":
+        """
+        Recria a ordem salva sem sortear de novo: as chaves já sorteadas
+        voltam na mesma ordem, o pool na ordem salva e o gerador continua
+        de onde parou.
+        """
+        shuffle = cls(pool, seed=seed)
+        if random_state is not None:
+            version, internal, gauss = random_state
+            shuffle._random.setstate((version, tuple(internal), gauss))
+        for key in order:
+            shuffle._materialize(key)
+        shuffle._cursor = cursor
+        return shuffle
@@ -0,0 +1,61 @@
+"""
+Esse módulo contém a classe Track,
+que representa uma trilha de áudio
+dentro da playlist.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from uuid import uuid4
+from typing import Optional
+from src.core.type_hints import (
+    AudioPathType,
+    AudioSourceType,
+    TrackId,
+    TrackKey,
+    TrackRecord
+)
+
+
+@dataclass(eq=False, slots=True)
+class Track:
+    """Representa uma trilha na playlist."""
+    path: AudioPathType
+    source: AudioSourceType = "local"
+    title: Optional[str] = field(default=None, kw_only=True)
+    duration: Optional[float] = field(default=None, kw_only=True)
+    id: TrackId = field(init=False, default_factory=lambda: uuid4().hex)
+
+    def __eq__(self, other):
+        if not isinstance(other, Track):
+            return NotImplemented
+        return (
+            self.path == other.path and
+            self.source == other.source
+        )
+
+    def __str__(self) -> str:
+        return f"{self.path} - {self.source}"
+
+    @property
+    def key(self) -> TrackKey:
+        """Chave que identifica a trilha, a mesma usada no `__eq__`."""
+        return (self.path, self.source)
+
+    def to_record(self) -> TrackRecord:
+        """Retorna os dados persistíveis da trilha."""
+        return {
+            "path": str(self.path),
+            "source": self.source,
+            "title": self.title,
+            "duration": self.duration
+        }
+
+    @classmethod
+    def from_record(cls, record: TrackRecord) -> "Track":
+        """Cria uma trilha a partir dos dados persistidos (o path vira um `Path`)."""
+        return cls(
+            Path(record["path"]),
+            record.get("source", "local"),
+            title=record.get("title"),
+            duration=record.get("duration")
+        )
@@ -0,0 +1,353 @@
+"""
+Esse módulo contém os armazenamentos de trilhas
+usados pela Playlist: a TrackTable, que guarda as
+próprias instâncias de Track, e a TrackStore, um
+armazenamento em colunas compacto para bibliotecas grandes.
+"""
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+from math import isnan
+from os import altsep, fspath, sep
+from pathlib import Path, PurePath
+from typing import Any, Callable, Deque, Dict, Hashable, Iterator, List, Optional, Tuple
+from src.core.track import Track
+from src.core.type_hints import AudioPathType, TrackId, TrackKey
+
+_NO_DURATION = float("nan")
+_PATH_OBJECT_FLAG = 1  # O path original era um `Path`, não uma `str`
+_DISCARDED_FLAG = 2  # A linha foi descartada (e pode estar livre)
+_ROW_SIZE = 4 + 1 + 1 + 8 + 8 + 2 * 8  # Colunas em arrays e ponteiros nas listas de uma linha
+
+
+def _identity(entry: Any) -> Any:
+    return entry
+
+
+def _split(path: AudioPathType) -> Tuple[str, str]:
+    """Divide o path em (diretório com o separador final, nome), sem normalizá-lo."""
+    path = fspath(path)
+    cut = max(path.rfind(sep), path.rfind(altsep) if altsep else -1) + 1
+    return path[:cut], path[cut:]
+
+
+class TrackStorage(ABC):
+    """
+    Contrato base dos armazenamentos de trilhas da Playlist.
+
+    A playlist guarda apenas "entradas" na sua sequência; o armazenamento
+    decide o que é uma entrada e como transformá-la de volta numa `Track`.
+
+    Entradas descartadas continuam legíveis por `get` enquanto um estado
+    da playlist criado antes do descarte (ver `pin`) puder guardá-las, e
+    voltam a ser armazenadas com `revive`.
+    """
+    entry_key: Callable[[Any], Hashable]  # Chave da entrada usada pela BlockList
+
+    @abstractmethod
+    def key_of(self, track: Track) -> Optional[Hashable]:
+        """Retorna a chave de entrada da trilha, ou None se ela não está armazenada."""
+
+    @abstractmethod
+    def put(self, track: Track) -> Any:
+        """Armazena uma trilha e retorna a sua entrada."""
+
+    @abstractmethod
+    def get(self, entry: Any) -> Track:
+        """Retorna a trilha de uma entrada."""
+
+    @abstractmethod
+    def discard(self, entry: Any) -> None:
+        """Descarta uma entrada armazenada."""
+
+    @abstractmethod
+    def revive(self, entry: Any) -> None:
+        """Volta a armazenar uma entrada descartada (ao desfazer uma remoção)."""
+
+    @abstractmethod
+    def get_by_id(self, track_id: TrackId) -> Optional[Any]:
+        """Retorna a entrada da trilha com esse id, ou None."""
+
+    @abstractmethod
+    def entries(self) -> Iterator[Any]:
+        """Itera as entradas na ordem original de inserção."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Descarta todas as entradas."""
+
+    def entry_size(self, entry: Any) -> int:
+        """Estima os bytes que uma entrada mantém vivos no armazenamento."""
+        return sys.getsizeof(entry)
+
+    def pin(self) -> Any:
+        """
+        Chamado a cada estado da playlist criado (`Playlist.snapshot`). Se
+        retornar algo além de None, o retorno é passado a `unpin` quando o
+        estado deixar de existir.
+        """
+        return None
+
+    def unpin(self, token: Any) -> None:
+        """Chamado quando um estado marcado por `pin` deixa de existir."""
+
+
+class TrackTable(TrackStorage):
+    """
+    Armazenamento padrão: cada entrada é a própria instância de `Track`.
+
+    A chave da entrada é o `id()` do objeto, que a sequência compara em C;
+    um dicionário (path, source) -> trilha responde a pertinência e outro,
+    id -> trilha, as buscas por id na ordem original.
+    """
+    entry_key = staticmethod(id)
+
+    def __init__(self) -> None:
+        self._tracks_by_key: Dict[TrackKey, Track] = {}
+        # Mapa id -> trilha, na ordem original de inserção
+        self._tracks_by_id: Dict[TrackId, Track] = {}
+
+    def key_of(self, track: Track) -> Optional[int]:
+        stored = self._tracks_by_key.get(track.key)
+        return None if stored is None else id(stored)
+
+    def put(self, track: Track) -> Track:
+        self._tracks_by_key[track.key] = track
+        self._tracks_by_id[track.id] = track
+        return track
+
+    def get(self, entry: Track) -> Track:
+        return entry
+
+    def discard(self, entry: Track) -> None:
+        del self._tracks_by_key[entry.key]
+        del self._tracks_by_id[entry.id]
+
+    def revive(self, entry: Track) -> None:
+        self.put(entry)
+
+    def entry_size(self, entry: Track) -> int:
+        return sum(map(sys.getsizeof, (entry, entry.path, fspath(entry.path), entry.title, entry.id)))
+
+    def get_by_id(self, track_id: TrackId) -> Optional[Track]:
+        return self._tracks_by_id.get(track_id)
+
+    def entries(self) -> Iterator[Track]:
+        return iter(self._tracks_by_id.values())
+
+    def clear(self) -> None:
+        self._tracks_by_key.clear()
+        self._tracks_by_id.clear()
+
+
+class TrackStore(TrackStorage):
+    """
+    Armazenamento em colunas para bibliotecas grandes.
+
+    Cada trilha vira uma linha: o diretório do path é guardado uma vez
+    numa tabela compartilhada, o nome do arquivo numa lista, a duração num
+    `array('d')` e os flags num `array('B')`. As `Track` retornadas são
+    views criadas no acesso: alterá-las não altera o que está armazenado,
+    e a trilha adicionada também não é alterada.
+
+    O id de uma trilha armazenada é o das views: um inteiro compacto com o
+    número de série da inserção e a linha (`serial << 32 | linha`), e não
+    o id da trilha adicionada. Duas trilhas são a mesma pela regra da
+    `Track` (path e source iguais, com `str` e `Path` diferentes), como na
+    `TrackTable`.
+
+    As linhas descartadas são reaproveitadas por trilhas novas assim que
+    nenhum estado da playlist (`Playlist.snapshot`) criado antes do
+    descarte continua vivo (ver `pin`); o número de série muda a cada
+    reaproveitamento, então os ids antigos não voltam a valer.
+    """
+    entry_key = staticmethod(_identity)
+
+    def __init__(self) -> None:
+        self._reset()
+        self._epoch = 0  # Conta os descartes
+        self._pins: Dict[int, int] = {}  # Época -> estados vivos criados nela
+        self._unpinned: Deque[int] = deque()
+
+    def _reset(self) -> None:
+        """Descarta todas as linhas e tabelas de uma vez."""
+        self._dirs: List[str] = []
+        self._dir_codes: Dict[str, int] = {}
+        self._sources: List[str] = []
+        self._source_codes: Dict[str, int] = {}
+        # (diretório, source, path é `Path`) -> {nome do arquivo -> linha}
+        self._rows: Dict[Tuple[int, int, bool], Dict[str, int]] = {}
+        self._row_dir = array("I")
+        self._row_source = array("B")
+        self._row_flags = array("B")
+        self._row_serial = array("Q")  # Ordem de inserção (e parte do id)
+        self._row_name: List[str] = []
+        self._titles: List[Optional[str]] = []
+        self._durations = array("d")
+        self._serial = 0
+        self._alive = 0
+        self._free: List[int] = []  # Linhas que podem ser reaproveitadas
+        self._pending: Dict[int, int] = {}  # Linha descartada -> época do descarte
+
+    def pin(self) -> int:
+        """
+        Marca um estado da playlist criado agora, que pode guardar as linhas
+        vivas: elas não são reaproveitadas enquanto ele não for solto por `unpin`.
+        """
+        self._pins[self._epoch] = self._pins.get(self._epoch, 0) + 1
+        return self._epoch
+
+    def unpin(self, token: int) -> None:
+        """
+        Solta um estado marcado por `pin`. Pode ser chamado por qualquer
+        thread (quando o estado é coletado): as linhas que só ele guardava
+        são liberadas na próxima trilha armazenada.
+        """
+        self._unpinned.append(token)
+
+    def _collect(self) -> None:
+        """Solta os estados de `unpin` e libera as linhas que nenhum estado vivo guarda."""
+        while self._unpinned:
+            token = self._unpinned.popleft()
+            count = self._pins.pop(token) - 1
+            if count:
+                self._pins[token] = count
+        oldest = min(self._pins) if self._pins else self._epoch
+        pending = self._pending
+        while pending:
+            row, epoch = next(iter(pending.items()))
+            if epoch > oldest:  # Um estado vivo é anterior ao descarte
+                break
+            del pending[row]
+            self._release(row)
+
+    def _release(self, row: int) -> None:
+        """Coloca uma linha descartada na lista de reaproveitamento."""
+        self._row_name[row] = ""
+        self._titles[row] = None
+        self._free.append(row)
+
+    def clear(self) -> None:
+        if self._unpinned:
+            self._collect()
+        if not self._pins:
+            self._reset()
+            return
+        for row in list(self.entries()):
+            self.discard(row)
+
+    def _is_discarded(self, entry: int) -> bool:
+        return bool(self._row_flags[entry] & _DISCARDED_FLAG)
+
+    def _code(self, value: str, table: List[str], codes: Dict[str, int]) -> int:
+        """Retorna o código de `value` na tabela, criando se não existir."""
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(table)
+            table.append(value)
+        return code
+
+    def key_of(self, track: Track) -> Optional[int]:
+        head, name = _split(track.path)
+        dir_code = self._dir_codes.get(head)
+        source_code = self._source_codes.get(track.source)
+        if dir_code is None or source_code is None:
+            return None
+        names = self._rows.get((dir_code, source_code, isinstance(track.path, PurePath)))
+        return None if names is None else names.get(name)
+
+    def put(self, track: Track) -> int:
+        if self._unpinned:
+            self._collect()
+        head, name = _split(track.path)
+        dir_code = self._code(head, self._dirs, self._dir_codes)
+        source_code = self._code(track.source, self._sources, self._source_codes)
+        is_path = isinstance(track.path, PurePath)
+        flags = _PATH_OBJECT_FLAG if is_path else 0
+        duration = _NO_DURATION if track.duration is None else track.duration
+        self._serial += 1
+        if self._free:
+            row = self._free.pop()
+            self._row_dir[row] = dir_code
+            self._row_source[row] = source_code
+            self._row_flags[row] = flags
+            self._row_serial[row] = self._serial
+            self._row_name[row] = name
+            self._titles[row] = track.title
+            self._durations[row] = duration
+        else:
+            row = len(self._row_name)
+            self._row_dir.append(dir_code)
+            self._row_source.append(source_code)
+            self._row_flags.append(flags)
+            self._row_serial.append(self._serial)
+            self._row_name.append(name)
+            self._titles.append(track.title)
+            self._durations.append(duration)
+        self._rows.setdefault((dir_code, source_code, is_path), {})[name] = row
+        self._alive += 1
+        return row
+
+    def entry_size(self, entry: int) -> int:
+        title = self._titles[entry]
+        return _ROW_SIZE + sys.getsizeof(self._row_name[entry]) + (
+            0 if title is None else sys.getsizeof(title))
+
+    def get(self, entry: int) -> Track:
+        path = self._dirs[self._row_dir[entry]] + self._row_name[entry]
+        duration = self._durations[entry]
+        track = Track.__new__(Track)
+        track.path = Path(path) if self._row_flags[entry] & _PATH_OBJECT_FLAG else path
+        track.source = self._sources[self._row_source[entry]]
+        track.title = self._titles[entry]
+        track.duration = None if isnan(duration) else duration
+        track.id = self._row_serial[entry] << 32 | entry
+        return track
+
+    def _names(self, entry: int) -> Dict[str, int]:
+        """Mapa nome do arquivo -> linha do grupo da linha `entry`."""
+        key = (
+            self._row_dir[entry],
+            self._row_source[entry],
+            bool(self._row_flags[entry] & _PATH_OBJECT_FLAG)
+        )
+        return self._rows.setdefault(key, {})
+
+    def discard(self, entry: int) -> None:
+        if self._is_discarded(entry):
+            return
+        names = self._names(entry)
+        if names.get(self._row_name[entry]) == entry:
+            del names[self._row_name[entry]]
+        self._row_flags[entry] |= _DISCARDED_FLAG
+        self._alive -= 1
+        self._epoch += 1
+        if self._pins:
+            self._pending[entry] = self._epoch
+        else:
+            self._release(entry)
+
+    def revive(self, entry: int) -> None:
+        if not self._is_discarded(entry):
+            return
+        del self._pending[entry]  # Só estados marcados guardam linhas descartadas
+        self._names(entry)[self._row_name[entry]] = entry
+        self._row_flags[entry] &= ~_DISCARDED_FLAG
+        self._alive += 1
+
+    def get_by_id(self, track_id: TrackId) -> Optional[int]:
+        if isinstance(track_id, int):
+            row = track_id & 0xFFFFFFFF
+            if row < len(self._row_name) and not self._is_discarded(row):
+                if self._row_serial[row] == track_id >> 32:
+                    return row
+        return None
+
+    def entries(self) -> Iterator[int]:
+        rows = [row for row in range(len(self._row_name)) if not self._is_discarded(row)]
+        rows.sort(key=self._row_serial.__getitem__)  # Já em ordem se nada foi reaproveitado
+        return iter(rows)
+
+    def __len__(self) -> int:
+        return self._alive
@@ -2,7 +2,7 @@
 Esse módulo contém as tipagens estáticas usadas
 em todo a aplicação.
 """
-from typing import TypedDict, Literal, Optional, TypeAlias, Union, Tuple
+from typing import TypedDict, Literal, Optional, TypeAlias, Union, Tuple, List, Any
 from pathlib import Path
 
 PathType: TypeAlias = Union[str, Path]
@@ -14,6 +14,9 @@ AudioOutputType: TypeAlias = Optional[str]
 AudioChannelType: TypeAlias = Literal["stereo", "mono", "auto"]
 AudioPathType: TypeAlias = PathType
 AudioSourceType = Literal["local"]
+TrackKey: TypeAlias = Tuple[AudioPathType, AudioSourceType] # Identifica uma trilha (path, source)
+TrackId: TypeAlias = Union[str, int] # uuid hex, ou o id compacto dado pelo TrackStore
+FileStamp: TypeAlias = Tuple[int, int] # (tamanho, mtime em ns) de um arquivo
 
 class PlayerOptions(TypedDict):
     """
@@ -55,9 +58,26 @@ class PlayerProperties(TypedDict, total=True):
 
 PlaylistModes = Literal[
     "loop", # Loop infinito
-    "one_repeat" # Loop em apenas uma trilha
+    "one_repeat", # Loop em apenas uma trilha
+    "shuffle" # Ordem aleatória, em loop
 ]
 
+class ShuffleState(TypedDict):
+    """
+    Representa um dicionário tipado com o estado persistível
+    do modo "shuffle" da Playlist.
+    - seed: int -> Semente usada para gerar a ordem.
+    - random_state: list -> Estado do gerador aleatório, para continuar de onde parou.
+    - order: list[int] -> Posições na playlist das trilhas já sorteadas, em ordem.
+    - cursor: int -> Posição da trilha atual em `order`.
+    - pool: list[int] -> Posições na playlist das trilhas ainda não sorteadas, na ordem do pool.
+    """
+    seed: int
+    random_state: List[object]
+    order: List[int]
+    cursor: int
+    pool: List[int]
+
 LoggingLevel = Literal["info", "debug", "warning", "error", "critical"]
 
 class PlaylistDebugOptions(TypedDict, total=False):
@@ -68,6 +88,7 @@ class PlaylistDebugOptions(TypedDict, total=False):
     log_in_file: bool
     clear_old_log: bool
     allowed_logging_levels: Tuple[LoggingLevel, ...]
+    element_logs_per_second: float # Limite de logs por elemento (ex.: __getitem__)
 
 class PlaylistDebugConfig(TypedDict):
     """
@@ -77,3 +98,92 @@ class PlaylistDebugConfig(TypedDict):
     log_in_file: bool
     clear_old_log: bool
     allowed_logging_levels: Tuple[LoggingLevel, ...]
+    element_logs_per_second: float # Limite de logs por elemento (ex.: __getitem__)
+
+class TrackRecord(TypedDict):
+    """
+    Representa um dicionário tipado com os dados
+    persistíveis de uma Track (ex.: em JSON).
+    """
+    path: str
+    source: AudioSourceType
+    title: Optional[str]
+    duration: Optional[float]
+
+PlaylistChangeKind = Literal[
+    "insert", # Trilhas inseridas a partir de `index`
+    "remove", # Trilhas (em `tracks`) removidas a partir de `index`
+    "move", # Trilha movida de `index` para `to_index`
+    "clear", # Playlist limpa
+    "mode", # Modo alterado para `mode`
+    "current" # Trilha atual alterada para `index` (por `step`, se veio de next/previous)
+]
+
+class PlaylistChange(TypedDict, total=False):
+    """
+    Representa um dicionário tipado com uma alteração
+    da Playlist, enviada aos seus listeners.
+    """
+    kind: PlaylistChangeKind
+    index: int
+    to_index: int
+    tracks: List[Any] # List[Track]
+    mode: PlaylistModes
+    step: Literal["next", "previous"]
+
+class PlaylistSnapshot(TypedDict):
+    """
+    Representa um dicionário tipado com o snapshot
+    de uma Playlist salvo em JSON.
+    """
+    mode: PlaylistModes
+    current_index: Optional[int]
+    tracks: List[TrackRecord]
+    shuffle: Optional[ShuffleState] # Ordem aleatória, no modo "shuffle"
+    journal_generation: int # Último journal já aplicado no snapshot (0: nenhum)
+
+class ScanProgress(TypedDict):
+    """
+    Representa um dicionário tipado com o progresso
+    da varredura de pastas do LibraryScanner.
+    - directories: int -> Pastas já lidas.
+    - pending: int -> Pastas encontradas e ainda não lidas.
+    - files: int -> Arquivos de áudio encontrados.
+    - added: int -> Trilhas adicionadas à playlist (sem as duplicadas).
+    - errors: int -> Pastas que não puderam ser lidas.
+    """
+    directories: int
+    pending: int
+    files: int
+    added: int
+    errors: int
+
+class LibraryDelta(TypedDict):
+    """
+    Representa um dicionário tipado com as diferenças
+    encontradas por uma nova varredura das pastas.
+    - added: list[str] -> Paths dos arquivos novos.
+    - removed: list[str] -> Paths dos arquivos que sumiram.
+    - modified: list[str] -> Paths dos arquivos com outro tamanho ou mtime.
+    - moved: list[(str, str)] -> Paths (antigo, novo) dos arquivos movidos ou renomeados.
+    """
+    added: List[str]
+    removed: List[str]
+    modified: List[str]
+    moved: List[Tuple[str, str]]
+
+class AudioMetadata(TypedDict):
+    """
+    Representa um dicionário tipado com os metadados
+    lidos do cabeçalho de um arquivo de áudio (None
+    quando o arquivo não tem o campo, ou o formato
+    não é reconhecido).
+    - title: str -> Título da faixa.
+    - artist: str -> Artista.
+    - album: str -> Álbum.
+    - duration: float -> Duração em segundos.
+    """
+    title: Optional[str]
+    artist: Optional[str]
+    album: Optional[str]
+    duration: Optional[float]
@@ -32,3 +32,10 @@ class InvalidPlaylistModeError(Exception):
         self.type = "InvalidPlaylistModeError"
         self.message: str = f"O modo {entry} é inválido. Era esperado um de {PLAYLIST_MODES}"
         super().__init__(self.message)
+
+class CorruptedPlaylistFileError(Exception):
+    """Representa uma exceção quando o arquivo salvo da playlist não pode ser lido."""
+    def __init__(self, file_path: str) -> None:
+        self.type = "CorruptedPlaylistFileError"
+        self.message: str = f"O arquivo da playlist '{file_path}' está corrompido."
+        super().__init__(self.message)
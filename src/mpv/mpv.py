@@ -318,6 +318,17 @@ class MpvEventID(c_int):
         return getattr(kls, s.upper().replace('-', '_'))
 
 
+def _event_ids(event_types):
+    """Normalize event types given as str, int or MpvEventID to the unique integer IDs the event callback table is
+    keyed by. No types means all of ``MpvEventID.ANY``. ``None`` matches no event and is skipped, so a callback
+    registered only for ``None`` (like the one of ``wait_for_shutdown``) is never invoked."""
+    if not event_types:
+        return tuple(MpvEventID.ANY)
+    ids = (MpvEventID.from_str(t) if isinstance(t, str) else t.value if isinstance(t, MpvEventID) else t
+           for t in event_types)
+    return tuple(dict.fromkeys(int(t) for t in ids if t is not None))
+
+
 identity_decoder = lambda b: b
 strict_decoder = lambda b: b.decode('utf-8')
 def lazy_decoder(b):
@@ -439,6 +450,50 @@ class MpvEventProperty(Structure):
     def value(self):
         return MpvNode.node_cast_value(self.data, self.format.value, decoder=lazy_decoder)
 
+class _MpvPropertyValuePointer(Union):
+    _fields_ = [('string', POINTER(c_char_p)),
+                ('flag', POINTER(c_int)),
+                ('int64', POINTER(c_int64)),
+                ('double', POINTER(c_double))]
+
+class _MpvEventScalarProperty(Structure):
+    """mpv_event_property of a property observed with a scalar format: ``data`` points to the value itself."""
+    _fields_ = [('_name', c_char_p),
+                ('format', MpvFormat),
+                ('data', _MpvPropertyValuePointer)]
+
+def _scalar_property_decoder(fmt, read):
+    def decode(address):
+        prop = _MpvEventScalarProperty.from_address(address)
+        # Unavailable properties arrive with format NONE and no data
+        return read(prop.data) if prop.format.value == fmt else None
+    return decode
+
+# Decoders of property change events by observation format. They take the address of the mpv_event_property.
+_PROPERTY_DECODERS = {
+    MpvFormat.NODE:   lambda address: MpvEventProperty.from_address(address).value,
+    MpvFormat.DOUBLE: _scalar_property_decoder(MpvFormat.DOUBLE, lambda data: data.double[0]),
+    MpvFormat.INT64:  _scalar_property_decoder(MpvFormat.INT64, lambda data: data.int64[0]),
+    MpvFormat.FLAG:   _scalar_property_decoder(MpvFormat.FLAG, lambda data: bool(data.flag[0])),
+    MpvFormat.STRING: _scalar_property_decoder(MpvFormat.STRING, lambda data: lazy_decoder(data.string[0])),
+}
+
+def _property_format(fmt):
+    """Normalize an observation format given as MpvFormat, int or name (e.g. ``'double'``)."""
+    value = fmt
+    if isinstance(fmt, str):
+        value = getattr(MpvFormat, fmt.upper(), None)
+    elif isinstance(fmt, MpvFormat):
+        value = fmt.value
+    if value not in _PROPERTY_DECODERS:
+        raise ValueError(f'Properties can only be observed as NODE, DOUBLE, INT64, FLAG or STRING, not {fmt!r}')
+    return value
+
+def _property_observe_id(name, fmt):
+    """Observation ID (reply_userdata) of a property in a format. NODE observations keep the name's hash."""
+    key = name if fmt == MpvFormat.NODE else (name, fmt)
+    return hash(key)&0xffffffffffffffff
+
 class MpvEventLogMessage(Structure):
     _fields_ = [('_prefix', c_char_p),
                 ('_level', c_char_p),
@@ -508,6 +563,24 @@ StreamSizeFn = CFUNCTYPE(c_int64, c_void_p)
 StreamCloseFn = CFUNCTYPE(None, c_void_p)
 StreamCancelFn = CFUNCTYPE(None, c_void_p)
 
+def _stream_buffer(buf, size):
+    """Writable byte view over the buffer libmpv passed to a stream read callback."""
+    return memoryview((c_char * size).from_address(addressof(buf.contents))).cast('B')
+
+def _copy_to_stream_buffer(buf, size, data):
+    """Copy the result of a stream frontend's read() into libmpv's buffer in one go. Returns the byte count."""
+    if isinstance(data, bytes):
+        length = len(data)
+        if length > size:
+            raise ValueError(f'Stream read() returned {length} bytes, more than the {size} requested')
+        memmove(buf, data, length)
+        return length
+    view = memoryview(data).cast('B')
+    if view.nbytes > size:
+        raise ValueError(f'Stream read() returned {view.nbytes} bytes, more than the {size} requested')
+    _stream_buffer(buf, view.nbytes)[:] = view
+    return view.nbytes
+
 class StreamCallbackInfo(Structure):
     _fields_ = [('cookie', c_void_p),
                 ('read', StreamReadFn),
@@ -888,10 +961,13 @@ class MPV(object):
         self.strict = _DecoderPropertyProxy(self, strict_decoder)
         self.lazy   = _DecoderPropertyProxy(self, lazy_decoder)
 
-        self._event_callbacks = []
+        # Handler tables are copy-on-write: registration swaps in a new dict under _event_handler_lock, so the event
+        # loop can read them without locking. Event callbacks are keyed by event ID (None for blanket callbacks),
+        # property observers by observation ID (the reply_userdata of their events): (name, decoder, handlers).
+        self._event_callbacks = {}
         self._command_reply_callbacks = {}
         self._event_handler_lock = threading.Lock()
-        self._property_handlers = collections.defaultdict(lambda: [])
+        self._property_handlers = {}
         self._quit_handlers = set()
         self._message_handlers = {}
         self._key_binding_handlers = {}
@@ -933,59 +1009,70 @@ class MPV(object):
     def _loop(self):
         for event in _event_generator(self._event_handle):
             try:
-                eid = event.event_id.value
-
-                with self._event_handler_lock:
-                    if eid == MpvEventID.SHUTDOWN:
-                        self._core_shutdown = True
-
-                for callback in self._event_callbacks:
-                    with self._enqueue_exceptions():
-                        callback(event)
-
-                if eid == MpvEventID.PROPERTY_CHANGE:
-                    pc = event.data
-                    name, value, _fmt = pc.name, pc.value, pc.format
-                    for handler in self._property_handlers[name]:
-                        with self._enqueue_exceptions():
-                            handler(name, value)
-
-                if eid == MpvEventID.LOG_MESSAGE and self._log_handler is not None:
-                    ev = event.data
-                    with self._enqueue_exceptions():
-                        self._log_handler(ev.level, ev.prefix, ev.text)
-
-                if eid == MpvEventID.CLIENT_MESSAGE:
-                    # {'event': {'args': ['key-binding', 'foo', 'u-', 'g']}, 'reply_userdata': 0, 'error': 0, 'event_id': 16}
-                    target, *args = event.data.args
-                    target = target.decode("utf-8")
-                    if target in self._message_handlers:
-                        with self._enqueue_exceptions():
-                            self._message_handlers[target](*args)
-
-                if eid == MpvEventID.COMMAND_REPLY:
-                    key = event.reply_userdata
-                    callback = self._command_reply_callbacks.pop(key, None)
-                    if callback:
-                        with self._enqueue_exceptions():
-                            callback(ErrorCode.exception_for_ec(event.error), event.data)
-
-                if eid == MpvEventID.QUEUE_OVERFLOW:
-                    # cache list, since error handlers will unregister themselves
-                    for cb in list(self._command_reply_callbacks.values()):
-                        with self._enqueue_exceptions():
-                            cb(EventOverflowError('libmpv event queue has flown over because events have not been processed fast enough'), None)
-
-                if eid == MpvEventID.SHUTDOWN:
-                    _mpv_destroy(self._event_handle)
-                    for cb in list(self._command_reply_callbacks.values()):
-                        with self._enqueue_exceptions():
-                            cb(ShutdownError('libmpv core has been shutdown'), None)
+                if self._dispatch(event):
                     return
-
             except Exception as e:
                 warn(f'Unhandled {e} inside python-mpv event loop!\n{traceback.format_exc()}', RuntimeWarning)
 
+    def _dispatch(self, event):
+        """Run the handlers interested in one event. Returns True once the core has shut down."""
+        eid = event.event_id.value
+
+        if eid == MpvEventID.SHUTDOWN:
+            with self._event_handler_lock:
+                self._core_shutdown = True
+
+        callbacks = self._event_callbacks
+        for callback in callbacks.get(eid, ()):
+            with self._enqueue_exceptions():
+                callback(event)
+        for callback in callbacks.get(None, ()):
+            with self._enqueue_exceptions():
+                callback(event)
+
+        if eid == MpvEventID.PROPERTY_CHANGE:
+            observation = self._property_handlers.get(event.reply_userdata)
+            if observation:
+                name, decode, handlers = observation
+                value = decode(event._data)
+                for handler in handlers:
+                    with self._enqueue_exceptions():
+                        handler(name, value)
+
+        if eid == MpvEventID.LOG_MESSAGE and self._log_handler is not None:
+            ev = event.data
+            with self._enqueue_exceptions():
+                self._log_handler(ev.level, ev.prefix, ev.text)
+
+        if eid == MpvEventID.CLIENT_MESSAGE:
+            # {'event': {'args': ['key-binding', 'foo', 'u-', 'g']}, 'reply_userdata': 0, 'error': 0, 'event_id': 16}
+            target, *args = event.data.args
+            target = target.decode("utf-8")
+            if target in self._message_handlers:
+                with self._enqueue_exceptions():
+                    self._message_handlers[target](*args)
+
+        if eid in (MpvEventID.COMMAND_REPLY, MpvEventID.GET_PROPERTY_REPLY):
+            key = event.reply_userdata
+            callback = self._command_reply_callbacks.pop(key, None)
+            if callback:
+                with self._enqueue_exceptions():
+                    callback(ErrorCode.exception_for_ec(event.error), event.data)
+
+        if eid == MpvEventID.QUEUE_OVERFLOW:
+            # cache list, since error handlers will unregister themselves
+            for cb in list(self._command_reply_callbacks.values()):
+                with self._enqueue_exceptions():
+                    cb(EventOverflowError('libmpv event queue has flown over because events have not been processed fast enough'), None)
+
+        if eid == MpvEventID.SHUTDOWN:
+            _mpv_destroy(self._event_handle)
+            for cb in list(self._command_reply_callbacks.values()):
+                with self._enqueue_exceptions():
+                    cb(ShutdownError('libmpv core has been shutdown'), None)
+            return True
+        return False
+
     @property
     def core_shutdown(self):
         """Property indicating whether the core has been shut down. Possible causes for this are e.g. the `quit` command
@@ -1026,7 +1113,7 @@ class MPV(object):
     def wait_for_shutdown(self, timeout=None, catch_errors=True):
         '''Wait for core to shutdown (e.g. through quit() or terminate()).'''
         try:
-            self.wait_for_event(None, timeout=timeout, catch_errors=catch_errors)
+            self.wait_for_event('shutdown', timeout=timeout, catch_errors=catch_errors)
         except ShutdownError:
             return
 
@@ -1240,6 +1327,41 @@ class MPV(object):
         return future
 
 
+    def get_property_async(self, name, callback=None, decoder=lazy_decoder):
+        """Same as reading a property, but asynchronously through mpv_get_property_async. Returns a future that
+        evaluates to the result of the callback (if given, called as ``callback(error, value)``), and the property
+        value otherwise. Unavailable properties evaluate to None, like on the synchronous path.
+
+        Requests sent together are answered together, so several properties can be read in one round trip:
+
+            duration, metadata = player.get_property_async('duration'), player.get_property_async('metadata')
+            print(duration.result(), metadata.result())
+        """
+        self.check_core_alive()
+        future = Future()
+        future.set_running_or_notify_cancel()
+
+        if callback is None:
+            def callback(error, value):
+                if error and not isinstance(error, PropertyUnavailableError):
+                    raise error
+                return value
+
+        def wrapper(error, result):
+            try:
+                value = None if result is None else MpvNode.node_cast_value(
+                    result.data, result.format.value, decoder=decoder)
+                future.set_result(callback(error, value))
+            except Exception as e:
+                try:
+                    future.set_exception(e)
+                except InvalidStateError:
+                    pass
+
+        self._command_reply_callbacks[id(future)] = wrapper
+        _mpv_get_property_async(self._event_handle, id(future), name.encode('utf-8'), MpvFormat.NODE)
+        return future
+
     def node_command(self, name, *args, decoder=strict_decoder):
         self.command(name, *args, decoder=decoder)
 
@@ -1552,12 +1674,20 @@ class MPV(object):
     def af_command(self, label, command, argument):
         self.command('af_command', label, command, argument)
 
-    def observe_property(self, name, handler):
+    def observe_property(self, name, handler, fmt=MpvFormat.NODE):
         """Register an observer on the named property. An observer is a function that is called with the new property
         value every time the property's value is changed. The basic function signature is ``fun(property_name,
         new_value)`` with new_value being the decoded property value as a python object. This function can be used as a
         function decorator if no handler is given.
 
+        By default the value is delivered as an mpv node and decoded recursively. For scalar properties that change
+        often (``time-pos``, ``audio-pts``, ``percent-pos``, ``volume``...), pass ``fmt`` as one of
+        ``MpvFormat.DOUBLE``, ``MpvFormat.INT64``, ``MpvFormat.FLAG`` or ``MpvFormat.STRING`` (or its name, e.g.
+        ``'double'``) to have mpv convert the value and read it straight from the event, without node decoding. The
+        value is None while the property is unavailable.
+
+            player.observe_property('time-pos', on_progress, fmt=MpvFormat.DOUBLE)
+
         To unregister the observer, call either of ``mpv.unobserve_property(name, handler)``,
         ``mpv.unobserve_all_properties(handler)`` or the handler's ``unobserve_mpv_properties`` attribute::
 
@@ -1570,30 +1700,56 @@ class MPV(object):
         exit_handler is a function taking no arguments that is called when the underlying mpv handle is terminated (e.g.
         from calling MPV.terminate() or issuing a "quit" input command).
         """
-        self._property_handlers[name].append(handler)
-        _mpv_observe_property(self._event_handle, hash(name)&0xffffffffffffffff, name.encode('utf-8'), MpvFormat.NODE)
-
-    def property_observer(self, name):
+        fmt = _property_format(fmt)
+        observe_id = _property_observe_id(name, fmt)
+        with self._event_handler_lock:
+            _name, decode, handlers = self._property_handlers.get(observe_id, (name, _PROPERTY_DECODERS[fmt], ()))
+            self._property_handlers = {**self._property_handlers, observe_id: (name, decode, handlers + (handler,))}
+        if not handlers:
+            _mpv_observe_property(self._event_handle, observe_id, name.encode('utf-8'), fmt)
+
+    def property_observer(self, name, fmt=MpvFormat.NODE):
         """Function decorator to register a property observer. See ``MPV.observe_property`` for details."""
         def wrapper(fun):
-            self.observe_property(name, fun)
-            fun.unobserve_mpv_properties = lambda: self.unobserve_property(name, fun)
+            self.observe_property(name, fun, fmt)
+            fun.unobserve_mpv_properties = lambda: self.unobserve_property(name, fun, fmt)
             return fun
         return wrapper
 
-    def unobserve_property(self, name, handler):
+    def unobserve_property(self, name, handler, fmt=None):
         """Unregister a property observer. This requires both the observed property's name and the handler function that
         was originally registered as one handler could be registered for several properties. To unregister a handler
-        from *all* observed properties see ``unobserve_all_properties``.
+        from *all* observed properties see ``unobserve_all_properties``. If the handler observes the property in several
+        formats, ``fmt`` selects one (by default, the first one it was registered with).
         """
-        self._property_handlers[name].remove(handler)
-        if not self._property_handlers[name]:
-            _mpv_unobserve_property(self._event_handle, hash(name)&0xffffffffffffffff)
+        if fmt is not None:
+            observe_id = _property_observe_id(name, _property_format(fmt))
+        else:
+            observe_id = next((observe_id for observe_id, (observed, _decode, handlers) in self._property_handlers.items()
+                               if observed == name and handler in handlers), None)
+        self._unobserve(observe_id, handler)
 
     def unobserve_all_properties(self, handler):
         """Unregister a property observer from *all* observed properties."""
-        for name in self._property_handlers:
-            self.unobserve_property(name, handler)
+        for observe_id, (_name, _decode, handlers) in self._property_handlers.items():
+            for _ in range(handlers.count(handler)):
+                self._unobserve(observe_id, handler)
+
+    def _unobserve(self, observe_id, handler):
+        with self._event_handler_lock:
+            if observe_id not in self._property_handlers:
+                raise ValueError('Handler is not observing this property')
+            name, decode, handlers = self._property_handlers[observe_id]
+            handlers = list(handlers)
+            handlers.remove(handler)
+            table = dict(self._property_handlers)
+            if handlers:
+                table[observe_id] = (name, decode, tuple(handlers))
+            else:
+                del table[observe_id]
+            self._property_handlers = table
+        if not handlers:
+            _mpv_unobserve_property(self._event_handle, observe_id)
 
     def register_message_handler(self, target, handler=None):
         """Register a mpv script message handler. This can be used to communicate with embedded lua scripts. Pass the
@@ -1660,17 +1816,44 @@ class MPV(object):
 
             my_handler.unregister_mpv_events()
         """
-        self._event_callbacks.append(callback)
+        with self._event_handler_lock:
+            self._add_event_callback(callback, (None,))
 
     def unregister_event_callback(self, callback):
-        """Unregiser an event callback."""
-        self._event_callbacks.remove(callback)
+        """Unregiser an event callback, either a blanket one or one returned by ``event_callback``."""
+        with self._event_handler_lock:
+            if hasattr(callback, '_mpv_event_ids'):
+                self._remove_event_callback(callback.__wrapped__, callback._mpv_event_ids)
+            else:
+                self._remove_event_callback(callback, (None,))
+
+    def _add_event_callback(self, callback, event_ids):
+        """Copy-on-write registration in the per-event-ID table. Must be called with _event_handler_lock held."""
+        table = dict(self._event_callbacks)
+        for eid in event_ids:
+            table[eid] = table.get(eid, ()) + (callback,)
+        self._event_callbacks = table
+
+    def _remove_event_callback(self, callback, event_ids):
+        """Copy-on-write removal from the per-event-ID table. Must be called with _event_handler_lock held."""
+        table = dict(self._event_callbacks)
+        for eid in event_ids:
+            handlers = list(table.get(eid, ()))
+            handlers.remove(callback)
+            if handlers:
+                table[eid] = tuple(handlers)
+            else:
+                del table[eid]
+        self._event_callbacks = table
 
     def event_callback(self, *event_types):
         """Function decorator to register a blanket event callback for the given event types. Event types can be given
         as str (e.g.  'start-file'), integer or MpvEventID object.
 
-        WARNING: Due to the way this is filtering events, this decorator cannot be chained with itself.
+        The callback is only invoked for events of the given types (all of ``MpvEventID.ANY`` if none are given): the
+        event loop looks handlers up by event type instead of filtering every event through every callback.
+
+        WARNING: This decorator cannot be chained with itself.
 
         To unregister the event callback, call its ``unregister_mpv_events`` function::
 
@@ -1684,12 +1867,12 @@ class MPV(object):
         def register(callback):
             with self._event_handler_lock:
                 self.check_core_alive()
-                types = [MpvEventID.from_str(t) if isinstance(t, str) else t for t in event_types] or MpvEventID.ANY
+                event_ids = _event_ids(event_types)
                 @wraps(callback)
                 def wrapper(event, *args, **kwargs):
-                    if event.event_id.value in types:
-                        callback(event, *args, **kwargs)
-                self._event_callbacks.append(wrapper)
+                    return callback(event, *args, **kwargs)
+                wrapper._mpv_event_ids = event_ids
+                self._add_event_callback(callback, event_ids)
                 wrapper.unregister_mpv_events = partial(self.unregister_event_callback, wrapper)
                 return wrapper
         return register
@@ -1827,9 +2010,15 @@ class MPV(object):
 
                 def read(self, size):
                     ...
-                    return read # non-empty bytes object with input
+                    return read # non-empty bytes-like object (bytes, bytearray, memoryview) with input
                     return b'' # empty byte object signals permanent EOF
 
+                def readinto(self, buffer): # optional, used instead of read() when present
+                    ...
+                    return written # number of bytes written into the writable memoryview buffer, which is
+                    mpv's own read buffer (no intermediate copy); 0 signals permanent EOF. The view is only
+                    valid during the call.
+
                 def seek(self, pos): # optional
                     return new_offset # integer with new byte offset. The new offset may be before the requested offset
                     in case an exact seek is inconvenient.
@@ -1863,13 +2052,16 @@ class MPV(object):
 
                 cb_info.contents.cookie = None
 
-                def read_backend(_userdata, buf, bufsize):
-                    with self._enqueue_exceptions():
-                        data = frontend.read(bufsize)
-                        for i in range(len(data)):
-                            buf[i] = data[i]
-                        return len(data)
-                    return -1
+                if hasattr(frontend, 'readinto'):
+                    def read_backend(_userdata, buf, bufsize):
+                        with self._enqueue_exceptions():
+                            return frontend.readinto(_stream_buffer(buf, bufsize))
+                        return -1
+                else:
+                    def read_backend(_userdata, buf, bufsize):
+                        with self._enqueue_exceptions():
+                            return _copy_to_stream_buffer(buf, bufsize, frontend.read(bufsize))
+                        return -1
                 read = cb_info.contents.read = StreamReadFn(read_backend)
 
                 def close_backend(_userdata):
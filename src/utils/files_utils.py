@@ -2,9 +2,26 @@
 Esse módulo contém funções utilitárias para
 manipulação de arquivos.
 """
+import os
+from pathlib import Path
+from typing import IO, Any, Callable
 from src.core.type_hints import PathType
 
 def clear_file(file_path: PathType) -> None:
     """Limpa o contúdo de um arquivo."""
     with open(file_path, "w", encoding="utf-8") as _:
         pass
+
+def atomic_write(file_path: PathType, write: Callable[[IO[bytes]], Any]) -> None:
+    """
+    Escreve num arquivo temporário (com `write`, em modo binário)
+    e o troca pelo `file_path` de forma atômica.
+    """
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    with open(temporary, "wb") as file:
+        write(file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
@@ -1,12 +1,25 @@
 """
 Esse módulo contém funções utilitárias
 referentes a logging.
+
+Cada escopo (logger_name) é configurado uma única vez: o logger envia
+os registros para uma fila limitada (`QueueHandler`) e uma thread de
+fundo (`QueueListener`) os escreve em lotes, então quem loga (inclusive
+a thread de eventos do mpv) nunca espera pelo disco.
 """
+import atexit
 from pathlib import Path
-from logging import getLogger, FileHandler, Formatter, StreamHandler, DEBUG
+from queue import Queue, Full
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Optional, Set, Tuple
+from logging import (
+    getLogger, FileHandler, Formatter, Handler, Logger, LogRecord, StreamHandler,
+    DEBUG, INFO, WARNING, ERROR, CRITICAL
+)
+from logging.handlers import QueueHandler, QueueListener
 from src.core.type_hints import LoggingLevel
-from src.core.config import LOGGING_PATH_OUTPUT
-from src.utils.files_utils import clear_file
+from src.core.config import LOGGING_PATH_OUTPUT, LOGGING_QUEUE_SIZE, LOGGING_BATCH_SIZE
 
 formatter = Formatter(
     "[%(asctime)s] [%(levelname)s] (%(name)s): %(message)s"
@@ -14,8 +27,66 @@ formatter = Formatter(
 DEFAULT_STREAM_HANDLER = StreamHandler()
 DEFAULT_STREAM_HANDLER.setFormatter(formatter)
 
-# file_handlers = {}
-logger_files = {}
+# Loggers já configurados, por escopo, e os listeners que os atendem
+_loggers: Dict[str, Logger] = {}
+_listeners: Dict[str, QueueListener] = {}
+_configure_lock = Lock()
+# Arquivos de log já abertos: ao recriar um escopo, eles não são limpos de novo
+_opened_paths: Set[str] = set()
+
+LOGGING_LEVELS: Dict[LoggingLevel, int] = {
+    "debug": DEBUG,
+    "info": INFO,
+    "warning": WARNING,
+    "error": ERROR,
+    "critical": CRITICAL
+}
+# Nível mínimo de cada escopo (logger_name), checado antes de qualquer formatação
+_scope_levels: Dict[str, int] = {}
+
+
+def set_scope_level(logger_name: str, level: LoggingLevel) -> None:
+    """Define o nível mínimo de log de um escopo."""
+    _scope_levels[logger_name] = LOGGING_LEVELS[level]
+
+
+def is_enabled(logger_name: str, level: LoggingLevel) -> bool:
+    """Verifica, sem formatar nada, se um log desse nível passaria no escopo."""
+    return LOGGING_LEVELS.get(level, DEBUG) >= _scope_levels.get(logger_name, DEBUG)
+
+
+class LogSampler:
+    """
+    Limita a frequência de logs de eventos por elemento (ex.: `__getitem__`).
+
+    Funciona como um balde de fichas: permite até `burst` logs seguidos
+    e repõe `rate` fichas por segundo. Os logs negados são contados para
+    serem informados no próximo log permitido.
+    """
+    __slots__ = ("rate", "burst", "_tokens", "_last", "dropped")
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = monotonic()
+        self.dropped = 0
+
+    def allow(self) -> bool:
+        """Consome uma ficha se houver; caso contrário, conta o log como descartado."""
+        now = monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        self.dropped += 1
+        return False
+
+    def take_dropped(self) -> int:
+        """Retorna e zera a contagem de logs descartados."""
+        dropped, self.dropped = self.dropped, 0
+        return dropped
 
 def _output_folder(filename: str) -> str:
     path = Path(LOGGING_PATH_OUTPUT) / filename
@@ -25,38 +96,139 @@ def _normalize_output_name(output_name: str) -> str:
     path = output_name.replace(".", "_") + ".log"
     return path
 
+
+class _DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler com fila limitada que nunca bloqueia quem loga.
+
+    A mensagem é montada (`%` com os `args`) antes de entrar na fila, pelo
+    `prepare` do QueueHandler: os valores são lidos no momento do log, e
+    não depois, quando a thread de fundo já pode vê-los alterados.
+
+    Política de transbordo: com a fila cheia, o registro novo é descartado
+    e contado; o próximo registro que couber é precedido de um aviso com
+    a quantidade descartada.
+    """
+
+    def __init__(self, queue: "Queue[LogRecord]") -> None:
+        super().__init__(queue)
+        self.dropped = 0
+
+    def enqueue(self, record: LogRecord) -> None:
+        try:
+            if self.dropped:
+                warning = LogRecord(
+                    record.name, WARNING, __file__, 0,
+                    "%d registros de log descartados (fila cheia)", (self.dropped,), None
+                )
+                self.queue.put_nowait(warning)
+                self.dropped = 0
+            self.queue.put_nowait(record)
+        except Full:
+            self.dropped += 1
+
+
+class _BatchFileHandler(FileHandler):
+    """
+    FileHandler que só dá `flush` a cada lote: quando a fila esvazia
+    ou quando `LOGGING_BATCH_SIZE` registros foram escritos.
+    """
+
+    def __init__(self, queue: "Queue[LogRecord]", path: str, mode: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(path, mode=mode, encoding="utf-8")
+        self._queue = queue
+        self._pending = 0
+
+    def emit(self, record: LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+            return
+        self._pending += 1
+        if self._pending >= LOGGING_BATCH_SIZE or self._queue.empty():
+            self.flush()
+            self._pending = 0
+
+
+def _configure_logger(logger_name: str, output: bool, clear_old_log: bool) -> Logger:
+    """Configura, uma única vez, o logger e o pipeline de fila de um escopo."""
+    with _configure_lock:
+        if logger_name in _loggers:
+            return _loggers[logger_name]
+        return _create_logger(logger_name, output, clear_old_log)
+
+
+def _create_logger(logger_name: str, output: bool, clear_old_log: bool) -> Logger:
+    logger = getLogger(logger_name)
+    logger.setLevel(DEBUG)
+    queue: "Queue[LogRecord]" = Queue(LOGGING_QUEUE_SIZE)
+    handler: Handler
+    if output is False:
+        handler = DEFAULT_STREAM_HANDLER
+    else:
+        output_path = _output_folder(_normalize_output_name(logger_name))
+        mode = "w" if clear_old_log and output_path not in _opened_paths else "a"
+        handler = _BatchFileHandler(queue, output_path, mode)
+        _opened_paths.add(output_path)
+        handler.setFormatter(formatter)
+    listener = QueueListener(queue, handler)
+    listener.start()
+    logger.addHandler(_DroppingQueueHandler(queue))
+    _loggers[logger_name] = logger
+    _listeners[logger_name] = listener
+    return logger
+
+
+def shutdown_logging(logger_name: Optional[str] = None) -> None:
+    """
+    Para a thread de log de um escopo (ou de todos, se `logger_name` for
+    None), escrevendo o que ainda está na fila. Um escopo parado é criado
+    de novo no próximo log, continuando o mesmo arquivo.
+    """
+    with _configure_lock:
+        names = list(_listeners) if logger_name is None else [logger_name]
+        for name in names:
+            listener = _listeners.pop(name, None)
+            if listener is None:
+                continue
+            listener.stop()
+            for handler in listener.handlers:
+                if handler is not DEFAULT_STREAM_HANDLER:
+                    handler.close()
+            _loggers.pop(name).handlers.clear()
+
+
+atexit.register(shutdown_logging)
+
+
 def log(
     message: str,
     level: LoggingLevel,
     logger_name: str,
     output: bool = False,
-    clear_old_log: bool = False
+    clear_old_log: bool = False,
+    args: Tuple[Any, ...] = ()
 ) -> None:
     """
     Gera e salva um log.
 
     Se `output` for False, enviará ao terminal,
     caso contrário, num arquivo em *./log/**logger_name**.log*
+    (limpo na primeira vez se `clear_old_log`). As opções só valem
+    na primeira chamada de cada `logger_name`.
+
+    `message` pode ser um formato no estilo `%` com os valores em `args`:
+    a formatação só acontece se o log for de fato emitido, e a escrita
+    no arquivo fica para a thread de fundo.
     """
-    logger = getLogger(logger_name)
-    logger.setLevel(DEBUG)
-    try:
-        method = getattr(logger, level)
-    except AttributeError:
-        raise AttributeError(f"O 'level' de log é inválido: {level}") from None
-    if not logger.handlers:
-        if output is False:
-            handler = DEFAULT_STREAM_HANDLER
-        else:
-            output_file_name = _normalize_output_name(logger_name)
-            output_path = _output_folder(output_file_name)
-            handler = FileHandler(output_path, encoding="utf-8")
-            handler.setFormatter(formatter)
-        logger.addHandler(handler)
-    else:
-        output_file_name = _normalize_output_name(logger_name)
-        output_path = _output_folder(output_file_name)
-    if clear_old_log and output is True and not logger_files.get(logger_name, False):
-        clear_file(output_path)
-        logger_files[logger_name] = True
-    method(message)
+    levelno = LOGGING_LEVELS.get(level)
+    if levelno is None:
+        raise AttributeError(f"O 'level' de log é inválido: {level}")
+    if levelno < _scope_levels.get(logger_name, DEBUG):
+        return
+    logger = _loggers.get(logger_name)
+    if logger is None:
+        logger = _configure_logger(logger_name, output, clear_old_log)
+    logger.log(levelno, message, *args)
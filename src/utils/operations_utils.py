@@ -2,6 +2,7 @@
 Esse módulo contém funções utilitáras referentes
 a cálculos ou operações.
 """
+from typing import Iterable, Tuple
 
 def increment_index(
     index: int,
@@ -15,3 +16,76 @@ def increment_index(
     if increment_value > 0: # incrementa
         return (index + increment_value) % len_list
     return (index + increment_value) % len_list # decrementa
+
+
+class FenwickTree:
+    """
+    Árvore de Fenwick (Binary Indexed Tree) de inteiros.
+
+    Permite somar um valor numa posição e consultar a soma
+    de um prefixo em O(log n), além de crescer com `append`.
+    """
+    __slots__ = ("_tree",)
+
+    def __init__(self, size: int = 0) -> None:
+        self._tree = [0] * (size + 1)
+
+    @classmethod
+    def from_values(cls, values: Iterable[int]) -> "FenwickTree":
+        """Constrói a árvore a partir dos valores em O(n)."""
+        fenwick = cls()
+        tree = fenwick._tree
+        tree.extend(values)
+        size = len(tree)
+        for index in range(1, size):
+            parent = index + (index & -index)
+            if parent < size:
+                tree[parent] += tree[index]
+        return fenwick
+
+    def __len__(self) -> int:
+        return len(self._tree) - 1
+
+    def append(self, value: int = 0) -> None:
+        """Adiciona uma nova posição no final com o valor `value`."""
+        index = len(self._tree)
+        lowbit = index & -index
+        # O nó novo guarda a soma do intervalo (index - lowbit, index]
+        self._tree.append(value + self.prefix_sum(index - 1) - self.prefix_sum(index - lowbit))
+
+    def add(self, index: int, value: int) -> None:
+        """Soma `value` à posição `index` (base 0)."""
+        tree = self._tree
+        size = len(tree)
+        index += 1
+        while index < size:
+            tree[index] += value
+            index += index & -index
+
+    def prefix_sum(self, end: int) -> int:
+        """Retorna a soma das posições no intervalo [0, end)."""
+        tree = self._tree
+        total = 0
+        while end > 0:
+            total += tree[end]
+            end -= end & -end
+        return total
+
+    def search(self, value: int) -> Tuple[int, int]:
+        """
+        Procura a posição que contém o acumulado `value`, supondo valores não negativos.
+
+        Retorna a posição `p` tal que prefix_sum(p) <= value < prefix_sum(p + 1)
+        e o resto `value - prefix_sum(p)`.
+        """
+        tree = self._tree
+        size = len(tree)
+        position = 0
+        step = 1 << (size - 1).bit_length()
+        while step:
+            candidate = position + step
+            if candidate < size and tree[candidate] <= value:
+                position = candidate
+                value -= tree[candidate]
+            step >>= 1
+        return position, value
@@ -2,3 +2,65 @@
 Este módulo contém funções utilitárias
 para resolução de caminhos do Sistema Operacional.
 """
+import os
+from typing import AbstractSet, Dict, List, Tuple
+from src.core.type_hints import FileStamp, PathType
+from src.core.config import AUDIO_EXTENSIONS
+
+
+def has_audio_extension(name: str, extensions: AbstractSet[str] = AUDIO_EXTENSIONS) -> bool:
+    """Verifica se o nome do arquivo termina numa das `extensions` (sem diferenciar maiúsculas)."""
+    return os.path.splitext(name)[1].lower() in extensions
+
+
+def scan_directory(
+    path: PathType,
+    extensions: AbstractSet[str] = AUDIO_EXTENSIONS
+) -> Tuple[List[str], List[str]]:
+    """
+    Lê um único nível de uma pasta com `os.scandir` e retorna
+    `(arquivos de áudio, subpastas)`, com os paths completos e ordenados.
+
+    O tipo das entradas vem da própria listagem (sem um `stat` por
+    arquivo na maioria dos sistemas), e só os arquivos com extensão de
+    áudio são conferidos. Links para pastas não são seguidos, o que evita
+    ciclos; links para arquivos são. Os erros de `os.scandir` são repassados.
+    """
+    files: List[str] = []
+    folders: List[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    folders.append(entry.path)
+                elif has_audio_extension(entry.name, extensions) and entry.is_file():
+                    files.append(entry.path)
+            except OSError:  # Entrada removida durante a leitura, ou link quebrado
+                continue
+    files.sort()
+    folders.sort()
+    return files, folders
+
+
+def stat_directory(
+    path: PathType,
+    extensions: AbstractSet[str] = AUDIO_EXTENSIONS
+) -> Tuple[Dict[str, FileStamp], List[str]]:
+    """
+    Como `scan_directory`, mas retorna só os nomes: `({arquivo de áudio:
+    (tamanho, mtime em ns)}, subpastas)`. Faz um `stat` por arquivo de áudio.
+    """
+    files: Dict[str, FileStamp] = {}
+    folders: List[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    folders.append(entry.name)
+                elif has_audio_extension(entry.name, extensions) and entry.is_file():
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_size, stat.st_mtime_ns)
+            except OSError:  # Entrada removida durante a leitura, ou link quebrado
+                continue
+    folders.sort()
+    return files, folders
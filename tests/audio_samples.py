@@ -0,0 +1,109 @@
+"""
+Esse módulo gera arquivos de áudio sintéticos (só os
+cabeçalhos e alguns bytes de áudio) nos formatos lidos
+por audio_metadata, para os testes e os benchmarks.
+"""
+import struct
+from typing import List
+
+MP3_FRAME = 417  # MPEG1 camada III, 128kbps, 44100Hz, sem padding
+MP3_SAMPLES = 1152
+
+
+def _id3v2(title: str, artist: str) -> bytes:
+    frames = b""
+    for frame_id, text in ((b"TIT2", title), (b"TPE1", artist)):
+        body = b"\x03" + text.encode("utf-8")
+        size = len(body)
+        syncsafe = bytes(((size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F))
+        frames += frame_id + syncsafe + b"\0\0" + body
+    frames += b"\0" * 64  # Preenchimento
+    size = len(frames)
+    syncsafe = bytes(((size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F))
+    return b"ID3\x04\x00\x00" + syncsafe + frames
+
+
+def mp3(title: str, frames: int, xing: bool = True, artist: str = "Artista") -> bytes:
+    """MP3 com ID3v2.4 e `frames` frames; com `xing`, o primeiro frame é o cabeçalho Xing."""
+    data = _id3v2(title, artist)
+    for index in range(frames):
+        frame = bytearray(MP3_FRAME)
+        frame[0:4] = b"\xff\xfb\x90\x00"
+        if index == 0 and xing:
+            frame[36:48] = b"Xing" + struct.pack(">II", 1, frames)
+        data += bytes(frame)
+    return data
+
+
+def flac(title: str, rate: int, samples: int, picture: int = 4096) -> bytes:
+    """FLAC com STREAMINFO, uma capa de `picture` bytes e os comentários Vorbis no fim."""
+    info = struct.pack(">HH", 4096, 4096) + b"\0" * 6
+    info += ((rate << 44) | (1 << 41) | (15 << 36) | samples).to_bytes(8, "big") + b"\0" * 16
+    comments = _vorbis_comments(f"TITLE={title}", "ARTIST=Artista")
+    return (
+        b"fLaC"
+        + b"\x00" + len(info).to_bytes(3, "big") + info
+        + b"\x06" + picture.to_bytes(3, "big") + b"\0" * picture
+        + b"\x84" + len(comments).to_bytes(3, "big") + comments
+        + b"\xff\xf8" + b"\0" * 512
+    )
+
+
+def _vorbis_comments(*entries: str) -> bytes:
+    vendor = b"tests"
+    data = struct.pack("<I", len(vendor)) + vendor + struct.pack("<I", len(entries))
+    for entry in entries:
+        raw = entry.encode("utf-8")
+        data += struct.pack("<I", len(raw)) + raw
+    return data
+
+
+def _ogg_page(packets: List[bytes], granule: int, sequence: int, flags: int,
+              last_open: bool = False) -> bytes:
+    """Uma página Ogg com `packets`; com `last_open`, o último continua na página seguinte."""
+    lacing = b""
+    for index, packet in enumerate(packets):
+        lacing += b"\xff" * (len(packet) // 255)
+        if not (last_open and index == len(packets) - 1):
+            lacing += bytes((len(packet) % 255,))
+    header = b"OggS" + struct.pack("<BBqIII", 0, flags, granule, 0x1234, sequence, 0)
+    return header + bytes((len(lacing),)) + lacing + b"".join(packets)
+
+
+def ogg(title: str, opus: bool, seconds: float, padding: int = 600) -> bytes:
+    """
+    Ogg Vorbis ou Opus com o pacote de comentários dividido em duas páginas
+    (com `padding` bytes extras) e uma página de áudio terminando em `seconds`.
+    """
+    if opus:
+        identification = b"OpusHead" + struct.pack("<BBHIhB", 1, 2, 312, 44100, 0, 0)
+        comments = b"OpusTags" + _vorbis_comments(f"TITLE={title}", "X=" + "x" * padding)
+        rate, pre_skip = 48000, 312
+    else:
+        identification = b"\x01vorbis" + struct.pack("<IBIiiiBB", 0, 2, 44100, 0, 128000, 0, 0xB8, 1)
+        comments = b"\x03vorbis" + _vorbis_comments(f"TITLE={title}", "X=" + "x" * padding) + b"\x01"
+        rate, pre_skip = 44100, 0
+    split = 255 * 2  # A primeira parte ocupa segmentos inteiros
+    return (
+        _ogg_page([identification], 0, 0, 0x02)
+        + _ogg_page([comments[:split]], 0, 1, 0x00, last_open=True)
+        + _ogg_page([comments[split:]], 0, 2, 0x01)
+        + _ogg_page([b"\0" * 300], int(seconds * rate) + pre_skip, 3, 0x04)
+    )
+
+
+def _atom(kind: bytes, body: bytes) -> bytes:
+    return struct.pack(">I", 8 + len(body)) + kind + body
+
+
+def mp4(title: str, timescale: int, duration: int, audio: int = 2048) -> bytes:
+    """M4A com o `moov` depois do `mdat` (o áudio), como muitos codificadores gravam."""
+    mvhd = _atom(b"mvhd", struct.pack(">IIIII", 0, 0, 0, timescale, duration) + b"\0" * 80)
+    item = _atom(b"\xa9nam", _atom(b"data", struct.pack(">II", 1, 0) + title.encode("utf-8")))
+    hdlr = _atom(b"hdlr", b"\0" * 8 + b"mdirappl" + b"\0" * 9)
+    meta = _atom(b"meta", b"\0\0\0\0" + hdlr + _atom(b"ilst", item))
+    return (
+        _atom(b"ftyp", b"M4A \0\0\0\0M4A mp42isom")
+        + _atom(b"mdat", b"\0" * audio)
+        + _atom(b"moov", mvhd + _atom(b"udta", meta))
+    )
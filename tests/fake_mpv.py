@@ -0,0 +1,76 @@
+"""
+Esse módulo contém a FakeMpv, uma imitação da playlist
+interna do mpv usada nos testes que não precisam do libmpv.
+"""
+
+
+class FakeMpv:
+    """Imita a playlist interna do mpv e responde aos comandos só em `process`."""
+    mpv_version_tuple = (0, 38, 0)
+
+    def __init__(self) -> None:
+        self.entries = []
+        self.playlist_pos = -1
+        self.options = {}
+        self.commands = []
+        self._replies = []
+        self._observers = []
+
+    def observe_property(self, name, handler):
+        assert name == "playlist-pos"
+        self._observers.append(handler)
+
+    def unobserve_property(self, name, handler):
+        self._observers.remove(handler)
+
+    def command_async(self, name, *args, callback=None):
+        self.commands.append((name, *args))
+        self._replies.append(((name, *args), callback))
+
+    def process(self) -> None:
+        """Executa os comandos pendentes e envia as respostas, como a thread de eventos."""
+        while self._replies:
+            command, callback = self._replies.pop(0)
+            self._execute(*command)
+            callback(None, None)
+
+    def _execute(self, name, *args) -> None:
+        position = self.playlist_pos
+        if name == "stop":
+            self.entries, position = [], -1
+        elif name in ("loadfile", "loadlist") and args[1] == "replace":
+            self.entries, position = [args[0]], 0
+        elif name in ("loadfile", "loadlist"):
+            paths = args[0][len("memory://"):].split("\n") if name == "loadlist" else [args[0]]
+            index = len(self.entries) if args[1] == "append" else args[2]
+            self.entries[index:index] = paths
+            if position >= index >= 0 and position != -1:
+                position += len(paths)
+        elif name == "playlist-remove":
+            del self.entries[args[0]]
+            if args[0] < position:
+                position -= 1
+            elif args[0] == position:  # Removeu a que tocava: passa para a seguinte
+                position = position if position < len(self.entries) else -1
+        elif name == "playlist-move":
+            source, target = args
+            entry = self.entries[source]
+            self.entries.insert(target, entry)
+            del self.entries[source + (target <= source)]
+            playing = None if position < 0 else self.entries.index(self._playing)
+            position = -1 if playing is None else playing
+        elif name == "playlist-play-index":
+            position = args[0]
+        elif name == "set":
+            self.options[args[0]] = args[1]
+        self._set_position(position)
+
+    def _set_position(self, position: int) -> None:
+        self.playlist_pos = position
+        self._playing = self.entries[position] if position >= 0 else None
+        for handler in self._observers:
+            handler("playlist-pos", position)
+
+    def advance(self) -> None:
+        """O mpv termina a trilha e passa para a seguinte sozinho."""
+        self._set_position((self.playlist_pos + 1) % len(self.entries))
@@ -0,0 +1,66 @@
+"""
+Esse módulo contém testes unitários da leitura
+de metadados (duração, título, artista e álbum) dos
+arquivos de áudio, do módulo audio_metadata.py.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from src.core.audio_metadata import fill_metadata, parse_metadata, read_many, read_metadata
+from src.core.track import Track
+from tests import audio_samples
+
+
+def test_formats(tmp_path) -> None:
+    """Testa o título e a duração de cada formato, lidos pelo mmap."""
+    files = {
+        "vbr.mp3": (audio_samples.mp3("Faixa MP3", frames=40), 40 * 1152 / 44100),
+        "cbr.mp3": (audio_samples.mp3("Sem Xing", frames=40, xing=False),
+                    40 * audio_samples.MP3_FRAME * 8 / 128_000),
+        "a.flac": (audio_samples.flac("Faixa FLAC", 48000, 48000 * 185), 185.0),
+        "a.ogg": (audio_samples.ogg("Faixa Vorbis", opus=False, seconds=61.5), 61.5),
+        "a.opus": (audio_samples.ogg("Faixa Opus", opus=True, seconds=12.25), 12.25),
+        "a.m4a": (audio_samples.mp4("Faixa M4A", 44100, 44100 * 200), 200.0)
+    }
+    for name, (data, duration) in files.items():
+        (tmp_path / name).write_bytes(data)
+        metadata = read_metadata(tmp_path / name)
+        assert metadata["duration"] == pytest.approx(duration, rel=1e-3), name
+        assert metadata["title"] is not None, name
+    assert read_metadata(tmp_path / "a.flac")["title"] == "Faixa FLAC"
+    assert read_metadata(tmp_path / "vbr.mp3")["artist"] == "Artista"
+    assert read_metadata(tmp_path / "a.m4a")["title"] == "Faixa M4A"
+
+
+def test_invalid_files(tmp_path) -> None:
+    """Testa se arquivos vazios, cortados ou desconhecidos ficam sem metadados."""
+    empty = {"title": None, "artist": None, "album": None, "duration": None}
+    (tmp_path / "empty.mp3").write_bytes(b"")
+    assert read_metadata(tmp_path / "empty.mp3") == empty
+    assert parse_metadata(b"not audio at all", 16) == empty
+    flac = audio_samples.flac("Cortado", 44100, 44100)
+    truncated = parse_metadata(flac[:60], 60)
+    assert truncated["duration"] == 1.0 and truncated["title"] is None
+    for data in (audio_samples.mp3("x", 3), audio_samples.ogg("x", True, 1), audio_samples.mp4("x", 1, 1)):
+        for size in (5, 11, 40, 100):
+            parse_metadata(data[:size], size)  # Não deve levantar exceções
+    with pytest.raises(FileNotFoundError):
+        read_metadata(tmp_path / "missing.mp3")
+
+
+def test_fill_metadata(tmp_path) -> None:
+    """Testa o preenchimento das trilhas, num pool de processos e sem ele."""
+    tracks = []
+    for index in range(20):
+        path = tmp_path / f"{index}.flac"
+        path.write_bytes(audio_samples.flac(f"Faixa {index}", 44100, 44100 * (index + 1)))
+        tracks.append(Track(path))
+    tracks.append(Track(tmp_path / "missing.flac"))
+    tracks[0].title = "Mantido"
+    with ProcessPoolExecutor(2) as pool:
+        fill_metadata(tracks[:10], pool, chunk_size=3)
+    fill_metadata(tracks[10:])
+    assert [track.duration for track in tracks[:20]] == [float(index + 1) for index in range(20)]
+    assert tracks[0].title == "Mantido" and tracks[19].title == "Faixa 19"
+    assert tracks[20].title is None and tracks[20].duration is None
+    assert [m["title"] for m in read_many([tmp_path / "1.flac", tmp_path / "2.flac"])] == [
+        "Faixa 1", "Faixa 2"]
@@ -0,0 +1,107 @@
+"""
+Esse módulo contém testes unitários
+da classe BlockList, do módulo block_list.py
+"""
+from random import Random
+from src.core.block_list import BlockList
+
+
+def test_positional_operations() -> None:
+    """Testa `insert`, `pop`, `move` e `index` contra uma lista comum."""
+    random = Random(0)
+    blocks = BlockList()
+    reference = []
+    blocks._LOAD = 4  # Blocos pequenos para forçar divisões e junções
+    for value in range(300):
+        index = random.randint(0, len(reference))
+        blocks.insert(index, value)
+        reference.insert(index, value)
+    for _ in range(200):
+        from_index = random.randrange(len(reference))
+        to_index = random.randrange(len(reference))
+        blocks.move(from_index, to_index)
+        reference.insert(to_index, reference.pop(from_index))
+    for _ in range(250):
+        index = random.randrange(len(reference))
+        assert blocks.pop(index) == reference.pop(index)
+    assert blocks == reference
+    assert len(blocks) == len(reference)
+    for index, value in enumerate(reference):
+        assert blocks[index] == value
+        assert blocks.index(value) == index
+
+
+def test_key() -> None:
+    """Testa a busca e a pertinência por chave."""
+    blocks = BlockList(["a", "bb", "ccc"], key=len)
+    assert blocks.has_key(2)
+    assert "xx" in blocks
+    assert blocks.index("ccc") == 2
+    blocks.pop(1)
+    assert not blocks.has_key(2)
+    blocks.clear()
+    assert len(blocks) == 0
+    assert list(blocks) == []
+
+
+def test_extend() -> None:
+    """Testa o método `extend` em blocos."""
+    blocks = BlockList(range(3))
+    blocks._LOAD = 4
+    blocks.extend(range(3, 20))
+    assert blocks == list(range(20))
+    assert all(len(block) <= 4 for block in blocks._blocks)
+    assert blocks.index(17) == 17
+    blocks.insert(5, 100)
+    assert blocks[5] == 100
+    assert blocks.index(19) == 20
+
+
+def test_lazy_index() -> None:
+    """Testa se o índice por chave só é montado na primeira busca e segue as edições."""
+    blocks = BlockList(range(10))
+    blocks._LOAD = 2
+    blocks.insert(3, 100)
+    blocks.pop(0)
+    blocks.extend(range(20, 30))
+    assert blocks._block_of is None
+    assert blocks.index(100) == 2
+    assert blocks._block_of is not None
+    blocks.move(2, 15)
+    blocks.pop(0)
+    assert blocks.index(100) == 14
+    assert 29 in blocks and 0 not in blocks
+
+
+def test_snapshot_and_restore() -> None:
+    """Testa se o snapshot não muda com as edições e se `restore` volta a ele."""
+    random = Random(1)
+    blocks = BlockList()
+    blocks._LOAD = 4
+    blocks.extend(range(200))
+    blocks.index(0)  # Monta o índice, que também precisa seguir o `restore`
+    snapshot = blocks.snapshot()
+    reference = list(range(200))
+    for _ in range(50):
+        blocks.move(random.randrange(len(blocks)), random.randrange(len(blocks)))
+        blocks.pop(random.randrange(len(blocks)))
+        blocks.insert(random.randrange(len(blocks)), 1000 + _)
+    assert list(snapshot) == reference
+    assert [snapshot[index] for index in range(-3, 3)] == reference[-3:] + reference[:3]
+    assert sum(map(id, snapshot.blocks)) != sum(map(id, blocks._blocks))
+
+    edited = list(blocks)
+    changes = blocks.restore(snapshot)
+    assert blocks == reference and len(blocks) == 200
+    for start, removed, inserted in changes:  # Aplicados em ordem, levam ao snapshot
+        assert edited[start:start + len(removed)] == removed
+        edited[start:start + len(removed)] = inserted
+    assert edited == reference
+    assert blocks.index(150) == 150 and 1000 not in blocks
+
+    after = blocks.snapshot()
+    blocks.insert(10, 5000)
+    # Só o bloco alterado deixa de ser compartilhado
+    assert sum(block is not other for block, other in zip(blocks._blocks, after.blocks)) == 1
+    assert blocks.restore(after) == [(10, [5000], [])]
+    assert list(blocks) == reference
@@ -0,0 +1,111 @@
+"""
+Esse módulo contém testes unitários da
+classe GaplessQueue, do módulo gapless.py,
+que toca a Playlist no mpv sem pausas entre as trilhas.
+"""
+from threading import Thread
+from src.core.gapless import GaplessQueue
+from src.core.playlist import Playlist
+from src.core.playlist_sync import PlaylistSync
+from src.core.track import Track
+from tests.fake_mpv import FakeMpv
+
+
+def _playlist(mode: str = "loop") -> Playlist:
+    playlist = Playlist(mode, shuffle_seed=5)
+    playlist.add_many(Track(f"/music/{index}.mp3") for index in range(6))
+    return playlist
+
+
+def test_gapless_queue() -> None:
+    """Testa se a próxima trilha fica na fila do mpv e a playlist avança com ele."""
+    playlist = _playlist()
+    mpv = FakeMpv()
+    queue = GaplessQueue(mpv, playlist)
+    mpv.process()
+    assert mpv.options == {"prefetch-playlist": "yes", "gapless-audio": "yes"}
+    assert mpv.entries == []  # Nada toca antes de `play`
+    queue.play()
+    mpv.process()
+    assert mpv.entries == ["/music/0.mp3", "/music/1.mp3"] and mpv.playlist_pos == 0
+
+    mpv.advance()  # O mpv emenda a trilha pré-carregada
+    mpv.process()
+    assert playlist.current_index == 1
+    assert mpv.entries == ["/music/1.mp3", "/music/2.mp3"] and mpv.playlist_pos == 0
+    loads = [command for command in mpv.commands if command[0] == "loadfile"]
+    assert [mode for _, _, mode in loads] == ["replace", "append", "append"]
+
+
+def test_gapless_invalidation() -> None:
+    """Testa se a pré-carregada é trocada quando a próxima trilha muda."""
+    playlist = _playlist()
+    mpv = FakeMpv()
+    queue = GaplessQueue(mpv, playlist)
+    queue.play()
+    mpv.process()
+    mpv.commands.clear()
+
+    playlist.insert(1, Track("/music/new.mp3"))
+    mpv.process()
+    assert mpv.entries == ["/music/0.mp3", "/music/new.mp3"]
+    playlist.move(4, 3)  # Não muda a próxima: nenhum comando
+    mpv.process()
+    assert mpv.commands == [("playlist-remove", 1), ("loadfile", "/music/new.mp3", "append")]
+
+    playlist.mode = "one_repeat"
+    mpv.process()
+    assert mpv.entries == ["/music/0.mp3"] and mpv.options["loop-file"] == "inf"
+    playlist.mode = "shuffle"
+    mpv.process()
+    assert mpv.entries == ["/music/0.mp3", str(playlist.get_next()[0].path)]
+    expected = playlist.get_next()[1]
+    mpv.advance()
+    mpv.process()
+    assert playlist.current_index == expected
+    assert mpv.entries == [str(playlist[expected].path), str(playlist.get_next()[0].path)]
+
+    playlist.next(force_next=True)  # Troca feita fora do mpv: recomeça na nova atual
+    mpv.process()
+    assert mpv.entries[0] == str(playlist.get_current_track().path)
+    playlist.clear()
+    mpv.process()
+    assert mpv.entries == []
+    queue.detach()
+
+
+def test_gapless_position_takes_playlist_lock() -> None:
+    """Testa se o avanço observado no mpv espera as edições feitas com `Playlist.lock`."""
+    playlist = _playlist()
+    mpv = FakeMpv()
+    queue = GaplessQueue(mpv, playlist)
+    queue.play()
+    mpv.process()
+    with playlist.lock:
+        observer = Thread(target=mpv.advance)  # Como a thread de eventos do mpv
+        observer.start()
+        observer.join(0.2)
+        assert observer.is_alive() and playlist.current_index == 0
+    observer.join(5)
+    assert playlist.current_index == 1
+
+
+def test_gapless_replaces_sync() -> None:
+    """Testa se só um controlador (PlaylistSync ou GaplessQueue) fica ligado a cada mpv."""
+    playlist = _playlist()
+    mpv = FakeMpv()
+    sync = PlaylistSync(mpv, playlist)
+    queue = GaplessQueue(mpv, playlist)  # Desliga o PlaylistSync
+    queue.play()
+    mpv.process()
+    assert mpv.entries == ["/music/0.mp3", "/music/1.mp3"]
+    playlist.insert(3, Track("/music/new.mp3"))  # Só a GaplessQueue reage
+    mpv.process()
+    assert mpv.entries == ["/music/0.mp3", "/music/1.mp3"]
+    sync.detach()  # Já desligado: não faz nada
+    PlaylistSync(mpv, playlist).play()  # Desliga a GaplessQueue
+    mpv.process()
+    assert mpv.entries == [str(track.path) for track in playlist] and mpv.playlist_pos == 0
+    mpv.advance()
+    mpv.process()
+    assert playlist.current_index == mpv.playlist_pos == 1
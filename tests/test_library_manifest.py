@@ -0,0 +1,111 @@
+"""
+Esse módulo contém testes unitários da
+classe LibraryManifest, do módulo library_manifest.py,
+que guarda o estado das pastas da biblioteca.
+"""
+import os
+import shutil
+from pathlib import Path
+import pytest
+import src.utils.paths_utils
+from src.core.library_manifest import LibraryManifest, apply_delta
+from src.core.playlist import Playlist
+from src.core.track import Track
+
+
+def _tree(root: Path) -> None:
+    """Cria uma biblioteca pequena com duas pastas de artista."""
+    for artist in ("a", "b"):
+        for album in range(3):
+            folder = root / artist / str(album)
+            folder.mkdir(parents=True)
+            (folder / "cover.jpg").write_bytes(b"")
+            for index in range(4):
+                (folder / f"{index}.mp3").write_bytes(b"x" * index)
+
+
+def _touch_folder(path: Path, offset: int) -> None:
+    """Garante um mtime diferente na pasta, mesmo em sistemas de arquivos com pouca precisão."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset * 10**9))
+
+
+def test_rescan(tmp_path, monkeypatch) -> None:
+    """Testa se a nova varredura só lista as pastas alteradas e retorna as diferenças."""
+    _tree(tmp_path / "music")
+    manifest = LibraryManifest(tmp_path / "library.json")
+    delta = manifest.rescan([tmp_path / "music"])
+    assert len(delta["added"]) == len(manifest) == 24
+    assert manifest.folder_count == 1 + 2 + 6
+    playlist = Playlist()
+    apply_delta(playlist, delta)
+    assert len(playlist) == 24
+
+    listed = []
+    stat_directory = src.utils.paths_utils.stat_directory
+    monkeypatch.setattr("src.core.library_manifest.stat_directory",
+                        lambda path, *args: listed.append(path) or stat_directory(path, *args))
+    manifest.save()
+    manifest = LibraryManifest.load(tmp_path / "library.json")
+    assert manifest.rescan() == {"added": [], "removed": [], "modified": [], "moved": []}
+    assert not listed
+
+    album = tmp_path / "music" / "a" / "1"
+    (album / "new.flac").write_bytes(b"")
+    (album / "0.mp3").unlink()
+    _touch_folder(album, 1)
+    shutil.rmtree(tmp_path / "music" / "b" / "2")
+    _touch_folder(tmp_path / "music" / "b", 1)
+    os.utime(tmp_path / "music" / "a" / "0" / "3.mp3", ns=(0, 10**9))  # Reescrito no lugar
+    delta = manifest.rescan()
+    assert sorted(listed) == [str(tmp_path / "music" / "a" / "1"), str(tmp_path / "music" / "b")]
+    assert delta["added"] == [str(album / "new.flac")]
+    assert sorted(delta["removed"]) == sorted(
+        [str(album / "0.mp3")] + [str(tmp_path / "music" / "b" / "2" / f"{i}.mp3") for i in range(4)])
+    assert delta["modified"] == []
+    assert manifest.rescan(check_files=True)["modified"] == [
+        str(tmp_path / "music" / "a" / "0" / "3.mp3")]
+
+    apply_delta(playlist, delta)
+    assert sorted(str(track.path) for track in playlist) == sorted(manifest)
+
+
+def test_rescan_roots(tmp_path) -> None:
+    """Testa a troca das pastas varridas, uma pasta ausente e um manifesto corrompido."""
+    _tree(tmp_path / "music")
+    manifest = LibraryManifest(tmp_path / "library.json")
+    manifest.rescan([tmp_path / "music", tmp_path / "music" / "a"])
+    assert len(manifest) == 24
+    delta = manifest.rescan([tmp_path / "music" / "b"])
+    assert len(delta["removed"]) == 12 and not delta["added"]
+    with pytest.raises(NotADirectoryError):
+        manifest.rescan([tmp_path / "missing"])
+    assert manifest.roots == [str(tmp_path / "music" / "b")] and len(manifest) == 12
+    (tmp_path / "library.json").write_text("{", encoding="utf-8")
+    assert len(LibraryManifest.load(tmp_path / "library.json")) == 0
+
+
+def test_moves(tmp_path) -> None:
+    """Testa se arquivos e pastas renomeados viram movidos, na mesma posição da playlist."""
+    _tree(tmp_path / "music")
+    manifest = LibraryManifest(tmp_path / "library.json")
+    playlist = Playlist()
+    apply_delta(playlist, manifest.rescan([tmp_path / "music"]))
+    old_path = tmp_path / "music" / "a" / "0" / "3.mp3"
+    index = playlist.index(Track(old_path))
+    playlist.current_index = index
+    new_path = tmp_path / "music" / "a" / "0" / "03 - renomeada.mp3"
+    old_path.rename(new_path)
+    (tmp_path / "music" / "b" / "1").rename(tmp_path / "music" / "a" / "b1")
+    delta = manifest.rescan()
+    assert (str(old_path), str(new_path)) in delta["moved"]
+    assert not delta["added"] and not delta["removed"]
+    apply_delta(playlist, delta)
+    assert str(playlist[index].path) == str(new_path)
+    assert playlist.current_index == index
+    assert sorted(str(track.path) for track in playlist) == sorted(manifest)
+
+    (tmp_path / "music" / "a" / "b1").rename(tmp_path / "music" / "b" / "1")
+    delta = manifest.refresh([tmp_path / "music" / "a", tmp_path / "music" / "b"])
+    assert len(delta["moved"]) == 4 and not delta["added"] and not delta["removed"]
+    assert manifest.rescan() == {"added": [], "removed": [], "modified": [], "moved": []}
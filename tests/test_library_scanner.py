@@ -0,0 +1,109 @@
+"""
+Esse módulo contém testes unitários da
+classe LibraryScanner, do módulo library_scanner.py,
+que varre as pastas da biblioteca em paralelo.
+"""
+from pathlib import Path
+from typing import List
+import pytest
+from src.core.library_scanner import LibraryScanner
+from src.core.playlist import Playlist
+from src.core.track import Track
+from src.utils.paths_utils import has_audio_extension, scan_directory
+from tests import audio_samples
+
+
+def _tree(root: Path, folders: int, files: int) -> List[str]:
+    """Cria `folders` pastas aninhadas em dois níveis, com `files` músicas e uma capa cada."""
+    paths = []
+    for folder in range(folders):
+        directory = root / f"artista {folder % 3}" / f"álbum {folder}"
+        directory.mkdir(parents=True)
+        (directory / "cover.jpg").write_bytes(b"")
+        for index in range(files):
+            path = directory / f"{index:02}.{'FLAC' if index % 2 else 'mp3'}"
+            path.write_bytes(b"")
+            paths.append(str(path))
+    return sorted(paths)
+
+
+def test_scan_directory(tmp_path) -> None:
+    """Testa a leitura de um nível de pasta e o filtro por extensão."""
+    (tmp_path / "b.mp3").write_bytes(b"")
+    (tmp_path / "a.Opus").write_bytes(b"")
+    (tmp_path / "notes.txt").write_bytes(b"")
+    (tmp_path / "disc 1.mp3").mkdir()
+    (tmp_path / "broken.mp3").symlink_to(tmp_path / "missing.mp3")
+    files, folders = scan_directory(tmp_path)
+    assert files == [str(tmp_path / "a.Opus"), str(tmp_path / "b.mp3")]
+    assert folders == [str(tmp_path / "disc 1.mp3")]
+    assert has_audio_extension("x.M4A") and not has_audio_extension("x.m4a.part")
+
+
+def test_scanner(tmp_path) -> None:
+    """Testa a varredura em paralelo, em lotes, com o progresso e as duplicadas."""
+    expected = _tree(tmp_path, folders=12, files=9)
+    playlist = Playlist()
+    playlist.add(Track(Path(expected[0])))
+    updates = []
+    scanner = LibraryScanner(tmp_path, playlist, workers=4, batch_size=10,
+                             on_progress=updates.append).start()
+    assert scanner.lock is playlist.lock  # O mesmo lock das outras threads que editam
+    assert scanner.wait(timeout=10)
+    assert sorted(str(track.path) for track in playlist) == expected
+    progress = scanner.progress
+    assert progress == updates[-1]
+    assert progress["directories"] == 1 + 3 + 12 and progress["pending"] == 0
+    assert progress["files"] == len(expected) and progress["added"] == len(expected) - 1
+    assert len(updates) > 2
+
+
+def test_scanner_cancel(tmp_path) -> None:
+    """Testa se cancelar interrompe a varredura e descarta o que falta."""
+    expected = _tree(tmp_path, folders=30, files=5)
+    scanner = LibraryScanner(tmp_path, batch_size=5, workers=2)
+    scanner.on_progress = lambda progress: scanner.cancel()
+    scanner.start().wait(timeout=10)
+    assert scanner.cancelled
+    assert 0 < len(scanner.playlist) < len(expected)
+    assert scanner.progress["added"] == len(scanner.playlist)
+
+
+def test_scanner_errors(tmp_path) -> None:
+    """Testa se uma pasta inicial que não existe chega em quem espera a varredura."""
+    _tree(tmp_path, folders=2, files=2)
+    scanner = LibraryScanner([tmp_path, tmp_path / "missing"]).start()
+    with pytest.raises(FileNotFoundError):
+        scanner.wait(timeout=10)
+    assert scanner.progress["errors"] == 1
+
+
+def test_scanner_progress_error(tmp_path) -> None:
+    """Testa se um erro em `on_progress` chega em quem espera a varredura, sem travá-la."""
+    _tree(tmp_path, folders=2, files=2)
+
+    def on_progress(_progress) -> None:
+        raise RuntimeError("progresso")
+
+    scanner = LibraryScanner(tmp_path, on_progress=on_progress).start()
+    with pytest.raises(RuntimeError, match="progresso"):
+        scanner.wait(timeout=10)
+    assert scanner.finished.is_set()
+
+    empty = tmp_path / "vazia"
+    empty.mkdir()
+    scanner = LibraryScanner(empty, on_progress=on_progress).start()  # Só o aviso final
+    with pytest.raises(RuntimeError, match="progresso"):
+        scanner.wait(timeout=10)
+
+
+def test_scanner_metadata(tmp_path) -> None:
+    """Testa a leitura dos metadados dos arquivos encontrados."""
+    (tmp_path / "album").mkdir()
+    (tmp_path / "album" / "01.flac").write_bytes(audio_samples.flac("Abertura", 44100, 44100 * 3))
+    (tmp_path / "album" / "02.mp3").write_bytes(b"")
+    scanner = LibraryScanner(tmp_path, metadata=True).start()
+    assert scanner.wait(timeout=10)
+    tracks = {track.path.name: track for track in scanner.playlist}
+    assert tracks["01.flac"].title == "Abertura" and tracks["01.flac"].duration == 3.0
+    assert tracks["02.mp3"].title is None
@@ -0,0 +1,106 @@
+"""
+Esse módulo contém testes unitários da
+classe LibraryWatcher, do módulo library_watcher.py,
+que aplica as mudanças nas pastas da biblioteca.
+"""
+import shutil
+import sys
+from pathlib import Path
+from queue import Queue
+from threading import Event, Thread
+from time import sleep
+from types import SimpleNamespace
+from typing import List, Optional
+import pytest
+from src.core import library_watcher
+from src.core.library_manifest import LibraryManifest
+from src.core.library_watcher import LibraryWatcher
+from src.core.playlist import Playlist
+from src.core.track import Track
+
+
+def _album(folder: Path, files: int = 3) -> None:
+    folder.mkdir(parents=True)
+    for index in range(files):
+        (folder / f"{index}.mp3").write_bytes(b"x" * (index + 1))
+
+
+def _paths(playlist: Playlist) -> List[str]:
+    return sorted(str(track.path) for track in playlist)
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_watcher(tmp_path, use_inotify) -> None:
+    """Testa se álbuns copiados, arquivos renomeados e apagados chegam na playlist."""
+    root = tmp_path / "music"
+    _album(root / "a")
+    manifest = LibraryManifest(tmp_path / "library.json")
+    playlist = Playlist()
+    manifest.rescan([root])
+    deltas = Queue()
+    watcher = LibraryWatcher(manifest, playlist, on_delta=deltas.put, settle=0.05,
+                             poll_interval=0.05, use_inotify=use_inotify).start()
+    assert watcher.lock is playlist.lock
+    try:
+        assert watcher.wait_ready(timeout=10)
+        assert watcher.backend == ("inotify" if use_inotify else "polling")
+        _album(root / "b" / "disc 1", files=5)
+        delta = deltas.get(timeout=10)
+        while len(delta["added"]) < 5:  # A cópia pode ser vista em mais de uma diferença
+            delta = deltas.get(timeout=10)
+        assert len(playlist) == 5
+
+        playlist.add(Track(root / "a" / "0.mp3"))
+        playlist.current_index = 5
+        (root / "a" / "0.mp3").rename(root / "b" / "intro.mp3")
+        assert deltas.get(timeout=10)["moved"] == [
+            (str(root / "a" / "0.mp3"), str(root / "b" / "intro.mp3"))]
+        assert str(playlist.get_current_track().path) == str(root / "b" / "intro.mp3")
+
+        shutil.rmtree(root / "b" / "disc 1")
+        delta = deltas.get(timeout=10)
+        assert len(delta["removed"]) == 5
+        assert _paths(playlist) == [str(root / "b" / "intro.mp3")]
+    finally:
+        watcher.stop()
+    assert sorted(manifest) == [str(root / "a" / "1.mp3"), str(root / "a" / "2.mp3"),
+                                str(root / "b" / "intro.mp3")]
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify só existe no Linux")
+def test_watcher_max_delay(tmp_path, monkeypatch) -> None:
+    """Testa se eventos sem parar (uma cópia longa) são aplicados depois de `max_delay`."""
+    root = tmp_path / "music"
+    root.mkdir()
+    manifest = LibraryManifest(tmp_path / "library.json")
+    manifest.rescan([root])
+    copying = Event()
+    real_select = library_watcher.select.select
+
+    def select(read: list, write: list, error: list, timeout: Optional[float] = None) -> tuple:
+        # Durante a cópia há sempre eventos: o `select` nunca volta sem nada para ler
+        return real_select(read, write, error, None if copying.is_set() else timeout)
+
+    monkeypatch.setattr(library_watcher, "select", SimpleNamespace(select=select))
+    deltas = Queue()
+    watcher = LibraryWatcher(manifest, on_delta=deltas.put, settle=0.05, max_delay=0.2).start()
+
+    def copy() -> None:
+        index = 0
+        while copying.is_set():
+            (root / f"{index}.mp3").write_bytes(b"x")
+            index += 1
+            sleep(0.01)
+
+    writer = Thread(target=copy)
+    try:
+        assert watcher.wait_ready(timeout=10) and watcher.backend == "inotify"
+        copying.set()
+        writer.start()
+        assert deltas.get(timeout=2)["added"]  # Com a cópia ainda em andamento
+        assert writer.is_alive()
+    finally:
+        copying.clear()
+        writer.join()
+        watcher.stop()
+    watcher.stop()  # Parar de novo não faz nada
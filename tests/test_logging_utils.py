@@ -0,0 +1,69 @@
+"""
+Esse módulo contém testes unitários e
+automatizados referente as funções
+do módulo logging_utils.py
+"""
+from src.utils import logging_utils
+
+
+def test_scope_level() -> None:
+    """Testa as funções `set_scope_level` e `is_enabled`."""
+    scope = "tests.scope_level"
+    assert logging_utils.is_enabled(scope, "debug")
+    logging_utils.set_scope_level(scope, "warning")
+    assert not logging_utils.is_enabled(scope, "info")
+    assert logging_utils.is_enabled(scope, "error")
+
+
+def test_log_sampler() -> None:
+    """Testa a classe `LogSampler`."""
+    sampler = logging_utils.LogSampler(rate=0.0, burst=3)
+    allowed = [sampler.allow() for _ in range(10)]
+    assert allowed == [True] * 3 + [False] * 7
+    assert sampler.take_dropped() == 7
+    assert sampler.dropped == 0
+
+
+def test_log_to_file(tmp_path, monkeypatch) -> None:
+    """Testa o log em arquivo pela fila e thread de fundo."""
+    monkeypatch.setattr(logging_utils, "LOGGING_PATH_OUTPUT", str(tmp_path / "log"))
+    for i in range(3):
+        logging_utils.log("mensagem %d", "info", "tests.file", True, True, (i,))
+    logging_utils.shutdown_logging("tests.file")
+    logging_utils.log("mensagem %d", "info", "tests.file", True, True, (3,))
+    logging_utils.shutdown_logging("tests.file")
+    lines = (tmp_path / "log" / "tests_file.log").read_text(encoding="utf-8").splitlines()
+    assert [line.rsplit(": ", 1)[1] for line in lines] == [
+        "mensagem 0", "mensagem 1", "mensagem 2", "mensagem 3"]  # Recriado sem limpar o arquivo
+
+
+def test_message_formatted_on_log() -> None:
+    """Testa se a mensagem é montada no momento do log, e não na thread de fundo."""
+    queue = logging_utils.Queue(2)
+    handler = logging_utils._DroppingQueueHandler(queue)
+    tracks = ["a"]
+    handler.emit(logging_utils.LogRecord(
+        "tests", logging_utils.INFO, __file__, 0, "trilhas: %s", (tracks,), None))
+    tracks.append("b")
+    record = queue.get_nowait()
+    assert record.getMessage() == "trilhas: ['a']"
+    assert not record.args
+
+
+def test_queue_overflow() -> None:
+    """Testa a política de descarte da fila de log cheia."""
+    queue = logging_utils.Queue(2)
+    handler = logging_utils._DroppingQueueHandler(queue)
+    records = [
+        logging_utils.LogRecord("tests", logging_utils.INFO, __file__, 0, "msg %d", (i,), None)
+        for i in range(4)
+    ]
+    for record in records:
+        handler.enqueue(record)
+    assert handler.dropped == 2
+    queue.get_nowait()
+    queue.get_nowait()
+    handler.enqueue(records[0])
+    warning = queue.get_nowait()
+    assert warning.getMessage() == "2 registros de log descartados (fila cheia)"
+    assert handler.dropped == 0
@@ -0,0 +1,64 @@
+"""
+Esse módulo contém testes unitários da
+classe MmapStream e do protocolo `mmap://`,
+do módulo mmap_stream.py.
+"""
+import os
+from typing import Callable
+import pytest
+from src.core.mmap_stream import MmapStream, mmap_uri, open_mmap_stream, register_mmap_protocol
+
+DATA = bytes(range(256)) * 300  # 76800 bytes
+
+
+def test_read_and_seek(tmp_path) -> None:
+    """Testa a leitura direto num buffer, as fatias do mapeamento e o seek."""
+    path = tmp_path / "a.flac"
+    path.write_bytes(DATA)
+    stream = MmapStream(path, read_ahead=16 * 1024)
+    assert stream.size == len(DATA)
+    buffer = bytearray(5000)
+    received = bytearray()
+    while count := stream.readinto(memoryview(buffer)):
+        received += buffer[:count]
+    assert received == DATA
+    assert stream.seek(70_000) == 70_000
+    part = stream.read(100)
+    assert isinstance(part, memoryview) and part == DATA[70_000:70_100]
+    assert stream.seek(len(DATA) + 10) == len(DATA)
+    assert stream.read(10) == b"" and stream.readinto(buffer) == 0
+    stream.close()
+    assert part[:2] == DATA[70_000:70_002]  # A fatia continua válida depois do close
+
+
+def test_empty_file(tmp_path) -> None:
+    """Testa um arquivo vazio, que não pode ser mapeado."""
+    path = tmp_path / "vazio.mp3"
+    path.write_bytes(b"")
+    stream = MmapStream(path)
+    assert stream.size == 0
+    assert stream.readinto(bytearray(10)) == 0
+    stream.close()
+
+
+def test_protocol(tmp_path) -> None:
+    """Testa o URI `mmap://` e o registro no mpv."""
+    path = tmp_path / "b.ogg"
+    path.write_bytes(DATA)
+    uri = mmap_uri(path)
+    assert uri == "mmap://" + os.path.abspath(path)
+    stream = open_mmap_stream(uri)
+    assert bytes(stream.read(4)) == DATA[:4]
+    stream.close()
+    with pytest.raises(ValueError):
+        open_mmap_stream(mmap_uri(tmp_path / "faltando.ogg"))
+
+    class FakePlayer:
+        protocols = {}
+
+        def register_stream_protocol(self, proto: str, open_fn: Callable) -> None:
+            self.protocols[proto] = open_fn
+
+    player = FakePlayer()
+    register_mmap_protocol(player)
+    assert player.protocols == {"mmap": open_mmap_stream}
@@ -0,0 +1,55 @@
+"""
+Esse módulo contém testes unitários do despacho
+de eventos por tipo da classe MPV, do módulo mpv.py.
+Precisa do libmpv (só para criar o MPV, sem a
+thread de eventos); sem ele, os testes são pulados.
+"""
+from types import SimpleNamespace
+import pytest
+
+try:
+    from src.mpv import mpv
+except OSError as error:  # O libmpv não pôde ser carregado
+    pytest.skip(f"libmpv indisponível: {error}", allow_module_level=True)
+
+
+def _event(event_id: int) -> SimpleNamespace:
+    return SimpleNamespace(event_id=SimpleNamespace(value=event_id))
+
+
+def test_event_ids() -> None:
+    """Testa a normalização dos tipos de evento (str, int, MpvEventID e None)."""
+    ids = mpv._event_ids  # pylint: disable=protected-access
+    assert ids(()) == tuple(mpv.MpvEventID.ANY)
+    assert ids(("end-file", mpv.MpvEventID.END_FILE, mpv.MpvEventID(mpv.MpvEventID.SEEK), "seek")) == (
+        mpv.MpvEventID.END_FILE, mpv.MpvEventID.SEEK)
+    assert ids((None,)) == ()
+    assert ids(("shutdown", None)) == (mpv.MpvEventID.SHUTDOWN,)
+
+
+def test_event_callback_dispatch() -> None:
+    """Testa se cada callback só recebe os seus tipos de evento e se o `unregister` o remove."""
+    player = mpv.MPV(start_event_thread=False)
+    seen = []
+    try:
+        @player.event_callback("start-file", "end-file")
+        def on_file(event):
+            seen.append(("file", event.event_id.value))
+
+        @player.event_callback(None)
+        def never(event):
+            seen.append(("never", event.event_id.value))
+
+        player.register_event_callback(lambda event: seen.append(("all", event.event_id.value)))
+        player._dispatch(_event(mpv.MpvEventID.START_FILE))  # pylint: disable=protected-access
+        player._dispatch(_event(mpv.MpvEventID.SEEK))  # pylint: disable=protected-access
+        assert seen == [("file", mpv.MpvEventID.START_FILE), ("all", mpv.MpvEventID.START_FILE),
+                        ("all", mpv.MpvEventID.SEEK)]
+
+        player.unregister_event_callback(on_file)
+        never.unregister_mpv_events()
+        seen.clear()
+        player._dispatch(_event(mpv.MpvEventID.END_FILE))  # pylint: disable=protected-access
+        assert seen == [("all", mpv.MpvEventID.END_FILE)]
+    finally:
+        player.terminate()
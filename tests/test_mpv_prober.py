@@ -0,0 +1,137 @@
+"""
+Esse módulo contém testes unitários da
+classe MpvProber, do módulo mpv_prober.py,
+que lê os metadados com instâncias do mpv.
+"""
+from concurrent.futures import Future
+from pathlib import Path
+from threading import Lock, Timer
+from types import SimpleNamespace
+from typing import Any, Callable, Optional
+from src.core.mpv_prober import MpvProber
+from src.core.track import Track
+
+FILES = {
+    "a.wav": {"duration": 12.5, "metadata": {"TITLE": "A", "Artist": "X"}},
+    "b.wav": {"duration": 3.0, "metadata": {}},
+    "c.wav": {"duration": None, "metadata": {"title": "C", "album": "Y"}},
+}
+
+
+class FakeProbeMpv:
+    """Imita uma instância do mpv: responde ao `loadfile` de outra thread, como o libmpv."""
+    created = 0
+    lock = Lock()
+
+    def __init__(self) -> None:
+        with FakeProbeMpv.lock:
+            FakeProbeMpv.created += 1
+        self.callbacks = {}
+        self.current = None
+        self.loads = 0
+        self.terminated = False
+
+    def event_callback(self, name: str) -> Callable[[Callable], Callable]:
+        def register(callback: Callable) -> Callable:
+            self.callbacks[name] = callback
+            return callback
+        return register
+
+    def command_async(self, name: str, *args: Any, callback: Optional[Callable] = None) -> None:
+        assert not self.terminated
+        if name == "loadfile":
+            self.loads += 1
+            Timer(0.001, self._load, (args[0], callback)).start()
+
+    def _load(self, path: str, callback: Callable) -> None:
+        name = Path(path).name
+        if name == "hang.wav":
+            return
+        if name == "silent.wav":  # Abre, mas as propriedades nunca chegam
+            self.current = None
+            self.callbacks["file-loaded"](SimpleNamespace(data=None))
+            return
+        if name == "invalid":
+            callback(RuntimeError("loadfile"), None)
+            return
+        if name not in FILES:
+            self.callbacks["end-file"](SimpleNamespace(data=SimpleNamespace(reason=4)))
+            return
+        self.current = FILES[name]
+        self.callbacks["file-loaded"](SimpleNamespace(data=None))
+
+    def get_property_async(self, name: str) -> Future:
+        future = Future()
+        if self.current is not None:
+            future.set_result(self.current[name])
+        return future
+
+    def terminate(self) -> None:
+        self.terminated = True
+
+
+def _prober(**kwargs: Any) -> MpvProber:
+    FakeProbeMpv.created = 0
+    return MpvProber(factory=FakeProbeMpv, **kwargs).start()
+
+
+def test_probe_many() -> None:
+    """Testa a leitura em ordem, com as tags em qualquer caixa."""
+    paths = ["a.wav", "b.wav", "c.wav"] * 20
+    with _prober(workers=3, queue_size=4) as prober:
+        results = list(prober.probe_many(paths))
+    assert FakeProbeMpv.created == 3  # Uma instância por worker, reutilizada
+    assert results[:3] == [
+        {"title": "A", "artist": "X", "album": None, "duration": 12.5},
+        {"title": None, "artist": None, "album": None, "duration": 3.0},
+        {"title": "C", "artist": None, "album": "Y", "duration": None},
+    ]
+    assert results == results[:3] * 20
+
+
+def test_failures() -> None:
+    """Testa arquivos que o mpv não abre e uma instância que não responde."""
+    with _prober(workers=1, timeout=0.2) as prober:
+        assert prober.probe("missing.wav").result()["title"] is None
+        assert prober.probe("invalid").result()["duration"] is None
+        assert prober.probe("hang.wav").result()["duration"] is None
+        assert FakeProbeMpv.created == 2  # A instância presa foi substituída
+        assert prober.probe("a.wav").result()["title"] == "A"
+
+
+def test_property_timeout() -> None:
+    """Testa uma instância que abre o arquivo mas não responde aos pedidos das propriedades."""
+    with _prober(workers=1, timeout=0.2) as prober:
+        metadata = prober.probe("silent.wav").result(timeout=5)
+        assert metadata == {"title": None, "artist": None, "album": None, "duration": None}
+        assert FakeProbeMpv.created == 2  # A instância presa foi substituída
+        assert prober.probe("b.wav").result(timeout=5)["duration"] == 3.0
+
+
+def test_fill_metadata() -> None:
+    """Testa que só as trilhas ainda sem título ou duração são lidas."""
+    tracks = [
+        Track(Path("a.wav"), "local"),
+        Track(Path("b.wav"), "local", title="B", duration=3.0),
+        Track(Path("c.wav"), "local", title="Já tem"),
+    ]
+    with _prober(workers=2) as prober:
+        prober.fill_metadata(tracks)
+    assert (tracks[0].title, tracks[0].duration) == ("A", 12.5)
+    assert (tracks[1].title, tracks[1].duration) == ("B", 3.0)
+    assert (tracks[2].title, tracks[2].duration) == ("Já tem", None)
+
+
+def test_close_terminates() -> None:
+    """Testa que `close` fecha todas as instâncias."""
+    players = []
+
+    def factory() -> FakeProbeMpv:
+        players.append(FakeProbeMpv())
+        return players[-1]
+
+    prober = MpvProber(workers=2, factory=factory).start()
+    prober.probe("a.wav").result()
+    prober.close()
+    assert len(players) == 2
+    assert all(player.terminated for player in players)
@@ -25,3 +25,35 @@ def test_increment_index() -> None:
     assert index == 1, f"Index: {index}"
     index = operations_utils.increment_index(index, len_list, -1)
     assert index == 0, f"Index: {index}"
+
+def test_fenwick_tree() -> None:
+    """Testa a classe `FenwickTree`."""
+    tree = operations_utils.FenwickTree(4)
+    tree.add(0, 1)
+    tree.add(2, 3)
+    assert tree.prefix_sum(0) == 0
+    assert tree.prefix_sum(1) == 1
+    assert tree.prefix_sum(3) == 4
+    values = [1, 0, 3, 0]
+    for value in (2, 0, 5, 1, 7):
+        tree.append(value)
+        values.append(value)
+    assert len(tree) == len(values)
+    for end in range(len(values) + 1):
+        assert tree.prefix_sum(end) == sum(values[:end]), f"end: {end}"
+    tree.add(6, -5)
+    values[6] -= 5
+    assert tree.prefix_sum(len(values)) == sum(values)
+
+def test_fenwick_tree_search() -> None:
+    """Testa os métodos `from_values` e `search` da `FenwickTree`."""
+    values = [3, 0, 2, 5, 1]
+    tree = operations_utils.FenwickTree.from_values(values)
+    for end in range(len(values) + 1):
+        assert tree.prefix_sum(end) == sum(values[:end]), f"end: {end}"
+    assert tree.search(0) == (0, 0)
+    assert tree.search(2) == (0, 2)
+    assert tree.search(3) == (2, 0)
+    assert tree.search(4) == (2, 1)
+    assert tree.search(5) == (3, 0)
+    assert tree.search(10) == (4, 0)
@@ -4,6 +4,7 @@ de cada método/funcionalidade da class
 Playlist, do módulo playlist.py
 """
 from pathlib import Path
+import pytest
 from src.core.playlist import Track, Playlist
 
 TRACK1 = Track(Path("./src/resources/test_musics/music1.mp3"), "local", title="track1")
@@ -113,3 +114,90 @@ def test_mode() -> None:
     assert playlist.next() == TRACK1
     assert playlist.next() == TRACK2
     tear_down()
+
+def test_get_by_id() -> None:
+    """Testa os métodos `get_by_id` e `get_all`."""
+    set_up()
+    assert playlist.get_by_id(TRACK2.id) is TRACK2
+    assert playlist.get_all(in_original_pos=True) == [TRACK1, TRACK2, TRACK3]
+    playlist.remove(TRACK2)
+    assert playlist.get_by_id(TRACK2.id) is None
+    assert playlist.get_all(in_original_pos=True) == [TRACK1, TRACK3]
+    tear_down()
+
+def test_insert() -> None:
+    """Testa o método `insert`."""
+    set_up()
+    playlist.next()
+    track4 = Track(Path("./src/resources/test_musics/music4.mp3"), "local", title="track4")
+    playlist.insert(0, track4)
+    assert playlist == [track4, TRACK1, TRACK2, TRACK3]
+    assert playlist.get_current_track() == TRACK2
+    assert playlist.index(TRACK3) == 3
+    tear_down()
+
+def test_move() -> None:
+    """Testa o método `move`."""
+    set_up()
+    playlist.move(0, 2)
+    assert playlist == [TRACK2, TRACK3, TRACK1]
+    assert playlist.get_current_track() == TRACK1
+    playlist.move(1, 0)
+    assert playlist == [TRACK3, TRACK2, TRACK1]
+    assert playlist.get_current_track() == TRACK1
+    assert playlist.index(TRACK1) == 2
+    tear_down()
+
+def test_add_many() -> None:
+    """Testa o método `add_many`."""
+    set_up()
+    track4 = Track(Path("./src/resources/test_musics/music4.mp3"), "local", title="track4")
+    duplicated = Track(TRACK2.path, "local")
+    rejected = playlist.add_many(iter([track4, duplicated, track4]))
+    assert rejected == [duplicated, track4]
+    assert playlist == [TRACK1, TRACK2, TRACK3, track4]
+    assert playlist.get_by_id(track4.id) is track4
+    tear_down()
+    assert playlist.add_many([TRACK1, TRACK2]) == []
+    assert playlist.get_current_track() == TRACK1
+    tear_down()
+
+def test_add_many_failed_input() -> None:
+    """Testa se `add_many` não adiciona nada quando `tracks` falha no meio."""
+    def scan():
+        yield TRACK1
+        yield TRACK2
+        raise OSError("disco removido")
+
+    with pytest.raises(OSError):
+        playlist.add_many(scan())
+    assert len(playlist) == 0
+    assert playlist.get_all(in_original_pos=True) == []
+    assert playlist.get_by_id(TRACK1.id) is None
+    playlist.add_many([TRACK1, TRACK2])
+    assert playlist == [TRACK1, TRACK2]
+    tear_down()
+
+def test_sampled_logs() -> None:
+    """Testa se os logs por elemento são amostrados em modo debug."""
+    messages = []
+    sampled = Playlist(debug=True, element_logs_per_second=0.0)
+    sampled._log_handler = lambda message, level, *args: messages.append(message % args)
+    sampled.add_many([TRACK1, TRACK2, TRACK3])
+    for _ in range(100):
+        assert sampled[1] == TRACK2
+    getitem_logs = [message for message in messages if "__getitem__" in message]
+    assert len(getitem_logs) == 10  # Só o `burst` inicial do LogSampler
+
+def test_select() -> None:
+    """Testa o método `select`."""
+    changes = []
+    playlist.add_many([TRACK1, TRACK2, TRACK3])
+    playlist.add_listener(changes.append)
+    assert playlist.select(2) == TRACK3
+    assert playlist.get_current_track() == TRACK3
+    assert changes == [{"kind": "current", "index": 2}]
+    with pytest.raises(IndexError):
+        playlist.select(3)
+    playlist.remove_listener(changes.append)
+    tear_down()
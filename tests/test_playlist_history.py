@@ -0,0 +1,173 @@
+"""
+Esse módulo contém testes unitários da
+classe PlaylistHistory, do módulo playlist_history.py,
+que desfaz e refaz as edições da Playlist.
+"""
+from random import Random
+from typing import Iterable, List
+import pytest
+from src.core.block_list import BlockList
+from src.core.playlist import Playlist
+from src.core.playlist_history import PlaylistHistory
+from src.core.playlist_journal import PlaylistJournal
+from src.core.search_index import SearchIndex
+from src.core.track import Track
+from src.core.track_store import TrackStore
+
+
+def _paths(tracks: Iterable[Track]) -> List[str]:
+    return [str(track.path) for track in tracks]
+
+
+def _edit(playlist: Playlist, random: Random, step: int) -> None:
+    """Faz uma edição aleatória na playlist."""
+    choice = random.randrange(4)
+    if choice == 0 or len(playlist) < 2:
+        playlist.insert(random.randint(0, len(playlist)), Track(f"/music/new/{step}.mp3"))
+    elif choice == 1:
+        playlist.pop(random.randrange(len(playlist)))
+    elif choice == 2:
+        playlist.move(random.randrange(len(playlist)), random.randrange(len(playlist)))
+    else:
+        playlist.add_many(Track(f"/music/many/{step}/{index}.mp3") for index in range(3))
+
+
+@pytest.mark.parametrize("store", [None, TrackStore])
+def test_undo_redo(store) -> None:
+    """Testa desfazer e refazer uma sequência de edições, com os dois armazenamentos."""
+    random = Random(2)
+    playlist = Playlist(store=None if store is None else store())
+    playlist.add_many(Track(f"/music/{index}.mp3") for index in range(1500))
+    history = PlaylistHistory(playlist)
+    states = [_paths(playlist)]
+    for step in range(40):
+        _edit(playlist, random, step)
+        states.append(_paths(playlist))
+    playlist.clear()
+    states.append([])
+
+    for expected in reversed(states[:-1]):
+        assert history.undo()
+        assert _paths(playlist) == expected
+        assert all(track in playlist for track in playlist[:5])
+    assert not history.undo() and history.can_redo()
+    for expected in states[1:]:
+        assert history.redo()
+        assert _paths(playlist) == expected
+    assert not history.redo()
+
+    history.undo()
+    playlist.add(Track("/music/other.mp3"))  # Uma edição nova descarta os refazer
+    assert not history.can_redo()
+    assert _paths(playlist) == states[-2] + ["/music/other.mp3"]
+    assert playlist.index(Track("/music/other.mp3")) == len(playlist) - 1
+
+
+def test_snapshot_is_isolated() -> None:
+    """Testa se um estado não muda com as edições feitas depois dele."""
+    playlist = Playlist()
+    playlist.add_many(Track(f"/music/{index}.mp3") for index in range(1000))
+    playlist.current_index = 10
+    state = playlist.snapshot()
+    playlist.pop(0)
+    playlist.move(0, 900)
+    playlist.insert(500, Track("/music/new.mp3"))
+    assert len(state) == 1000 and state.current_index == 10
+    assert _paths(state) == [f"/music/{index}.mp3" for index in range(1000)]
+    assert str(state.get_current_track().path) == "/music/10.mp3"
+    assert str(state[-1].path) == "/music/999.mp3"
+    with pytest.raises(ValueError):
+        Playlist().restore(state)
+
+
+def test_current_track_after_undo() -> None:
+    """Testa se a trilha atual é mantida, ou volta a ser a do estado, ao desfazer."""
+    playlist = Playlist()
+    playlist.add_many(Track(f"/music/{index}.mp3") for index in range(10))
+    history = PlaylistHistory(playlist)
+    playlist.current_index = 5
+    playlist.insert(0, Track("/music/first.mp3"))
+    assert playlist.current_index == 6
+    history.undo()
+    assert str(playlist.get_current_track().path) == "/music/5.mp3"
+    playlist.pop(4)
+    history.undo()  # A trilha atual continua a mesma, agora uma posição depois
+    assert playlist.current_index == 5
+    playlist.insert(3, Track("/music/new.mp3"))
+    playlist.current_index = 3
+    history.undo()  # A trilha atual some: volta a ser a do estado
+    assert playlist.current_index == 5
+    playlist.clear()
+    history.undo()
+    assert playlist.current_index == 5
+
+
+def test_memory_budget() -> None:
+    """Testa se os passos mais antigos são descartados acima dos limites."""
+    playlist = Playlist()
+    playlist.add_many(Track(f"/music/{index}.mp3") for index in range(10_000))
+    history = PlaylistHistory(playlist, max_steps=5)
+    for index in range(8):
+        playlist.pop(index * 1000)
+    assert len(history) == 5
+    budget = history.memory_usage // 2
+    history.memory_budget = budget
+    playlist.pop(0)
+    assert history.memory_usage <= budget and 0 < len(history) < 5
+
+
+@pytest.mark.parametrize("store", [None, TrackStore])
+def test_memory_counts_removed_tracks(store) -> None:
+    """Testa se as trilhas que só o histórico mantém vivas entram na estimativa."""
+    playlist = Playlist(store=None if store is None else store())
+    playlist.add_many(Track(f"/music/{index}.mp3", title=f"Faixa {index}") for index in range(10_000))
+    history = PlaylistHistory(playlist)
+    playlist.move(0, 9_999)
+    moved = history.memory_usage
+    playlist.clear()
+    assert history.memory_usage - moved > 10_000 * 50  # Os blocos e as trilhas removidas
+    history.memory_budget = moved * 2
+    playlist.add(Track("/music/new.mp3"))
+    assert len(history) == 1  # A limpeza não cabe mais no orçamento
+
+
+def test_undo_reaches_listeners(tmp_path) -> None:
+    """Testa se o journal e o índice de busca acompanham desfazer e refazer."""
+    journal = PlaylistJournal(tmp_path / "playlist.json", tmp_path / "playlist.journal")
+    playlist = journal.load()
+    playlist.add_many(Track(f"/music/{index}.mp3", title=f"Faixa {index}") for index in range(600))
+    index = SearchIndex(playlist)
+    history = PlaylistHistory(playlist)
+    for position in (0, 100, 300):
+        playlist.pop(position)
+    playlist.move(0, 500)
+    history.undo()
+    history.undo()
+    history.redo()
+    assert [track.title for track in index.search("faixa 101")] == []
+    assert [track.title for track in index.search("faixa 301")] == ["Faixa 301"]
+    journal.close()
+    recovered = PlaylistJournal(tmp_path / "playlist.json", tmp_path / "playlist.journal").load()
+    assert _paths(recovered) == _paths(playlist)
+
+
+def test_undo_moves_reaches_listeners(tmp_path, monkeypatch) -> None:
+    """Testa se desfazer movimentos em vários trechos não insere uma trilha antes de removê-la."""
+    monkeypatch.setattr(BlockList, "_LOAD", 2)  # Blocos pequenos: vários trechos alterados
+    for seed in range(10):
+        folder = tmp_path / str(seed)
+        journal = PlaylistJournal(folder / "playlist.json", folder / "playlist.journal")
+        playlist = journal.load()
+        playlist.add_many(Track(f"/music/{index}.mp3", title=f"Faixa {index}") for index in range(16))
+        index = SearchIndex(playlist)
+        history = PlaylistHistory(playlist)
+        random = Random(seed)
+        for _ in range(3):
+            playlist.move(random.randrange(16), random.randrange(16))
+        for _ in range(3):
+            history.undo()
+        for track in playlist:
+            assert track in index.search(track.title)
+        journal.close()
+        recovered = PlaylistJournal(folder / "playlist.json", folder / "playlist.journal").load()
+        assert _paths(recovered) == _paths(playlist)
@@ -0,0 +1,181 @@
+"""
+Esse módulo contém testes unitários da
+classe PlaylistJournal, do módulo playlist_journal.py,
+que registra as alterações da Playlist.
+"""
+from pathlib import Path
+from typing import Any, List
+from src.core.playlist import Playlist
+from src.core.playlist_journal import PlaylistJournal
+from src.core.track import Track
+
+
+def _journal(tmp_path: Path, **options: Any) -> PlaylistJournal:
+    return PlaylistJournal(
+        tmp_path / "playlist.json",
+        tmp_path / "playlist.journal",
+        **options
+    )
+
+
+def _paths(playlist: Playlist) -> List[str]:
+    return [str(track.path) for track in playlist]
+
+
+def test_journal_recovery(tmp_path) -> None:
+    """Testa se as alterações registradas no journal são recuperadas ao carregar."""
+    journal = _journal(tmp_path)
+    playlist = journal.load()
+    playlist.add_many(Track(f"/music/{index}.mp3", title=f"{index}") for index in range(5))
+    playlist.add(Track("/music/5.mp3"))
+    playlist.insert(0, Track("/music/first.mp3"))
+    playlist.move(1, 3)
+    playlist.pop(2)
+    playlist.next()
+    playlist.mode = "one_repeat"
+    journal.close()
+
+    recovered = _journal(tmp_path).load()
+    assert _paths(recovered) == _paths(playlist)
+    assert recovered[1].title == playlist[1].title
+    assert recovered.current_index == playlist.current_index
+    assert recovered.mode == "one_repeat"
+
+
+def test_journal_torn_line(tmp_path) -> None:
+    """Testa se uma linha incompleta no fim do journal é descartada."""
+    journal = _journal(tmp_path)
+    playlist = journal.load()
+    playlist.add(Track("/music/a.mp3"))
+    playlist.add(Track("/music/b.mp3"))
+    journal.close()
+    with open(tmp_path / "playlist.journal", "a", encoding="utf-8") as file:
+        file.write('{"kind":"remove","ind')
+
+    journal = _journal(tmp_path)
+    recovered = journal.load()
+    assert _paths(recovered) == ["/music/a.mp3", "/music/b.mp3"]
+    # O journal volta a ser válido para os próximos registros
+    recovered.pop(0)
+    journal.close()
+    assert _paths(_journal(tmp_path).load()) == ["/music/b.mp3"]
+
+
+def test_journal_compaction(tmp_path) -> None:
+    """Testa se a compactação gera um snapshot e recomeça o journal."""
+    journal = _journal(tmp_path)
+    playlist = journal.load()
+    for index in range(25):
+        playlist.add(Track(f"/music/{index}.mp3"))
+    playlist.clear()
+    playlist.add(Track("/music/last.mp3"))
+    assert journal.compact(wait=True)
+    playlist.add(Track("/music/after.mp3"))
+    journal.close()
+
+    assert (tmp_path / "playlist.json").read_text(encoding="utf-8")
+    assert not (tmp_path / "playlist.journal.old").exists()
+    lines = (tmp_path / "playlist.journal").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2 and '"generation":2' in lines[0]  # A geração e o registro
+    assert _paths(_journal(tmp_path).load()) == ["/music/last.mp3", "/music/after.mp3"]
+
+
+def test_journal_automatic_compaction(tmp_path) -> None:
+    """Testa se o journal é compactado sozinho após `compact_every` registros."""
+    journal = _journal(tmp_path, compact_every=10)
+    playlist = journal.load()
+    playlist.add_many(Track(f"/music/{index}.mp3") for index in range(100))
+    for index in range(9):
+        playlist.move(index, 99 - index)
+    journal.close()  # Espera a compactação em andamento
+
+    assert (tmp_path / "playlist.json").read_text(encoding="utf-8")
+    assert _paths(_journal(tmp_path).load()) == _paths(playlist)
+
+
+def test_journal_interrupted_compaction(tmp_path) -> None:
+    """Testa a recuperação quando a compactação foi interrompida antes do snapshot."""
+    journal = _journal(tmp_path)
+    playlist = journal.load()
+    playlist.add(Track("/music/a.mp3"))
+    journal.close()
+    (tmp_path / "playlist.journal").rename(tmp_path / "playlist.journal.old")
+    with open(tmp_path / "playlist.journal", "w", encoding="utf-8") as file:
+        file.write('{"kind":"insert","index":1,"tracks":[{"path":"/music/b.mp3"}]}\n')
+
+    recovered = _journal(tmp_path).load()
+    assert _paths(recovered) == ["/music/a.mp3", "/music/b.mp3"]
+    assert not (tmp_path / "playlist.journal.old").exists()
+
+
+def test_journal_compaction_crash(tmp_path, monkeypatch) -> None:
+    """Testa se um journal que o snapshot já contém é descartado, e não reaplicado."""
+    journal = _journal(tmp_path)
+    playlist = journal.load()
+    playlist.add_many(Track(f"/music/{index}.mp3") for index in range(6))
+    playlist.pop(0)
+    playlist.move(0, 3)
+    rotated = (tmp_path / "playlist.journal").read_bytes()
+    assert journal.compact(wait=True)
+    (tmp_path / "playlist.journal.old").write_bytes(rotated)  # Como se o `unlink` não tivesse ocorrido
+    playlist.pop(1)
+    journal.close()
+    expected = _paths(playlist)
+    journal = _journal(tmp_path)
+    assert _paths(journal.load()) == expected
+    assert not (tmp_path / "playlist.journal.old").exists()
+
+    # A recuperação pode parar entre apagar o journal antigo e o atual
+    monkeypatch.setattr(PlaylistJournal, "_compact_old_journal", lambda *args: None)
+    playlist = journal.load()
+    playlist.move(0, 2)
+    assert journal.compact()  # Só rotaciona
+    playlist.pop(0)
+    journal.close()
+    expected = _paths(playlist)
+    current = (tmp_path / "playlist.journal").read_bytes()
+    journal = _journal(tmp_path)
+    assert _paths(journal.load()) == expected  # Grava o snapshot e apaga os dois journals
+    journal.close()
+    (tmp_path / "playlist.journal").write_bytes(current)  # Como se não tivesse sido apagado
+    assert _paths(_journal(tmp_path).load()) == expected
+
+
+def test_journal_shuffle(tmp_path) -> None:
+    """Testa se a ordem aleatória continua igual depois de carregar, com e sem compactação."""
+    journal = _journal(tmp_path)
+    playlist = journal.load()
+    playlist.add_many(Track(Path(f"/music/{index}.mp3")) for index in range(30))
+    playlist.mode = "shuffle"
+    for _ in range(4):
+        playlist.next()
+    playlist.previous()
+    journal.close()
+
+    journal = _journal(tmp_path)
+    recovered = journal.load()
+    assert recovered.mode == "shuffle"
+    assert recovered.get_current_track() == playlist.get_current_track()
+    assert recovered.shuffle_state() == playlist.shuffle_state()
+    assert journal.compact(wait=True)
+    assert recovered.next() == playlist.next()
+    journal.close()
+
+    recovered = _journal(tmp_path).load()
+    assert [recovered.next() for _ in range(40)] == [playlist.next() for _ in range(40)]
+
+
+def test_journal_duplicated_insert(tmp_path) -> None:
+    """Testa se um registro com uma trilha duplicada é inválido no fim e no meio da playlist."""
+    journal = _journal(tmp_path)
+    playlist = journal.load()
+    playlist.add_many([Track("/music/a.mp3"), Track("/music/b.mp3")])
+    journal.close()
+    for index in (2, 1):
+        lines = (tmp_path / "playlist.journal").read_text(encoding="utf-8").splitlines()[:2]
+        lines.append('{"kind":"insert","index":%d,"tracks":[{"path":"/music/a.mp3"}]}' % index)
+        lines.append('{"kind":"insert","index":0,"tracks":[{"path":"/music/c.mp3"}]}')
+        (tmp_path / "playlist.journal").write_text("\n".join(lines) + "\n", encoding="utf-8")
+        journal = _journal(tmp_path)
+        assert _paths(journal.load()) == ["/music/a.mp3", "/music/b.mp3"]
+        journal.close()
@@ -0,0 +1,97 @@
+"""
+Esse módulo contém testes unitários da
+classe PlaylistLoader, do módulo playlist_loader.py,
+que carrega a Playlist salva em segundo plano.
+"""
+from pathlib import Path
+import pytest
+from src.core.playlist import Playlist
+from src.core.playlist_journal import PlaylistJournal
+from src.core.playlist_loader import PlaylistLoader, iter_json_snapshot
+from src.core.playlist_snapshot import write_json
+from src.core.track import Track
+from src.exceptions.playlist_exceptions import CorruptedPlaylistFileError
+
+
+def _write(tmp_path: Path, size: int, current_index: int, mode: str = "loop") -> Playlist:
+    playlist = Playlist()
+    playlist.add_many(Track(f"/music/{index}.mp3", duration=index + 0.5) for index in range(size))
+    playlist.current_index = current_index
+    playlist.mode = mode
+    write_json(playlist, tmp_path / "playlist.json")
+    return playlist
+
+
+def test_iter_json_snapshot(tmp_path) -> None:
+    """Testa a leitura incremental do JSON, com pedaços menores que os valores."""
+    playlist = _write(tmp_path, 50, 7)
+    events = list(iter_json_snapshot(tmp_path / "playlist.json", chunk_size=3))
+    assert ("mode", "loop") in events
+    assert ("current_index", 7) in events
+    records = [value for key, value in events if key == "track"]
+    assert records == [track.to_record() for track in playlist]
+    (tmp_path / "empty.json").write_text("", encoding="utf-8")
+    assert not list(iter_json_snapshot(tmp_path / "empty.json"))
+
+
+def test_loader(tmp_path) -> None:
+    """Testa o carregamento em segundo plano e o sinal de "pronta"."""
+    saved = _write(tmp_path, 2500, 1200, "one_repeat")
+    loader = PlaylistLoader(
+        tmp_path / "playlist.json", batch_size=100, ready_ahead=2, journal_path=None).start()
+    track = loader.wait_ready(timeout=10)
+    assert track is not None and str(track.path) == "/music/1200.mp3"
+    assert len(loader.playlist) >= 1203
+    assert loader.playlist[1202].duration == 1202.5
+    assert loader.wait_loaded(timeout=10)
+    assert len(loader.playlist) == 2500
+    assert loader.playlist.mode == "one_repeat"
+    assert loader.playlist.current_index == 1200
+    assert [str(t.path) for t in loader.playlist] == [str(t.path) for t in saved]
+
+
+def test_loader_errors(tmp_path) -> None:
+    """Testa se o erro de um arquivo corrompido chega em quem espera o carregamento."""
+    (tmp_path / "playlist.json").write_text(
+        '{"mode": "loop", "current_index": 0, "tracks": [{"path": "/a.mp3"}, {"pa',
+        encoding="utf-8"
+    )
+    loader = PlaylistLoader(tmp_path / "playlist.json", journal_path=None).start()
+    with pytest.raises(CorruptedPlaylistFileError):
+        loader.wait_loaded(timeout=10)
+    with pytest.raises(CorruptedPlaylistFileError):
+        list(iter_json_snapshot(tmp_path / "playlist.json"))
+
+
+def test_loader_replays_journal(tmp_path) -> None:
+    """Testa se as alterações no journal desde o snapshot são reaplicadas e registradas."""
+    journal = PlaylistJournal(tmp_path / "playlist.json", tmp_path / "playlist.journal")
+    playlist = journal.load()
+    playlist.add_many(Track(f"/music/{index}.mp3") for index in range(20))
+    assert journal.compact(wait=True)
+    playlist.pop(0)
+    playlist.move(0, 5)
+    playlist.mode = "shuffle"
+    playlist.next()
+    journal.close()
+
+    loader = PlaylistLoader(
+        tmp_path / "playlist.json", batch_size=5, journal_path=tmp_path / "playlist.journal").start()
+    assert loader.wait_loaded(timeout=10)
+    loaded = loader.playlist
+    assert [str(t.path) for t in loaded] == [str(t.path) for t in playlist]
+    assert loaded.mode == "shuffle"
+    assert loaded.shuffle_state() == playlist.shuffle_state()
+    loaded.pop(0)
+    loader.journal.close()
+    reloaded = PlaylistJournal(tmp_path / "playlist.json", tmp_path / "playlist.journal").load()
+    assert len(reloaded) == 18
+
+
+def test_loader_cancel_before_start(tmp_path) -> None:
+    """Testa cancelar um carregamento que ainda não começou."""
+    _write(tmp_path, 10, 0)
+    loader = PlaylistLoader(tmp_path / "playlist.json", journal_path=None)
+    loader.cancel()
+    assert loader.start().wait_loaded(timeout=1)
+    assert len(loader.playlist) == 0
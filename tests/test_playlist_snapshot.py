@@ -0,0 +1,120 @@
+"""
+Esse módulo contém testes unitários dos snapshots
+da Playlist, do módulo playlist_snapshot.py (o
+formato binário mapeado em memória e o JSON).
+"""
+from pathlib import Path
+import pytest
+from src.core import playlist_snapshot as snapshot
+from src.core.playlist import Playlist
+from src.core.playlist_snapshot import (
+    MappedTrackStore,
+    import_json,
+    load_binary,
+    write_binary,
+    write_json
+)
+from src.core.track import Track
+from src.exceptions.playlist_exceptions import CorruptedPlaylistFileError, TrackExistsError
+
+
+def _playlist() -> Playlist:
+    playlist = Playlist()
+    playlist.add_many([
+        Track(Path("/music/a.mp3"), title="Ação", duration=120.5),
+        Track("/music/b.mp3", "stream"),
+        Track(Path("/music/c.mp3"), title="C")
+    ])
+    playlist.move(0, 2)
+    playlist.next()
+    return playlist
+
+
+def test_binary_snapshot(tmp_path) -> None:
+    """Testa se o snapshot binário recupera as trilhas, a ordem e a trilha atual."""
+    playlist = _playlist()
+    write_binary(playlist, tmp_path / "playlist.bin")
+    loaded = load_binary(tmp_path / "playlist.bin")
+
+    assert len(loaded) == 3
+    assert loaded == playlist
+    assert [track.title for track in loaded] == [track.title for track in playlist]
+    assert [track.duration for track in loaded] == [track.duration for track in playlist]
+    assert loaded[0].source == "stream"
+    assert isinstance(loaded[2].path, Path)
+    assert loaded.get_current_track() == playlist.get_current_track()
+    assert loaded.get_all(in_original_pos=True) == playlist.get_all(in_original_pos=True)
+
+
+def test_binary_snapshot_shuffle(tmp_path) -> None:
+    """Testa se o snapshot binário mantém a ordem aleatória e a trilha atual do modo "shuffle"."""
+    playlist = Playlist("shuffle", shuffle_seed=3)
+    playlist.add_many(Track(f"/music/{index}.mp3") for index in range(20))
+    for _ in range(5):
+        playlist.next()
+    write_binary(playlist, tmp_path / "playlist.bin")
+    first, second = load_binary(tmp_path / "playlist.bin"), load_binary(tmp_path / "playlist.bin")
+    for loaded in (first, second):  # A mesma ordem a cada carregamento
+        assert loaded.mode == "shuffle" and loaded.current_index == playlist.current_index
+        assert loaded.shuffle_state() == playlist.shuffle_state()
+    expected = [playlist.next() for _ in range(30)]
+    assert [first.next() for _ in range(30)] == expected
+    assert [second.next() for _ in range(30)] == expected
+
+
+def test_binary_snapshot_version_1(tmp_path) -> None:
+    """Testa se um snapshot binário da versão 1 (sem a ordem aleatória) ainda é lido."""
+    playlist = _playlist()
+    write_binary(playlist, tmp_path / "playlist.bin")
+    data = (tmp_path / "playlist.bin").read_bytes()
+    # pylint: disable=protected-access
+    header, header_v1 = snapshot._HEADER, snapshot._HEADER_V1
+    fields = list(header.unpack_from(data, 0))
+    shift = header.size - header_v1.size
+    fields[1] = 1
+    fields[6:10] = [offset - shift for offset in fields[6:10]]  # Sources, linhas, ordem e heap
+    (tmp_path / "playlist.bin").write_bytes(header_v1.pack(*fields[:10]) + data[header.size:])
+    loaded = load_binary(tmp_path / "playlist.bin")
+    assert loaded == playlist and loaded.current_index == playlist.current_index
+
+
+def test_binary_snapshot_edits(tmp_path) -> None:
+    """Testa as edições numa playlist carregada de um snapshot binário."""
+    write_binary(_playlist(), tmp_path / "playlist.bin")
+    loaded = load_binary(tmp_path / "playlist.bin")
+
+    with pytest.raises(TrackExistsError):
+        loaded.add(Track(Path("/music/a.mp3")))
+    loaded.add(Track("/music/d.mp3"))
+    loaded.remove(Track("/music/b.mp3", "stream"))
+    assert [str(track.path) for track in loaded] == ["/music/c.mp3", "/music/a.mp3", "/music/d.mp3"]
+    assert loaded.get_by_id(loaded[2].id) == Track("/music/d.mp3")
+
+    write_binary(loaded, tmp_path / "playlist.bin")  # Regrava sobre o arquivo mapeado
+    assert load_binary(tmp_path / "playlist.bin") == loaded
+    loaded.clear()
+    assert loaded.is_empty() and not loaded.get_all(in_original_pos=True)
+
+
+def test_json_snapshot(tmp_path) -> None:
+    """Testa a exportação e a importação em JSON."""
+    playlist = _playlist()
+    playlist.mode = "one_repeat"
+    write_json(playlist, tmp_path / "playlist.json")
+    imported = import_json(tmp_path / "playlist.json")
+
+    # Em JSON, todos os paths voltam como `Path`
+    assert [str(track.path) for track in imported] == [str(track.path) for track in playlist]
+    assert [track.title for track in imported] == [track.title for track in playlist]
+    assert imported.mode == "one_repeat"
+    assert imported.current_index == playlist.current_index
+
+
+def test_corrupted_snapshot(tmp_path) -> None:
+    """Testa se arquivos inválidos geram CorruptedPlaylistFileError."""
+    (tmp_path / "playlist.bin").write_bytes(b"not a snapshot" * 10)
+    with pytest.raises(CorruptedPlaylistFileError):
+        MappedTrackStore(tmp_path / "playlist.bin")
+    (tmp_path / "playlist.json").write_text("{", encoding="utf-8")
+    with pytest.raises(CorruptedPlaylistFileError):
+        import_json(tmp_path / "playlist.json")
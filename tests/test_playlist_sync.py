@@ -0,0 +1,104 @@
+"""
+Esse módulo contém testes unitários da
+classe PlaylistSync, do módulo playlist_sync.py,
+que espelha a Playlist na playlist interna do mpv.
+"""
+from threading import Thread
+from typing import List
+from src.core.playlist import Playlist
+from src.core.playlist_sync import PlaylistSync
+from src.core.track import Track
+from tests.fake_mpv import FakeMpv
+
+
+def _paths(playlist: Playlist) -> List[str]:
+    return [str(track.path) for track in playlist]
+
+
+def test_sync_mirrors_edits() -> None:
+    """Testa se as edições da playlist chegam ao mpv sem recarregar a playlist."""
+    playlist = Playlist()
+    playlist.add_many(Track(f"/music/{index}.mp3") for index in range(5))
+    mpv = FakeMpv()
+    sync = PlaylistSync(mpv, playlist)
+    mpv.process()
+    assert mpv.entries == _paths(playlist)
+    assert sum(name == "loadlist" for name, *_ in mpv.commands) == 1
+    assert mpv.options == {"loop-file": "no", "loop-playlist": "inf"}
+
+    sync.play()
+    playlist.insert(0, Track("/music/first.mp3"))
+    playlist.add_many([Track("/music/a.mp3"), Track("relative/b.mp3")])
+    playlist.insert(3, Track("/music/middle.mp3"))
+    playlist.move(0, 4)
+    playlist.move(5, 1)
+    playlist.pop(2)
+    playlist.mode = "one_repeat"
+    mpv.commands.clear()
+    mpv.process()
+    assert mpv.entries == _paths(playlist)
+    assert mpv.playlist_pos == playlist.current_index
+    assert mpv.options["loop-file"] == "inf"
+    assert not any(name in ("stop", "playlist-play-index") for name, *_ in mpv.commands)
+
+    playlist.next(force_next=True)
+    mpv.process()
+    assert mpv.playlist_pos == playlist.current_index
+    playlist.clear()
+    mpv.process()
+    assert mpv.entries == []
+    sync.detach()
+
+
+def test_sync_follows_mpv_position() -> None:
+    """Testa se os avanços feitos pelo mpv voltam para a playlist."""
+    playlist = Playlist()
+    playlist.add_many(Track(f"/music/{index}.mp3") for index in range(4))
+    mpv = FakeMpv()
+    sync = PlaylistSync(mpv, playlist)
+    sync.play()
+    mpv.process()
+    changes = []
+    playlist.add_listener(changes.append)
+    mpv.advance()
+    assert playlist.current_index == 1
+    assert changes == [{"kind": "current", "index": 1}]
+    assert not mpv._replies  # Nenhum comando volta para o mpv
+
+    playlist.insert(0, Track("/music/new.mp3"))
+    mpv.advance()  # Observação com comandos pendentes: ignorada até as respostas
+    assert playlist.current_index == 2
+    mpv.process()
+    assert playlist.current_index == mpv.playlist_pos == 3
+    assert str(playlist.get_current_track().path) == mpv.entries[3]
+
+
+def test_sync_shuffle() -> None:
+    """Testa se, no modo "shuffle", o avanço do mpv segue a ordem aleatória."""
+    playlist = Playlist("shuffle", shuffle_seed=3)
+    playlist.add_many(Track(f"/music/{index}.mp3") for index in range(20))
+    mpv = FakeMpv()
+    sync = PlaylistSync(mpv, playlist)
+    sync.play()
+    mpv.process()
+    expected = playlist.get_next()[1]
+    mpv.advance()
+    mpv.process()
+    assert playlist.current_index == mpv.playlist_pos == expected
+
+
+def test_sync_position_takes_playlist_lock() -> None:
+    """Testa se a observação do mpv espera as edições feitas com `Playlist.lock`."""
+    playlist = Playlist()
+    playlist.add_many(Track(f"/music/{index}.mp3") for index in range(4))
+    mpv = FakeMpv()
+    sync = PlaylistSync(mpv, playlist)
+    sync.play()
+    mpv.process()
+    with playlist.lock:
+        observer = Thread(target=mpv.advance)  # Como a thread de eventos do mpv
+        observer.start()
+        observer.join(0.2)
+        assert observer.is_alive() and playlist.current_index == 0
+    observer.join(5)
+    assert playlist.current_index == 1
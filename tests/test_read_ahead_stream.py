@@ -0,0 +1,137 @@
+"""
+Esse módulo contém testes unitários da
+classe ReadAheadStream, do módulo read_ahead_stream.py,
+que lê a fonte de um stream adiante numa thread.
+"""
+import io
+import time
+from typing import Iterator
+import pytest
+from src.core.read_ahead_stream import ReadAheadStream
+
+DATA = bytes(range(256)) * 400  # 102400 bytes
+
+
+def _chunks(data: bytes, size: int) -> Iterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+def _read_all(stream: ReadAheadStream, size: int = 1000) -> bytes:
+    parts = []
+    while True:
+        part = stream.read(size)
+        if not part:
+            return b"".join(parts)
+        parts.append(part)
+
+
+def test_read_generator() -> None:
+    """Testa a leitura com pedaços da fonte maiores e menores que o buffer circular."""
+    for chunk_size in (7, 4096, len(DATA)):
+        stream = ReadAheadStream.from_generator(lambda size=chunk_size: _chunks(DATA, size),
+                                                budget=5000)
+        assert _read_all(stream, 999) == DATA
+        stream.close()
+
+
+def test_readinto() -> None:
+    """Testa a leitura direto num buffer (como o do mpv)."""
+    stream = ReadAheadStream.from_generator(lambda: _chunks(DATA, 3000), budget=4096)
+    buffer = bytearray(2048)
+    received = bytearray()
+    while True:
+        count = stream.readinto(memoryview(buffer))
+        if not count:
+            break
+        received += buffer[:count]
+    assert received == DATA
+    stream.close()
+
+
+def test_budget() -> None:
+    """Testa que a thread produtora não lê além do limite de bytes."""
+    produced = []
+
+    def generator() -> Iterator[bytes]:
+        for chunk in _chunks(DATA, 1000):
+            produced.append(len(chunk))
+            yield chunk
+
+    stream = ReadAheadStream.from_generator(generator, budget=4000)
+    time.sleep(0.05)
+    assert sum(produced) <= 5000  # O buffer cheio e o pedaço esperando espaço
+    stream.read(3000)
+    time.sleep(0.05)
+    assert 5000 < sum(produced) <= 8000
+    stream.close()
+
+
+def test_seek_file() -> None:
+    """Testa o seek para qualquer offset numa fonte que recomeça no offset."""
+    file = io.BytesIO(DATA)
+    stream = ReadAheadStream.from_file(file, budget=4096, chunk_size=1000)
+    assert stream.size == len(DATA)
+    assert stream.read(10) == DATA[:10]
+    assert stream.seek(50_000) == 50_000
+    assert stream.read(100) == DATA[50_000:50_100]
+    assert stream.seek(5) == 5
+    assert stream.read(100) == DATA[5:105]
+    assert _read_all(stream) == DATA[105:]
+    stream.close()
+    stream._thread.join(1)  # pylint: disable=protected-access
+    assert file.closed
+
+
+def test_seek_within_buffer() -> None:
+    """Testa que um seek para a frente, dentro do buffer, não recomeça a fonte."""
+    offsets = []
+
+    def source(offset: int) -> Iterator[bytes]:
+        offsets.append(offset)
+        return _chunks(DATA[offset:], 500)
+
+    stream = ReadAheadStream(source, len(DATA), budget=8192)
+    assert stream.read(100) == DATA[:100]
+    time.sleep(0.05)
+    stream.seek(3000)
+    assert stream.read(100) == DATA[3000:3100]
+    assert offsets == [0]
+    stream.seek(60_000)
+    assert stream.read(100) == DATA[60_000:60_100]
+    assert offsets == [0, 60_000]
+    stream.close()
+
+
+def test_seek_generator() -> None:
+    """Testa o seek num gerador: ele recomeça do início e os bytes até o offset são descartados."""
+    stream = ReadAheadStream.from_generator(lambda: _chunks(DATA, 777), budget=2048)
+    stream.read(100)
+    stream.seek(30_001)
+    assert stream.read(50) == DATA[30_001:30_051]
+    stream.seek(0)
+    assert _read_all(stream) == DATA
+    stream.close()
+
+
+def test_errors_and_cancel() -> None:
+    """Testa o erro da fonte (depois dos dados) e o cancelamento de uma leitura bloqueada."""
+    def failing() -> Iterator[bytes]:
+        yield b"abc"
+        raise OSError("falhou")
+
+    stream = ReadAheadStream.from_generator(failing)
+    assert stream.read(10) == b"abc"
+    with pytest.raises(OSError):
+        stream.read(10)
+    stream.close()
+
+    def slow() -> Iterator[bytes]:
+        time.sleep(0.2)
+        yield b"tarde"
+
+    stream = ReadAheadStream.from_generator(slow)
+    start = time.perf_counter()
+    stream.cancel()
+    assert stream.read(10) == b""
+    assert time.perf_counter() - start < 0.1
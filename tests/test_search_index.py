@@ -0,0 +1,72 @@
+"""
+Esse módulo contém testes unitários da
+classe SearchIndex, do módulo search_index.py,
+usada na busca de trilhas da Playlist.
+"""
+from pathlib import Path
+from src.core.playlist import Playlist
+from src.core.search_index import SearchIndex, fold
+from src.core.track import Track
+
+
+def _playlist() -> Playlist:
+    playlist = Playlist()
+    playlist.add_many([
+        Track(Path("/música/Chico/Construção.mp3"), title="Construção"),
+        Track(Path("/música/Ação/faixa_01.flac"), title="Abertura"),
+        Track(Path("/música/outros/ab.mp3"), title="Tabela periódica"),
+        Track(Path("/música/outros/xyz.ogg"), title="Sem nome")
+    ])
+    return playlist
+
+
+def test_fold() -> None:
+    """Testa a remoção de acentos e de caixa."""
+    assert fold("Ação É Ñandú") == "acao e nandu"
+    assert fold("STRASSE") == fold("straße")
+
+
+def test_search_folding_and_ranking() -> None:
+    """Testa a busca sem acentos e a ordem: título antes de path."""
+    playlist = _playlist()
+    index = SearchIndex(playlist)
+    assert len(index) == 4
+
+    assert [track.title for track in index.search("construcao")] == ["Construção"]
+    assert [track.title for track in index.search("ACAO")] == ["Abertura"]
+    # Termos curtos só valem no começo de palavras: "Abertura" e "ab.mp3", não "Tabela"
+    assert [track.title for track in index.search("ab")] == ["Abertura", "Tabela periódica"]
+    assert [track.title for track in index.search("abe")] == ["Abertura", "Tabela periódica"]
+    assert [track.title for track in index.search("xyz")] == ["Sem nome"]
+    assert [track.title for track in index.search("faixa flac")] == ["Abertura"]
+    assert not index.search("construcao flac")
+    assert index.search("outros", limit=1) == [playlist[2]]
+    assert not index.search("   ")
+
+
+def test_search_follows_playlist() -> None:
+    """Testa se o índice acompanha as edições da playlist."""
+    playlist = _playlist()
+    index = SearchIndex(playlist)
+
+    playlist.add(Track(Path("/música/novas/canção.mp3"), title="Canção nova"))
+    assert [track.title for track in index.search("cancao")] == ["Canção nova"]
+    playlist.remove(playlist[0])
+    assert not index.search("construcao")
+    playlist.move(0, 2)
+    assert len(index.search("musica")) == 4
+
+    index.detach()
+    playlist.add(Track(Path("/música/depois.mp3"), title="Depois"))
+    assert not index.search_ids("depois")
+    playlist.clear()
+    assert len(index) == 4
+
+    index = SearchIndex(playlist)
+    playlist.add_many(Track(f"/music/{number}.mp3", title=f"Faixa {number}") for number in range(3000))
+    for track in playlist.get_all()[:2900]:
+        playlist.remove(track)  # Força a reconstrução do índice
+    assert len(index) == 100
+    assert [track.title for track in index.search("faixa 2999")] == ["Faixa 2999"]
+    playlist.clear()
+    assert not len(index) and not index.search("faixa")
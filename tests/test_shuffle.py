@@ -0,0 +1,79 @@
+"""
+Esse módulo contém testes unitários da classe
+ShuffleOrder e do modo "shuffle" da Playlist.
+"""
+from src.core.shuffle import ShuffleOrder
+from src.core.playlist import Track, Playlist
+
+
+def test_shuffle_order() -> None:
+    """Testa se um ciclo passa por todas as chaves uma vez e se dá pra voltar."""
+    shuffle = ShuffleOrder(range(50), first=0, seed=7)
+    cycle = [shuffle.current()] + [shuffle.next() for _ in range(49)]
+    assert sorted(cycle) == list(range(50))
+    assert cycle != list(range(50))
+    assert shuffle.previous() == cycle[-2]
+    assert shuffle.next() == cycle[-1]
+    assert sorted(shuffle.next() for _ in range(50)) == list(range(50))  # Novo ciclo
+
+
+def test_shuffle_order_patch() -> None:
+    """Testa adicionar e remover chaves sem refazer a ordem."""
+    shuffle = ShuffleOrder(range(10), first=0, seed=1)
+    drawn = [shuffle.next() for _ in range(3)]
+    shuffle.discard(drawn[1])
+    shuffle.discard(9 if 9 not in drawn else 8)
+    shuffle.add(100)
+    assert shuffle.sorted_keys() == [0, drawn[0], drawn[2]]
+    rest = [shuffle.next() for _ in range(7)]
+    assert set(rest) | {0, drawn[0], drawn[2]} == (set(range(10)) | {100}) - {drawn[1], 9 if 9 not in drawn else 8}
+
+
+def test_playlist_shuffle_state() -> None:
+    """Testa o modo "shuffle" da Playlist e a restauração do estado salvo."""
+    tracks = [Track(f"/music/{i}.mp3") for i in range(20)]
+    playlist = Playlist("shuffle", shuffle_seed=3)
+    playlist.add_many(tracks)
+    played = [playlist.get_current_track()] + [playlist.next() for _ in range(5)]
+    assert len(set(map(str, played))) == 6
+    assert playlist.previous() == played[-2]
+    state = playlist.shuffle_state()
+
+    restored = Playlist()
+    restored.add_many(tracks)
+    restored.restore_shuffle(state)
+    assert restored.mode == "shuffle"
+    assert restored.get_current_track() == played[-2]
+    assert restored.next() == played[-1]
+    assert restored.previous() == played[-2]
+    assert len(restored.shuffle_state()["order"]) == len(state["order"])
+    assert [restored.next() for _ in range(30)] == [playlist.next() for _ in range(30)]
+
+
+def test_shuffle_state_keeps_upcoming() -> None:
+    """Testa se a ordem recriada do estado sorteia as mesmas próximas chaves, mesmo após um ciclo."""
+    shuffle = ShuffleOrder(range(30), first=0, seed=5)
+    for _ in range(4):
+        shuffle.next()
+    shuffle.discard(29 if 29 not in shuffle.sorted_keys() else 28)
+    state = shuffle.state()
+    restored = ShuffleOrder.from_state(
+        state["pool"], state["order"], state["cursor"], state["seed"], state["random_state"])
+    assert [restored.next() for _ in range(60)] == [shuffle.next() for _ in range(60)]
+
+
+def test_peek_keeps_cycle() -> None:
+    """Testa se espiar no fim do ciclo não começa um novo nem perde o histórico."""
+    shuffle = ShuffleOrder(range(5), first=0, seed=2)
+    cycle = [0] + [shuffle.next() for _ in range(4)]
+    upcoming = shuffle.peek_next()
+    assert shuffle.peek_next() == upcoming
+    assert shuffle.sorted_keys() == cycle
+    assert shuffle.current() == cycle[-1]
+    state = shuffle.state()
+    assert shuffle.previous() == cycle[-2]
+    assert shuffle.next() == cycle[-1]
+    restored = ShuffleOrder.from_state(
+        state["pool"], state["order"], state["cursor"], state["seed"], state["random_state"])
+    assert restored.next() == shuffle.next() == upcoming
+    assert shuffle.sorted_keys() == [upcoming]
@@ -0,0 +1,92 @@
+"""
+Esse módulo contém testes unitários da
+classe TrackStore, do módulo track_store.py,
+usada como armazenamento da Playlist.
+"""
+from pathlib import Path
+from src.core.playlist import Track, Playlist
+from src.core.track_store import TrackStore
+
+
+def test_views() -> None:
+    """Testa se as views reproduzem as trilhas armazenadas."""
+    store = TrackStore()
+    track = Track(Path("/music/album/01.flac"), title="Faixa", duration=12.5)
+    plain = Track("/music//album/02.flac")
+    track_id = track.id
+    row = store.put(track)
+    plain_row = store.put(plain)
+    assert track.id == track_id  # A trilha adicionada não é alterada
+    view = store.get(row)
+    assert view == track
+    assert isinstance(view.path, Path)
+    assert (view.title, view.duration) == ("Faixa", 12.5)
+    assert store.get_by_id(view.id) == row
+    assert store.get(plain_row).path == "/music//album/02.flac"
+    assert store.get(plain_row).duration is None
+    assert store.key_of(Track(Path("/music/album/01.flac"))) == row
+    assert store.key_of(Track("/music/album/01.flac")) is None  # Como na Track, `str` != `Path`
+    store.discard(row)
+    assert store.key_of(track) is None
+    assert store.get_by_id(view.id) is None
+    assert list(store.entries()) == [plain_row]
+    assert len(store) == 1
+
+
+def test_row_reuse() -> None:
+    """Testa se as linhas descartadas são reaproveitadas só quando nenhum estado as guarda."""
+    store = TrackStore()
+    rows = [store.put(Track(f"/music/{i}.mp3")) for i in range(3)]
+    old_id = store.get(rows[1]).id
+    store.discard(rows[1])
+    reused = store.put(Track("/music/3.mp3"))
+    assert reused == rows[1]
+    assert store.get_by_id(old_id) is None  # O id antigo não volta a valer
+    assert [store.get(row).path for row in store.entries()] == [
+        "/music/0.mp3", "/music/2.mp3", "/music/3.mp3"]
+    token = store.pin()
+    store.discard(rows[0])
+    assert store.put(Track("/music/4.mp3")) not in rows
+    assert store.get(rows[0]).path == "/music/0.mp3"  # Ainda legível pelo estado
+    store.unpin(token)
+    assert store.put(Track("/music/5.mp3")) == rows[0]
+    store.clear()
+    assert len(store) == 0 and list(store.entries()) == []
+    assert store.put(Track("/music/6.mp3")) == 0
+
+
+def test_compact_playlist() -> None:
+    """Testa a Playlist usando a TrackStore."""
+    playlist = Playlist(store=TrackStore())
+    tracks = [Track(f"/music/{i % 3}/{i}.mp3") for i in range(10)]
+    assert playlist.add_many(tracks + [Track("/music/0/0.mp3")]) == [Track("/music/0/0.mp3")]
+    assert playlist == tracks
+    assert Track("/music/1/4.mp3") in playlist
+    track_id = playlist[4].id
+    assert playlist.get_by_id(track_id) == tracks[4]
+    playlist.remove(tracks[4])
+    playlist.move(0, 8)
+    assert playlist.index(tracks[0]) == 8
+    assert playlist.get_by_id(track_id) is None
+    assert playlist.get_all(in_original_pos=True) == tracks[:4] + tracks[5:]
+    playlist.clear()
+    assert playlist.is_empty()
+    playlist.add_many(tracks)
+    assert playlist == tracks
+
+
+def test_snapshot_keeps_rows() -> None:
+    """Testa se um estado da playlist continua legível depois de as trilhas serem removidas."""
+    playlist = Playlist(store=TrackStore())
+    tracks = [Track(f"/music/{i}.mp3") for i in range(5)]
+    playlist.add_many(tracks)
+    state = playlist.snapshot()
+    playlist.clear()
+    playlist.add_many([Track(f"/other/{i}.mp3") for i in range(5)])
+    assert list(state) == tracks
+    playlist.restore(state)
+    assert playlist == tracks
+    del state
+    playlist.clear()
+    playlist.add(Track("/music/9.mp3"))
+    assert playlist.get_all(in_original_pos=True) == [Track("/music/9.mp3")]